@@ -1,18 +1,85 @@
+import re
+from functools import reduce
+from operator import add, or_
+
 import django_filters
 from django.contrib.auth.models import User
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import CharField, F, Func, Q, Value
+from django.db.models.functions import Greatest, Upper
+from rest_framework.filters import SearchFilter
 
 from assets.models import Asset
 
 
+class LowerFullName(Func):
+    """
+    lower(first_name || ' ' || last_name) in the "C" collation, written out
+    exactly as in the auth_user_full_name_prefix index so the planner can
+    use it for both prefix filters and ordering. Concat() would compile to
+    COALESCE() calls that no longer match.
+    """
+
+    arg_joiner = " || "
+    template = '(LOWER(%(expressions)s) COLLATE "C")'
+    output_field = CharField()
+
+    def __init__(self):
+        super().__init__(F("first_name"), Value(" "), F("last_name"))
+
+
+def fuzzy_search(queryset, fields, value):
+    """
+    Every word of value has to hit one of fields, either as a substring or as
+    a trigram word-similarity match; rows come back most similar first.
+    Both lookups run on UPPER(field) so they use the gin_trgm_ops indexes.
+    """
+    words = value.upper().split()
+    if not words:
+        return queryset
+
+    aliases = {f"{field}_upper": Upper(field) for field in fields}
+    queryset = queryset.alias(**aliases)
+
+    scores = []
+    for word in words:
+        queryset = queryset.filter(
+            reduce(
+                or_,
+                (
+                    Q(**{f"{alias}__contains": word})
+                    | Q(**{f"{alias}__trigram_word_similar": word})
+                    for alias in aliases
+                ),
+            )
+        )
+        similarities = [TrigramWordSimilarity(word, alias) for alias in aliases]
+        scores.append(
+            Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+        )
+
+    return queryset.annotate(similarity=reduce(add, scores)).order_by(
+        "-similarity", "-id"
+    )
+
+
 class AssetFilter(django_filters.FilterSet):
 
     category = django_filters.CharFilter(
         field_name="category__name", lookup_expr="iexact"
     )
+    serial_number = django_filters.CharFilter(method="filter_serial_number")
 
     class Meta:
         model = Asset
-        fields = ["category", "status"]
+        fields = ["category", "status", "serial_number"]
+
+    def filter_serial_number(self, queryset, name, value):
+        return fuzzy_search(queryset, ["serial_number"], value)
 
 
 class EmployeeFilter(django_filters.FilterSet):
@@ -25,7 +92,46 @@ class EmployeeFilter(django_filters.FilterSet):
     is_verified = django_filters.BooleanFilter(
         field_name="employee_profile__is_verified",
     )
+    name = django_filters.CharFilter(method="filter_name")
 
     class Meta:
         model = User
-        fields = ["department", "position", "is_verified"]
+        fields = ["department", "position", "is_verified", "name"]
+
+    def filter_name(self, queryset, name, value):
+        return fuzzy_search(queryset, ["first_name", "last_name", "username"], value)
+
+
+def build_search_query(terms):
+    # Every word becomes a prefix match ("sn99:*") so partial serial numbers
+    # and half-typed names still hit the GIN index.
+    words = [word for term in terms for word in re.findall(r"\w+", term)]
+    if not words:
+        return None
+    raw_query = " & ".join(f"{word}:*" for word in words)
+    return SearchQuery(raw_query, search_type="raw", config="english")
+
+
+def full_text_search(queryset, terms):
+    query = build_search_query(terms)
+    if query is None:
+        return queryset.none()
+
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(search_rank=SearchRank(F("search_vector"), query))
+        .order_by("-search_rank", "-id")
+    )
+
+
+class AssetFullTextSearchFilter(SearchFilter):
+    """
+    Drop-in replacement for SearchFilter on assets: matches ?search= against
+    the indexed Asset.search_vector and orders the results by rank.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+        return full_text_search(queryset, search_terms)
@@ -0,0 +1,464 @@
+import copy
+import json
+import statistics
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import date
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test.utils import (
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from assets.models import Asset, Category, Department
+from assets.query_budget import QueryRecorder, get_path_query_budget
+from assets.services.otp_services import store_otp
+from assets.services.seed_services import SEED_PASSWORD, seed_dataset
+from devassets_manager.celery import app as celery_app
+
+DEFAULT_SCALE = 10000
+DEFAULT_ITERATIONS = 20
+NEW_PASSWORD = "Benchmark-Passw0rd!2"
+
+# One entry per route and method of assets/urls.py. `user` is a key of the
+# context built by build_context(), kwargs and data are built from it.
+Endpoint = namedtuple(
+    "Endpoint", ["route", "method", "user", "kwargs", "data"], defaults=[None, None]
+)
+
+
+def asset_kwargs(ctx):
+    return {"id": ctx["asset"].id}
+
+
+def employee_kwargs(ctx):
+    return {"id": ctx["employee"].id}
+
+
+def asset_payload(ctx):
+    return {
+        "name": "Benchmark Laptop",
+        "serial_number": "BENCH-000001",
+        "category": ctx["category"].id,
+        "assigned_to": ctx["employee"].id,
+        "purchase_date": date.today().isoformat(),
+        "status": "IN_USE",
+        "notes": "Benchmark",
+    }
+
+
+def import_payload(ctx):
+    return [
+        {
+            "name": "Benchmark Monitor",
+            "serial_number": f"BENCH-IMPORT-{i:03d}",
+            "category": ctx["category"].id,
+            "purchase_date": date.today().isoformat(),
+        }
+        for i in range(50)
+    ]
+
+
+def employee_payload(ctx):
+    return {
+        "username": "benchmark-new-hire",
+        "first_name": "Bench",
+        "last_name": "Mark",
+        "email": "benchmark-new-hire@example.com",
+        "password": NEW_PASSWORD,
+        "department": ctx["department"].id,
+        "position": "Developer",
+        "is_verified": True,
+    }
+
+
+def onboard_payload(ctx):
+    return [
+        {
+            **employee_payload(ctx),
+            "username": f"benchmark-onboard-{i:03d}",
+            "email": f"benchmark-onboard-{i:03d}@example.com",
+        }
+        for i in range(5)
+    ]
+
+
+def employee_update_payload(ctx):
+    employee = ctx["employee"]
+    return {
+        "username": employee.username,
+        "first_name": employee.first_name,
+        "last_name": "Updated",
+        "email": employee.email,
+        "department": ctx["department"].id,
+        "position": "Team Lead",
+        "is_verified": True,
+    }
+
+
+ENDPOINTS = [
+    Endpoint("asset_list_create", "get", "employee"),
+    Endpoint("asset_list_create", "post", "admin", data=asset_payload),
+    Endpoint("asset_list_detail", "get", "employee", asset_kwargs),
+    Endpoint(
+        "asset_list_detail",
+        "patch",
+        "admin",
+        asset_kwargs,
+        lambda ctx: {"status": "REPAIR", "notes": "Benchmark"},
+    ),
+    Endpoint("asset_list_detail", "delete", "admin", asset_kwargs),
+    Endpoint("asset_export", "get", "employee"),
+    Endpoint("asset_import", "post", "admin", data=import_payload),
+    Endpoint(
+        "asset_bulk_reassign",
+        "post",
+        "admin",
+        data=lambda ctx: {
+            "asset_ids": ctx["reassign_ids"],
+            "assigned_to": ctx["employee"].id,
+        },
+    ),
+    Endpoint("inventory_stats", "get", "employee"),
+    Endpoint("employee_assets", "get", "admin", employee_kwargs),
+    Endpoint("employee_list_create", "get", "admin"),
+    Endpoint("employee_list_create", "post", "admin", data=employee_payload),
+    Endpoint("employee_onboard", "post", "admin", data=onboard_payload),
+    Endpoint("employee_details", "get", "admin", employee_kwargs),
+    Endpoint(
+        "employee_details", "put", "admin", employee_kwargs, employee_update_payload
+    ),
+    Endpoint("employee_details", "delete", "admin", employee_kwargs),
+    Endpoint("employee_side_details", "get", "employee", employee_kwargs),
+    Endpoint(
+        "employee_side_details",
+        "patch",
+        "employee",
+        employee_kwargs,
+        lambda ctx: {"first_name": "Benchmarked"},
+    ),
+    Endpoint("employee_assets_details", "get", "employee", employee_kwargs),
+    Endpoint("employee_dropdown", "get", "admin"),
+    Endpoint("category_dropdown", "get", "admin"),
+    Endpoint("department_dropdown", "get", "admin"),
+    Endpoint("form_bootstrap", "get", "admin"),
+    Endpoint("asset_history_list", "get", "employee"),
+    Endpoint("asset_history_timeline", "get", "employee", asset_kwargs),
+    Endpoint("employee_history_timeline", "get", "admin", employee_kwargs),
+    Endpoint("asset_holder_at", "get", "admin", asset_kwargs),
+    Endpoint("employee_assets_held_at", "get", "admin", employee_kwargs),
+    Endpoint("auth_employee_details", "get", "employee"),
+    Endpoint(
+        "change_password",
+        "post",
+        None,
+        data=lambda ctx: {"email": ctx["employee"].email},
+    ),
+    Endpoint(
+        "verify_otp",
+        "post",
+        None,
+        data=lambda ctx: {
+            "email": ctx["employee"].email,
+            "otp": store_otp(ctx["employee"].email),
+        },
+    ),
+    Endpoint(
+        "reset_password",
+        "post",
+        "employee",
+        data=lambda ctx: {"new_password": NEW_PASSWORD},
+    ),
+    Endpoint(
+        "change-password",
+        "post",
+        "employee",
+        data=lambda ctx: {
+            "current_password": SEED_PASSWORD,
+            "new_password": NEW_PASSWORD,
+        },
+    ),
+]
+
+
+def build_context():
+    admin = User.objects.filter(username="benchmark-admin").first()
+    if admin is None:
+        admin = User.objects.create_superuser(
+            username="benchmark-admin",
+            email="benchmark-admin@example.com",
+            password=SEED_PASSWORD,
+        )
+    # The employee holding the most assets, per-user endpoints at their worst
+    employee = (
+        User.objects.filter(employee_profile__isnull=False, is_superuser=False)
+        .annotate(asset_count=Count("assets"))
+        .order_by("-asset_count", "id")
+        .first()
+    )
+    return {
+        "admin": admin,
+        "employee": employee,
+        "asset": Asset.objects.filter(assigned_to=employee).order_by("id").first(),
+        "reassign_ids": list(
+            Asset.objects.exclude(assigned_to=employee)
+            .order_by("id")
+            .values_list("id", flat=True)[:100]
+        ),
+        "category": Category.objects.order_by("id").first(),
+        "department": Department.objects.order_by("id").first(),
+    }
+
+
+def clear_benchmark_cache():
+    # django-redis only deletes the keys under the benchmark KEY_PREFIX here,
+    # clear() would flush the whole Redis database
+    if hasattr(cache, "delete_pattern"):
+        cache.delete_pattern("*")
+    else:
+        cache.clear()
+
+
+def send(client, endpoint, url, data):
+    response = getattr(client, endpoint.method)(url, data, format="json")
+    if response.streaming:
+        b"".join(response.streaming_content)
+    return response
+
+
+def percentile(samples, percent):
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[percent - 1]
+
+
+def endpoint_url(endpoint, ctx):
+    return reverse(
+        endpoint.route, kwargs=endpoint.kwargs(ctx) if endpoint.kwargs else None
+    )
+
+
+def call_endpoint(client, endpoint, ctx, url):
+    """
+    Send one request inside a rolled-back transaction, so every call sees
+    the same dataset. Returns the response, its latency and the queries.
+    """
+    data = endpoint.data(ctx) if endpoint.data else None
+    # A fresh instance each time, password views mutate request.user
+    user = ctx[endpoint.user] if endpoint.user else None
+    client.force_authenticate(user=User.objects.get(pk=user.pk) if user else None)
+
+    recorder = QueryRecorder()
+    with transaction.atomic(), connection.execute_wrapper(recorder):
+        start = time.perf_counter()
+        response = send(client, endpoint, url, data)
+        elapsed = time.perf_counter() - start
+        transaction.set_rollback(True)
+    return response, elapsed, recorder
+
+
+def measure_endpoint(client, endpoint, ctx, iterations, warm):
+    url = endpoint_url(endpoint, ctx)
+
+    def run_once():
+        return call_endpoint(client, endpoint, ctx, url)
+
+    if warm:
+        run_once()
+
+    latencies, query_counts, sql_times = [], [], []
+    for _ in range(iterations):
+        if not warm:
+            clear_benchmark_cache()
+        response, elapsed, recorder = run_once()
+        latencies.append(elapsed * 1000)
+        query_counts.append(recorder.count)
+        sql_times.append(recorder.seconds * 1000)
+
+    # tracemalloc slows Python down a lot, so memory gets its own extra run
+    if not warm:
+        clear_benchmark_cache()
+    tracemalloc.start()
+    try:
+        run_once()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "route": endpoint.route,
+        "method": endpoint.method.upper(),
+        "path": url,
+        "status": response.status_code,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "queries": max(query_counts),
+        "query_budget": get_path_query_budget(url, endpoint.method),
+        "sql_ms": round(statistics.median(sql_times), 2),
+        "peak_memory_kb": round(peak_memory / 1024, 1),
+    }
+
+
+def run_benchmark(iterations=DEFAULT_ITERATIONS, warm=False, endpoints=ENDPOINTS):
+    """Drive every endpoint against the dataset already in the database."""
+    ctx = build_context()
+    client = APIClient()
+    return [
+        measure_endpoint(client, endpoint, ctx, iterations, warm)
+        for endpoint in endpoints
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database at one or more scales and report p50/p95 "
+        "latency, query count, SQL time and peak memory for every API route."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=int,
+            action="append",
+            help=f"Number of assets to seed, repeatable (default {DEFAULT_SCALE}).",
+        )
+        parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+        parser.add_argument(
+            "--warm",
+            action="store_true",
+            help="Measure with a primed cache instead of a cleared one.",
+        )
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            help="Only run routes whose name contains this, repeatable.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep the benchmark database and reuse a dataset of the same scale.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", help="Where to write the JSON results.")
+        parser.add_argument("--compare", help="Earlier JSON results to diff against.")
+
+    def handle(self, *args, **options):
+        scales = options["scale"] or [DEFAULT_SCALE]
+        endpoints = [
+            endpoint
+            for endpoint in ENDPOINTS
+            if not options["endpoint"]
+            or any(name in endpoint.route for name in options["endpoint"])
+        ]
+        if not endpoints:
+            raise CommandError("No route matches --endpoint.")
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1.")
+        baseline = None
+        if options["compare"]:
+            with open(options["compare"]) as baseline_file:
+                baseline = json.load(baseline_file)
+
+        # Emails go to the locmem backend, Celery tasks run inline
+        setup_test_environment()
+        celery_app.conf.task_always_eager = True
+        test_settings = connection.settings_dict.setdefault("TEST", {})
+        test_settings["NAME"] = f"benchmark_{connection.settings_dict['NAME']}"
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, keepdb=options["keepdb"]
+        )
+
+        caches = copy.deepcopy(settings.CACHES)
+        caches["default"]["KEY_PREFIX"] = "benchmark"
+        runs = []
+        try:
+            with override_settings(CACHES=caches):
+                for scale in scales:
+                    runs.append(self.run_scale(scale, endpoints, options))
+        finally:
+            connection.creation.destroy_test_db(
+                old_name, verbosity=0, keepdb=options["keepdb"]
+            )
+            teardown_test_environment()
+
+        report = {
+            "created_at": timezone.now().isoformat(),
+            "iterations": options["iterations"],
+            "cache": "warm" if options["warm"] else "cold",
+            "debug": settings.DEBUG,
+            "runs": runs,
+        }
+        output = options["output"] or (
+            f"benchmark-{timezone.now().strftime('%Y%m%d-%H%M%S')}.json"
+        )
+        with open(output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {output}"))
+
+        if baseline:
+            self.write_comparison(baseline, report)
+
+    def run_scale(self, scale, endpoints, options):
+        if options["keepdb"] and Asset.objects.count() == scale:
+            self.stdout.write(f"Reusing the dataset at scale {scale}")
+        else:
+            self.stdout.write(f"Seeding scale {scale}...")
+            call_command("flush", interactive=False, verbosity=0)
+            seed_dataset(scale, seed=options["seed"], analyze=True)
+
+        results = run_benchmark(options["iterations"], options["warm"], endpoints)
+
+        self.stdout.write(f"\nscale={scale}")
+        self.stdout.write(
+            f"  {'endpoint':<32} {'status':>6} {'p50 ms':>9} {'p95 ms':>9} "
+            f"{'queries':>9} {'sql ms':>9} {'peak KB':>10}"
+        )
+        for result in results:
+            budget = result["query_budget"]
+            queries = f"{result['queries']}/{budget if budget is not None else '-'}"
+            if budget is not None and result["queries"] > budget:
+                queries = self.style.ERROR(f"{queries:>9}")
+            self.stdout.write(
+                f"  {result['method'] + ' ' + result['route']:<32} "
+                f"{result['status']:>6} {result['p50_ms']:>9.2f} "
+                f"{result['p95_ms']:>9.2f} {queries:>9} "
+                f"{result['sql_ms']:>9.2f} {result['peak_memory_kb']:>10.1f}"
+            )
+        return {"scale": scale, "endpoints": results}
+
+    def write_comparison(self, baseline, report):
+        before = {
+            (run["scale"], result["method"], result["route"]): result
+            for run in baseline["runs"]
+            for result in run["endpoints"]
+        }
+        self.stdout.write("\nChange against the baseline (p50, queries)")
+        for run in report["runs"]:
+            for result in run["endpoints"]:
+                old = before.get((run["scale"], result["method"], result["route"]))
+                if not old:
+                    continue
+                change = (
+                    (result["p50_ms"] - old["p50_ms"]) / old["p50_ms"] * 100
+                    if old["p50_ms"]
+                    else 0.0
+                )
+                self.stdout.write(
+                    f"  scale={run['scale']:<8} "
+                    f"{result['method'] + ' ' + result['route']:<32} "
+                    f"p50 {change:+7.1f}%  "
+                    f"queries {old['queries']} -> {result['queries']}"
+                )
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from assets.services.custody_services import (
+    find_custody_drift,
+    rebuild_custody_periods,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the AssetCustody periods from the asset history, or check them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare stored periods with a replay of the history, "
+            "exit 1 on drift.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            drift = find_custody_drift()
+            if not any(drift.values()):
+                self.stdout.write(self.style.SUCCESS("Custody periods are in sync."))
+                return
+
+            raise CommandError(
+                f"Custody periods drifted: {drift['extra']} stored periods "
+                f"missing from the history, {drift['missing']} history periods "
+                "not stored."
+            )
+
+        count = rebuild_custody_periods()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} custody periods."))
@@ -0,0 +1,84 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from assets.services.seed_services import (
+    GENERATE_BATCH_SIZE,
+    SEED_PASSWORD,
+    generate_dataset,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large, realistic dataset of employees, assets and asset "
+        "history with PostgreSQL COPY. The same arguments, --as-of included, "
+        "produce the same rows apart from their ids."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--employees",
+            type=int,
+            default=100_000,
+            help="Users with an employee profile (default: 100000).",
+        )
+        parser.add_argument(
+            "--assets", type=int, default=1_000_000, help="Default: 1000000."
+        )
+        parser.add_argument(
+            "--history",
+            type=float,
+            default=3,
+            help="Average custody changes per asset, 0 for no history (default: 3).",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--prefix",
+            default="gen",
+            help="Username and serial number prefix, use a new one to add to "
+            "an already generated dataset (default: gen).",
+        )
+        parser.add_argument(
+            "--as-of",
+            type=date.fromisoformat,
+            help="Date the generated history runs up to, YYYY-MM-DD "
+            "(default: today).",
+        )
+        parser.add_argument(
+            "--no-analyze",
+            action="store_false",
+            dest="analyze",
+            help="Leave the filled tables unanalyzed.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=GENERATE_BATCH_SIZE, help="Rows per COPY."
+        )
+
+    def handle(self, *args, **options):
+        if options["employees"] < 0 or options["assets"] < 0:
+            raise CommandError("--employees and --assets cannot be negative.")
+        if options["history"] < 0:
+            raise CommandError("--history cannot be negative.")
+
+        start = time.perf_counter()
+        sizes = generate_dataset(
+            options["employees"],
+            options["assets"],
+            history=options["history"],
+            seed=options["seed"],
+            prefix=options["prefix"],
+            as_of=options["as_of"],
+            analyze=options["analyze"],
+            batch_size=options["batch_size"],
+        )
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {sizes['employees']} employees, {sizes['assets']} "
+                f"assets and {sizes['history']} history rows in {elapsed:.1f}s."
+            )
+        )
+        self.stdout.write(f"Every generated user's password is {SEED_PASSWORD!r}.")
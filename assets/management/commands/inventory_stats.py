@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from assets.services.stats_services import (
+    find_inventory_stats_drift,
+    rebuild_inventory_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the InventoryStat summary table, or check it for drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare stored counts with the asset table, exit 1 on drift.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            drift = find_inventory_stats_drift()
+            if not drift:
+                self.stdout.write(self.style.SUCCESS("Inventory stats are in sync."))
+                return
+
+            for (status, category_id, department_id), (stored, actual) in sorted(
+                drift.items(), key=str
+            ):
+                self.stdout.write(
+                    f"status={status} category={category_id} "
+                    f"department={department_id}: stored={stored} actual={actual}"
+                )
+            raise CommandError(f"{len(drift)} inventory stat buckets drifted.")
+
+        buckets = rebuild_inventory_stats()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt inventory stats: {len(buckets)} buckets.")
+        )
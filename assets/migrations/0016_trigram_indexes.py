@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:25
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+EMPLOYEE_NAME_COLUMNS = ["first_name", "last_name", "username"]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0015_asset_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="asset",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("serial_number"),
+                    name="gin_trgm_ops",
+                ),
+                name="asset_serial_number_trgm_gin",
+            ),
+        ),
+        # auth_user belongs to django.contrib.auth, so its indexes are raw SQL
+        *[
+            migrations.RunSQL(
+                sql=(
+                    f"CREATE INDEX auth_user_{column}_trgm_gin "
+                    f"ON auth_user USING gin (UPPER({column}) gin_trgm_ops);"
+                ),
+                reverse_sql=f"DROP INDEX IF EXISTS auth_user_{column}_trgm_gin;",
+            )
+            for column in EMPLOYEE_NAME_COLUMNS
+        ],
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0016_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InventoryStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("IN_USE", "In Use"),
+                            ("IN_STORAGE", "In Storage"),
+                            ("REPAIR", "Under Repair"),
+                            ("RETIRED", "Retired"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="assets.category",
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="assets.department",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("status", "category", "department"),
+                        name="unique_inventory_stat_bucket",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+    ]
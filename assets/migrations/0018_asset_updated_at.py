@@ -0,0 +1,22 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0017_inventorystat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="asset",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-18 02:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0018_asset_updated_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assethistory",
+            index=models.Index(
+                fields=["asset", "-change_date", "-id"],
+                name="asset_history_asset_timeline",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="assethistory",
+            index=models.Index(
+                fields=["new_user", "-change_date", "-id"],
+                name="asset_history_user_timeline",
+            ),
+        ),
+    ]
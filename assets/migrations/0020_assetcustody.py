@@ -0,0 +1,86 @@
+# Generated by Django 5.2.4 on 2026-10-18 02:48
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+# Same replay as assets.services.custody_services.CUSTODY_FROM_HISTORY_SQL
+BACKFILL_SQL = """
+    INSERT INTO assets_assetcustody (asset_id, user_id, period)
+    SELECT asset_id, new_user_id, tstzrange(change_date, next_change_date, '[)')
+    FROM (
+        SELECT
+            asset_id,
+            new_user_id,
+            change_date,
+            LEAD(change_date) OVER (
+                PARTITION BY asset_id ORDER BY change_date, id
+            ) AS next_change_date
+        FROM assets_assethistory
+    ) AS changes
+    WHERE new_user_id IS NOT NULL
+      AND (next_change_date IS NULL OR next_change_date > change_date);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0019_asset_history_timeline_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Lets the GiST indexes include the plain integer FK columns
+        BtreeGistExtension(),
+        migrations.CreateModel(
+            name="AssetCustody",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("period", django.contrib.postgres.fields.ranges.DateTimeRangeField()),
+                (
+                    "asset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="custody_periods",
+                        to="assets.asset",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="custody_periods",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    django.contrib.postgres.indexes.GistIndex(
+                        fields=["user", "period"], name="asset_custody_user_gist"
+                    )
+                ],
+                "constraints": [
+                    django.contrib.postgres.constraints.ExclusionConstraint(
+                        expressions=[("asset", "="), ("period", "&&")],
+                        name="asset_custody_no_overlap",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-18 09:12
+
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0020_assetcustody"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Prefix lookups of the employee typeahead, see assets.filters.LowerFullName.
+        # text_pattern_ops lets LIKE 'prefix%' use the index whatever the
+        # database collation. auth_user belongs to django.contrib.auth, so
+        # the index is raw SQL
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX auth_user_full_name_prefix ON auth_user "
+                "((LOWER(first_name || ' ' || last_name)) text_pattern_ops);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS auth_user_full_name_prefix;",
+        ),
+    ]
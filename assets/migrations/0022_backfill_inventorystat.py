@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:05
+
+from django.db import migrations
+
+# Same buckets as assets.services.stats_services.asset_buckets(). 0017 left
+# the table empty, any count applied since then is replaced
+BACKFILL_SQL = """
+    DELETE FROM assets_inventorystat;
+    INSERT INTO assets_inventorystat (status, category_id, department_id, count)
+    SELECT asset.status, asset.category_id, profile.department_id, COUNT(*)
+    FROM assets_asset AS asset
+    LEFT JOIN assets_employeeprofile AS profile
+      ON profile.user_id = asset.assigned_to_id
+    GROUP BY asset.status, asset.category_id, profile.department_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0021_auth_user_full_name_prefix"),
+    ]
+
+    operations = [
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
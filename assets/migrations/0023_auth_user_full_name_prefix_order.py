@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0022_backfill_inventorystat"),
+    ]
+
+    operations = [
+        # The text_pattern_ops index served prefix filters but not ORDER BY,
+        # the typeahead sorted every match before its LIMIT. In the "C"
+        # collation one btree on (full name, id) serves both, and LIKE
+        # 'prefix%' still turns into a range scan
+        migrations.RunSQL(
+            sql=[
+                "DROP INDEX IF EXISTS auth_user_full_name_prefix;",
+                "CREATE INDEX auth_user_full_name_prefix ON auth_user "
+                "((LOWER(first_name || ' ' || last_name) COLLATE \"C\"), id);",
+            ],
+            reverse_sql=[
+                "DROP INDEX IF EXISTS auth_user_full_name_prefix;",
+                "CREATE INDEX auth_user_full_name_prefix ON auth_user "
+                "((LOWER(first_name || ' ' || last_name)) text_pattern_ops);",
+            ],
+        ),
+    ]
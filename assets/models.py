@@ -1,5 +1,10 @@
 from django.contrib.auth.models import User
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField, RangeOperators
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class Department(models.Model):
@@ -34,6 +39,12 @@ class EmployeeProfile(models.Model):
     is_verified = models.BooleanField(default=False)
 
 
+class AssetManager(models.Manager):
+    def get_queryset(self):
+        # search_vector is only used in WHERE/ORDER BY, never worth loading
+        return super().get_queryset().defer("search_vector")
+
+
 # Asset model
 class Asset(models.Model):
     STATUS_CHOICES = [
@@ -59,6 +70,29 @@ class Asset(models.Model):
         max_length=20, choices=STATUS_CHOICES, default="IN_STORAGE"
     )
     description = models.TextField(blank=True)
+    # Row version, used as the ETag of the asset detail endpoint
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Computed by Postgres on every INSERT/UPDATE, so bulk writes stay in sync
+    search_vector = models.GeneratedField(
+        expression=SearchVector("name", "serial_number", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = AssetManager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="asset_search_vector_gin"),
+            # UPPER() matches what icontains compiles to, so one index serves
+            # both substring and trigram similarity lookups
+            GinIndex(
+                OpClass(Upper("serial_number"), name="gin_trgm_ops"),
+                name="asset_serial_number_trgm_gin",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.serial_number})"
@@ -76,7 +110,89 @@ class AssetHistory(models.Model):
     change_date = models.DateTimeField(auto_now_add=True)
     notes = models.TextField(blank=True)
 
+    class Meta:
+        indexes = [
+            # Per-asset and per-employee timelines, newest first, id breaks
+            # ties so the keyset paginator never sorts
+            models.Index(
+                fields=["asset", "-change_date", "-id"],
+                name="asset_history_asset_timeline",
+            ),
+            models.Index(
+                fields=["new_user", "-change_date", "-id"],
+                name="asset_history_user_timeline",
+            ),
+        ]
+
     def __str__(self):
         return (
             f"{self.asset.name} reassigned on {self.change_date.strftime('%Y-%m-%d')}"
         )
+
+
+# One row per period an employee held an asset, [assigned, handed over),
+# open-ended while they still hold it. Derived from AssetHistory and kept in
+# step with it by assets/services/custody_services.py
+class AssetCustody(models.Model):
+    # btree_gist has no int4 = int8 operator, so the GiST index cannot serve
+    # "asset_id = <int literal>": the bigint asset_id keeps its btree index,
+    # the integer user_id is served by the (user, period) GiST index
+    asset = models.ForeignKey(
+        Asset, on_delete=models.CASCADE, related_name="custody_periods"
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="custody_periods", db_index=False
+    )
+    period = DateTimeRangeField()
+
+    class Meta:
+        constraints = [
+            ExclusionConstraint(
+                name="asset_custody_no_overlap",
+                expressions=[
+                    ("asset", RangeOperators.EQUAL),
+                    ("period", RangeOperators.OVERLAPS),
+                ],
+            )
+        ]
+        indexes = [GistIndex(fields=["user", "period"], name="asset_custody_user_gist")]
+
+    def __str__(self):
+        return f"{self.asset_id} held by {self.user_id} during {self.period}"
+
+
+# Asset counts per status x category x assignee department, kept up to date
+# by the asset write paths (see assets/services/stats_services.py)
+class InventoryStat(models.Model):
+    status = models.CharField(max_length=20, choices=Asset.STATUS_CHOICES)
+    # No FK constraints: a deleted category/department must not cascade here,
+    # its counts are moved to the NULL bucket by the delete receivers instead
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        db_constraint=False,
+        related_name="+",
+    )
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        db_constraint=False,
+        related_name="+",
+    )
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["status", "category", "department"],
+                name="unique_inventory_stat_bucket",
+                nulls_distinct=False,
+            )
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.status} / {self.category_id} / {self.department_id}: {self.count}"
+        )
@@ -0,0 +1,64 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    # "-id" is unique and indexed, so every page is a "WHERE id < cursor" seek
+    # instead of an OFFSET scan, and no COUNT(*) is run.
+    ordering = "-id"
+
+
+class OptionalCursorPagination(PageNumberPagination):
+    """
+    Page number pagination by default, keyset pagination when the client
+    opts in with ?pagination=cursor (the next/previous links keep the flag).
+    """
+
+    mode_query_param = "pagination"
+    cursor_mode = "cursor"
+    cursor_pagination_class = KeysetCursorPagination
+
+    cursor_paginator = None
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == self.cursor_mode
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.use_cursor(request):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.cursor_paginator = self.cursor_pagination_class()
+        self.cursor_paginator.page_size = int(self.page_size)
+        return self.cursor_paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to 'cursor' to use keyset pagination.",
+                "schema": {"type": "string", "enum": [self.cursor_mode]},
+            },
+            {
+                "name": self.cursor_pagination_class.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(
+                    self.cursor_pagination_class.cursor_query_description
+                ),
+                "schema": {"type": "string"},
+            },
+        ]
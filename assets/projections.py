@@ -0,0 +1,44 @@
+from rest_framework.response import Response
+
+
+class ValuesProjectionMixin:
+    """
+    Read-only fast path for a list serializer: rows are fetched flat with
+    values(), related columns included, and project_row() maps each one to
+    the exact JSON shape of to_representation() without building model
+    instances or calling SerializerMethodField getters.
+
+    projection_fields must include "id", the keyset cursor reads it.
+    """
+
+    projection_fields = ()
+
+    @classmethod
+    def project_queryset(cls, queryset):
+        # values() ignores select_related, but prefetching onto dicts fails
+        return queryset.prefetch_related(None).values(*cls.projection_fields)
+
+    @classmethod
+    def project_row(cls, row):
+        raise NotImplementedError
+
+
+class ProjectedListMixin:
+    """
+    ListModelMixin.list() on top of the serializer's values() projection.
+    Filtering, ordering and both pagination modes work unchanged, the
+    paginators get dicts instead of instances.
+    """
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.get_serializer_class()
+        queryset = serializer_class.project_queryset(
+            self.filter_queryset(self.get_queryset())
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                [serializer_class.project_row(row) for row in page]
+            )
+        return Response([serializer_class.project_row(row) for row in queryset])
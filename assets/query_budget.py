@@ -0,0 +1,65 @@
+import time
+
+from django.urls import resolve
+
+# Emitted by nested transaction.atomic() blocks, not by the view's data access
+TRANSACTION_CONTROL = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def query_budget(budget):
+    """
+    Declare the query budget of a function view. Class views set a
+    `query_budget` attribute instead.
+
+    A budget is the most SQL queries one request may run, whatever the size
+    of the dataset: an int for every method, or a {"GET": 2, "POST": 7} dict.
+    Authentication is not counted, tests authenticate with force_authenticate.
+    """
+
+    def decorator(view_func):
+        view_func.query_budget = budget
+        return view_func
+
+    return decorator
+
+
+def get_query_budget(view, method):
+    # as_view() functions point back to their class through view_class
+    budget = getattr(getattr(view, "view_class", view), "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get(method.upper())
+    return budget
+
+
+def get_path_query_budget(path, method):
+    return get_query_budget(resolve(path).func, method)
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrapper() hook that counts, times and keeps every
+    query, savepoints excluded.
+    """
+
+    def __init__(self):
+        self.queries = []
+        self.seconds = 0.0
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            if not sql.lstrip().upper().startswith(TRANSACTION_CONTROL):
+                self.queries.append((sql, params))
+
+    def format_queries(self):
+        return "\n".join(
+            f"  {number}. {sql} -- params: {params}"
+            for number, (sql, params) in enumerate(self.queries, start=1)
+        )
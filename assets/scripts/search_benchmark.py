@@ -0,0 +1,58 @@
+import statistics
+import time
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+
+from assets.filters import full_text_search
+from assets.models import Asset
+
+# python manage.py runscript search_benchmark --script-args dell "sn 12" monitor
+DEFAULT_TERMS = ["dell", "laptop", "sn12"]
+SEARCH_FIELDS = ["name", "serial_number", "description"]
+REPEAT = 20
+PAGE_SIZE = 5
+
+
+def ilike_search(queryset, terms):
+    # Same WHERE clause DRF's SearchFilter builds for search_fields
+    for term in terms:
+        queryset = queryset.filter(
+            reduce(or_, (Q(**{f"{field}__icontains": term}) for field in SEARCH_FIELDS))
+        )
+    return queryset.order_by("-id")
+
+
+def time_queryset(queryset):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        count = queryset.count()
+        list(queryset[:PAGE_SIZE])
+        timings.append((time.perf_counter() - start) * 1000)
+    return count, timings
+
+
+def report(label, queryset):
+    count, timings = time_queryset(queryset)
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"  {label:<6} rows={count:<8} "
+        f"median={statistics.median(timings):8.2f}ms p95={p95:8.2f}ms"
+    )
+    plan = queryset[:PAGE_SIZE].explain(analyze=True).splitlines()
+    print(f"         plan: {plan[0].strip()}")
+
+
+def run(*args):
+    terms = list(args) or DEFAULT_TERMS
+    queryset = Asset.objects.select_related("category", "assigned_to")
+    print(f"Assets in table: {Asset.objects.count()}")
+
+    for term in terms:
+        search_terms = term.split()
+        print(f"\nsearch={term!r}")
+        report("ILIKE", ilike_search(queryset, search_terms))
+        report("FTS", full_text_search(queryset, search_terms))
@@ -0,0 +1,135 @@
+import statistics
+import time
+from datetime import date
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from assets.models import Asset, AssetHistory, Category, Department, EmployeeProfile
+from assets.serializers.asset_serializer import (
+    AssetHistorySerializer,
+    AssetListSerializer,
+)
+from assets.serializers.employee_serializer import EmployeeListSerializer
+
+# python manage.py runscript serialization_benchmark --script-args 10000
+DEFAULT_ROWS = 10000
+REPEAT = 5
+
+
+class RollbackError(Exception):
+    """Raised to undo the seeded rows once the report is printed."""
+
+
+def seed(rows):
+    """Top every table up to `rows` rows, inside the caller's transaction."""
+    department = Department.objects.create(name="bench", full_name="Benchmark")
+    category = Category.objects.create(name="bench-category")
+
+    missing_users = max(rows - User.objects.count(), 0)
+    users = User.objects.bulk_create(
+        User(username=f"bench-user-{i}", first_name="Bench", last_name=str(i))
+        for i in range(missing_users)
+    )
+    EmployeeProfile.objects.bulk_create(
+        EmployeeProfile(user=user, department=department, position="Tester")
+        for user in users
+    )
+
+    user_ids = list(User.objects.values_list("id", flat=True)[:rows])
+    missing_assets = max(rows - Asset.objects.count(), 0)
+    Asset.objects.bulk_create(
+        Asset(
+            name=f"Bench asset {i}",
+            serial_number=f"BENCH-{i:07d}",
+            category=category,
+            assigned_to_id=user_ids[i % len(user_ids)],
+            purchase_date=date(2024, 1, 1),
+            status="IN_USE",
+            description="Seeded by serialization_benchmark",
+        )
+        for i in range(missing_assets)
+    )
+
+    missing_history = max(rows - AssetHistory.objects.count(), 0)
+    AssetHistory.objects.bulk_create(
+        AssetHistory(asset_id=asset_id, new_user_id=user_id, notes="bench")
+        for asset_id, user_id in Asset.objects.values_list("id", "assigned_to_id")[
+            :missing_history
+        ]
+    )
+
+
+def time_path(render):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        body = render()
+        timings.append(time.perf_counter() - start)
+    return body, statistics.median(timings)
+
+
+def report(label, serializer_class, queryset, rows):
+    queryset = queryset.order_by("-id")[:rows]
+    renderer = JSONRenderer()
+
+    orm_body, orm_time = time_path(
+        # .all() every run: a reused queryset would serve cached instances
+        lambda: renderer.render(serializer_class(queryset.all(), many=True).data)
+    )
+    projected_body, projected_time = time_path(
+        lambda: renderer.render(
+            [
+                serializer_class.project_row(row)
+                for row in serializer_class.project_queryset(queryset.all())
+            ]
+        )
+    )
+
+    count = queryset.count()
+    print(
+        f"  {label:<10} rows={count:<8} "
+        f"serializer={count / orm_time:10.0f} rows/s  "
+        f"values()={count / projected_time:10.0f} rows/s  "
+        f"x{orm_time / projected_time:.1f}  "
+        f"identical={orm_body == projected_body}"
+    )
+
+
+def run(*args):
+    rows = int(args[0]) if args else DEFAULT_ROWS
+    print(f"Median of {REPEAT} runs, {rows} rows per endpoint")
+    if settings.DEBUG:
+        print("  DEBUG is on: every query is logged, timings are inflated")
+
+    # Seeded rows are rolled back, the benchmark leaves the database as it was
+    try:
+        with transaction.atomic():
+            seed(rows)
+            report(
+                "assets",
+                AssetListSerializer,
+                Asset.objects.select_related("category", "assigned_to"),
+                rows,
+            )
+            report(
+                "employees",
+                EmployeeListSerializer,
+                User.objects.select_related(
+                    "employee_profile", "employee_profile__department"
+                ),
+                rows,
+            )
+            report(
+                "history",
+                AssetHistorySerializer,
+                AssetHistory.objects.select_related(
+                    "asset", "previous_user", "new_user"
+                ),
+                rows,
+            )
+            raise RollbackError
+    except RollbackError:
+        pass
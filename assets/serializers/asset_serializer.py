@@ -1,7 +1,36 @@
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
 
 from assets.models import Asset, AssetHistory, Category, Department, EmployeeProfile
+from assets.projections import ValuesProjectionMixin
+from assets.services.cache_services import asset_detail_key, set_detail
+from assets.services.reference_services import REFERENCE_MODELS, get_reference
+
+
+class ReferenceRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key of a Category or Department, resolved from the reference
+    data cache instead of one query per request.
+    """
+
+    def __init__(self, reference, **kwargs):
+        self.reference = reference
+        kwargs.setdefault("queryset", REFERENCE_MODELS[reference].objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        row = get_reference(self.reference, pk)
+        if row is None:
+            self.fail("does_not_exist", pk_value=data)
+        return row
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -35,6 +64,7 @@ class CategorySerializer(serializers.ModelSerializer):
 
 
 class AssetCreateSerializer(serializers.ModelSerializer):
+    category = ReferenceRelatedField("category", required=False, allow_null=True)
     notes = serializers.CharField(write_only=True, required=False, allow_blank=True)
 
     class Meta:
@@ -61,6 +91,9 @@ class AssetCreateSerializer(serializers.ModelSerializer):
             )
         return asset
 
+    # The asset row stays locked from the stats read in pre_save to the
+    # history write, concurrent updates of one asset run one after the other
+    @transaction.atomic
     def update(self, instance, validated_data):
         notes = validated_data.pop("notes", None)
         new_user = validated_data.get("assigned_to", None)
@@ -85,12 +118,67 @@ class AssetCreateSerializer(serializers.ModelSerializer):
             current_history.notes = notes
             current_history.save()
 
+        # save() dropped the cached detail, put the fresh payload back
+        set_detail(asset_detail_key(instance.id), AssetDetailSerializer(instance).data)
         return instance
 
 
-class AssetListSerializer(serializers.ModelSerializer):
+class AssetImportRowSerializer(serializers.ModelSerializer):
+    # Related ids and serial_number uniqueness are checked once per batch by
+    # the import service instead of one query per row
+    category = serializers.IntegerField(required=False, allow_null=True)
+    assigned_to = serializers.IntegerField(required=False, allow_null=True)
+    notes = serializers.CharField(required=False, allow_blank=True)
+
+    class Meta:
+        model = Asset
+        fields = [
+            "name",
+            "serial_number",
+            "category",
+            "assigned_to",
+            "purchase_date",
+            "status",
+            "description",
+            "notes",
+        ]
+        extra_kwargs = {"serial_number": {"validators": []}}
+
+
+class AssetReassignSerializer(serializers.Serializer):
+    asset_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000
+    )
+    assigned_to = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.all(), allow_null=True
+    )
+    notes = serializers.CharField(required=False, allow_blank=True, default="")
+
+    def validate_asset_ids(self, value):
+        return sorted(set(value))
+
+
+class CustodyAtSerializer(serializers.Serializer):
+    # Naive values are read in TIME_ZONE, a bare date means its midnight
+    at = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        attrs.setdefault("at", timezone.now())
+        return attrs
+
+
+class AssetListSerializer(ValuesProjectionMixin, serializers.ModelSerializer):
     category = serializers.SerializerMethodField()
 
+    projection_fields = (
+        "id",
+        "name",
+        "serial_number",
+        "category__name",
+        "status",
+        "description",
+    )
+
     class Meta:
         model = Asset
         fields = [
@@ -105,6 +193,17 @@ class AssetListSerializer(serializers.ModelSerializer):
     def get_category(self, obj):
         return obj.category.name if obj.category else None
 
+    @classmethod
+    def project_row(cls, row):
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "serial_number": row["serial_number"],
+            "category": row["category__name"],
+            "status": row["status"],
+            "description": row["description"],
+        }
+
 
 class AssetDetailSerializer(serializers.ModelSerializer):
     category = serializers.SerializerMethodField()
@@ -164,11 +263,27 @@ class UserAssetListSerializer(serializers.ModelSerializer):
         ]
 
 
-class AssetHistorySerializer(serializers.ModelSerializer):
+# Formats projected timestamps exactly like the ModelSerializer field does
+change_date_field = serializers.DateTimeField(read_only=True)
+
+
+class AssetHistorySerializer(ValuesProjectionMixin, serializers.ModelSerializer):
     new_user = serializers.StringRelatedField()
     previous_user = serializers.StringRelatedField()
     asset = serializers.SerializerMethodField()
 
+    # User.__str__ is the username; id is only read by the cursor paginator
+    projection_fields = (
+        "id",
+        "previous_user__username",
+        "new_user__username",
+        "change_date",
+        "notes",
+        "asset_id",
+        "asset__name",
+        "asset__serial_number",
+    )
+
     class Meta:
         model = AssetHistory
         fields = ["previous_user", "new_user", "change_date", "notes", "asset"]
@@ -180,6 +295,20 @@ class AssetHistorySerializer(serializers.ModelSerializer):
             "serial_number": obj.asset.serial_number,
         }
 
+    @classmethod
+    def project_row(cls, row):
+        return {
+            "previous_user": row["previous_user__username"],
+            "new_user": row["new_user__username"],
+            "change_date": change_date_field.to_representation(row["change_date"]),
+            "notes": row["notes"],
+            "asset": {
+                "id": row["asset_id"],
+                "name": row["asset__name"],
+                "serial_number": row["asset__serial_number"],
+            },
+        }
+
 
 class UserAssetSerializer(serializers.ModelSerializer):
     assets = AssetListSerializer(many=True)
@@ -1,15 +1,36 @@
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 
 from assets.models import Category, Department, EmployeeProfile
+from assets.projections import ValuesProjectionMixin
+from assets.serializers.asset_serializer import ReferenceRelatedField
+from assets.services.cache_services import employee_detail_key, set_detail
 from assets.tasks import send_change_password, send_welcome_email
 
+EMPLOYEE_TYPEAHEAD_LIMIT = 20
+EMPLOYEE_TYPEAHEAD_MAX_LIMIT = 50
 
-class EmployeeListSerializer(serializers.ModelSerializer):
+
+class EmployeeListSerializer(ValuesProjectionMixin, serializers.ModelSerializer):
     employee_profile = serializers.SerializerMethodField()
 
+    projection_fields = (
+        "id",
+        "username",
+        "first_name",
+        "last_name",
+        "email",
+        "is_superuser",
+        "employee_profile__id",
+        "employee_profile__is_verified",
+        "employee_profile__department_id",
+        "employee_profile__department__full_name",
+        "employee_profile__position",
+    )
+
     class Meta:
         model = User
         fields = [
@@ -37,6 +58,26 @@ class EmployeeListSerializer(serializers.ModelSerializer):
             "position": position,
         }
 
+    @classmethod
+    def project_row(cls, row):
+        employee_profile = None
+        if row["employee_profile__id"] is not None:
+            employee_profile = {
+                "is_verified": row["employee_profile__is_verified"],
+                "department": row["employee_profile__department__full_name"],
+                "department_id": row["employee_profile__department_id"],
+                "position": row["employee_profile__position"],
+            }
+        return {
+            "id": row["id"],
+            "username": row["username"],
+            "first_name": row["first_name"],
+            "last_name": row["last_name"],
+            "email": row["email"],
+            "employee_profile": employee_profile,
+            "is_superuser": row["is_superuser"],
+        }
+
 
 class EmployeeDetailsSerializer(serializers.ModelSerializer):
     employee_profile = serializers.SerializerMethodField()
@@ -72,9 +113,7 @@ class EmployeeDetailsSerializer(serializers.ModelSerializer):
 
 class EmployeeCreateSerializer(serializers.ModelSerializer):
     position = serializers.CharField(write_only=True, required=True, allow_blank=False)
-    department = serializers.PrimaryKeyRelatedField(
-        required=True, queryset=Department.objects.all(), write_only=True
-    )
+    department = ReferenceRelatedField("department", required=True, write_only=True)
     is_verified = serializers.BooleanField(write_only=True, required=True)
 
     class Meta:
@@ -119,7 +158,7 @@ class EmployeeCreateSerializer(serializers.ModelSerializer):
 
         employee_profile = EmployeeProfile.objects.create(
             user=user,
-            department=Department.objects.get(name=department),
+            department=department,
             position=position,
             is_verified=is_verified,
         )
@@ -129,13 +168,49 @@ class EmployeeCreateSerializer(serializers.ModelSerializer):
         return user
 
 
+class EmployeeOnboardRowSerializer(serializers.ModelSerializer):
+    # Department ids and username uniqueness are checked once per batch by
+    # the onboarding service instead of one query per row
+    department = serializers.IntegerField()
+    position = serializers.CharField(allow_blank=False)
+    is_verified = serializers.BooleanField()
+
+    class Meta:
+        model = User
+        fields = [
+            "username",
+            "first_name",
+            "last_name",
+            "email",
+            "password",
+            "department",
+            "position",
+            "is_verified",
+        ]
+        extra_kwargs = {
+            "username": {"validators": [UnicodeUsernameValidator()]},
+            "email": {"required": True, "allow_blank": False},
+        }
+
+    def validate(self, attrs):
+        user = User(
+            username=attrs["username"],
+            first_name=attrs.get("first_name", ""),
+            last_name=attrs.get("last_name", ""),
+            email=attrs["email"],
+        )
+        try:
+            validate_password(attrs["password"], user=user)
+        except DjangoValidationError as e:
+            raise serializers.ValidationError({"password": e.messages})
+        return attrs
+
+
 class EmployeeUpdateSerializer(serializers.ModelSerializer):
     position = serializers.CharField(source="employee_profile.position", required=True)
 
-    department = serializers.PrimaryKeyRelatedField(
-        source="employee_profile.department",
-        queryset=Department.objects.all(),
-        required=True,
+    department = ReferenceRelatedField(
+        "department", source="employee_profile.department", required=True
     )
     is_verified = serializers.BooleanField(source="employee_profile.is_verified")
 
@@ -179,6 +254,10 @@ class EmployeeUpdateSerializer(serializers.ModelSerializer):
 
         instance.employee_profile.save()
 
+        # save() dropped the cached detail, put the fresh payload back
+        set_detail(
+            employee_detail_key(instance.id), EmployeeDetailsSerializer(instance).data
+        )
         return instance
 
 
@@ -202,6 +281,16 @@ class EmployeeDropdownSerializer(serializers.ModelSerializer):
         return f"{obj.first_name} {obj.last_name}".strip()
 
 
+class EmployeeTypeaheadSerializer(serializers.Serializer):
+    q = serializers.CharField(required=False, allow_blank=True, default="")
+    limit = serializers.IntegerField(
+        required=False,
+        default=EMPLOYEE_TYPEAHEAD_LIMIT,
+        min_value=1,
+        max_value=EMPLOYEE_TYPEAHEAD_MAX_LIMIT,
+    )
+
+
 class CategoryDropdownSerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
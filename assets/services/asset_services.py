@@ -0,0 +1,212 @@
+import csv
+import io
+import logging
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from assets.models import Asset, AssetHistory
+from assets.serializers.asset_serializer import AssetImportRowSerializer
+from assets.services.cache_services import (
+    ASSET_HISTORY_NAMESPACE,
+    ASSET_LIST_NAMESPACE,
+    asset_detail_key,
+    invalidate,
+)
+from assets.services.custody_services import record_custody_changes
+from assets.services.reference_services import get_reference_ids
+from assets.services.stats_services import (
+    asset_buckets,
+    record_bucket_changes,
+    tracking_inventory_stats,
+)
+
+logger = logging.getLogger("assets")
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_MAX_ROWS = 20000
+
+
+def read_csv_rows(uploaded_file):
+    reader = csv.DictReader(io.TextIOWrapper(uploaded_file, encoding="utf-8-sig"))
+    # Empty cells mean "not provided", not an empty value
+    return [
+        {key.strip(): value.strip() for key, value in row.items() if key and value}
+        for row in reader
+    ]
+
+
+def _validate_batch(batch, seen_serial_numbers):
+    """
+    Validate one batch of (row_number, row) pairs.
+    Returns the valid rows as validated_data and a list of per-row errors.
+    """
+    errors = []
+    validated = []
+    for row_number, row in batch:
+        serializer = AssetImportRowSerializer(data=row)
+        if serializer.is_valid():
+            validated.append((row_number, serializer.validated_data))
+        else:
+            errors.append({"row": row_number, "errors": serializer.errors})
+
+    serial_numbers = [data["serial_number"] for _, data in validated]
+    category_ids = {data["category"] for _, data in validated if data.get("category")}
+    user_ids = {data["assigned_to"] for _, data in validated if data.get("assigned_to")}
+
+    # One query each for the whole batch
+    existing_serial_numbers = set(
+        Asset.objects.filter(serial_number__in=serial_numbers).values_list(
+            "serial_number", flat=True
+        )
+    )
+    known_category_ids = category_ids & get_reference_ids("category", category_ids)
+    known_user_ids = set(
+        User.objects.filter(id__in=user_ids).values_list("id", flat=True)
+    )
+
+    valid_rows = []
+    for row_number, data in validated:
+        row_errors = {}
+        serial_number = data["serial_number"]
+        if serial_number in existing_serial_numbers:
+            row_errors["serial_number"] = [
+                "asset with this serial number already exists."
+            ]
+        elif serial_number in seen_serial_numbers:
+            row_errors["serial_number"] = ["serial number is duplicated in the file."]
+        if data.get("category") and data["category"] not in known_category_ids:
+            row_errors["category"] = [
+                f"Invalid pk \"{data['category']}\" - object does not exist."
+            ]
+        if data.get("assigned_to") and data["assigned_to"] not in known_user_ids:
+            row_errors["assigned_to"] = [
+                f"Invalid pk \"{data['assigned_to']}\" - object does not exist."
+            ]
+
+        if row_errors:
+            errors.append({"row": row_number, "errors": row_errors})
+            continue
+
+        seen_serial_numbers.add(serial_number)
+        valid_rows.append(data)
+
+    return valid_rows, errors
+
+
+def import_assets(rows, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Validate rows in batches and insert every valid one in a single
+    transaction: bulk_create for the assets, then for the history rows of
+    assets that come in already assigned. Invalid rows are reported and
+    skipped, they don't abort the import.
+    """
+    numbered_rows = list(enumerate(rows, start=1))
+    seen_serial_numbers = set()
+    valid_rows = []
+    errors = []
+
+    for start in range(0, len(numbered_rows), batch_size):
+        batch_rows, batch_errors = _validate_batch(
+            numbered_rows[start : start + batch_size], seen_serial_numbers
+        )
+        valid_rows.extend(batch_rows)
+        errors.extend(batch_errors)
+
+    created = []
+    if valid_rows:
+        with transaction.atomic():
+            assets = [
+                Asset(
+                    name=data["name"],
+                    serial_number=data["serial_number"],
+                    category_id=data.get("category"),
+                    assigned_to_id=data.get("assigned_to"),
+                    purchase_date=data["purchase_date"],
+                    status=data.get("status", "IN_STORAGE"),
+                    description=data.get("description", ""),
+                )
+                for data in valid_rows
+            ]
+            created = Asset.objects.bulk_create(assets, batch_size=batch_size)
+
+            history = AssetHistory.objects.bulk_create(
+                [
+                    AssetHistory(
+                        asset=asset,
+                        previous_user=None,
+                        new_user_id=asset.assigned_to_id,
+                        notes=data.get("notes", ""),
+                    )
+                    for asset, data in zip(created, valid_rows)
+                    if asset.assigned_to_id
+                ],
+                batch_size=batch_size,
+            )
+            record_custody_changes(history)
+            record_bucket_changes({}, asset_buckets([asset.id for asset in created]))
+            # bulk_create skips the post_save receivers, invalidate once instead
+            invalidate(ASSET_LIST_NAMESPACE, ASSET_HISTORY_NAMESPACE)
+
+    logger.info(f"Asset import: {len(created)} created, {len(errors)} rows rejected")
+    errors.sort(key=lambda error: error["row"])
+    return created, errors
+
+
+def reassign_assets(asset_ids, new_user, notes=""):
+    """
+    Move many assets to new_user (or unassign them) in one transaction:
+    one locking SELECT, one UPDATE and one bulk_create of history rows.
+    Assets already held by new_user are left alone.
+    """
+    new_user_id = new_user.id if new_user else None
+
+    with transaction.atomic():
+        # Rows are always locked in id order, so two overlapping bulk
+        # reassignments queue behind each other instead of deadlocking
+        current_holders = dict(
+            Asset.objects.select_for_update()
+            .filter(id__in=asset_ids)
+            .order_by("id")
+            .values_list("id", "assigned_to_id")
+        )
+
+        missing_ids = sorted(set(asset_ids) - current_holders.keys())
+        if missing_ids:
+            raise ValidationError({"asset_ids": [f"Assets not found: {missing_ids}"]})
+
+        changed = {
+            asset_id: previous_user_id
+            for asset_id, previous_user_id in current_holders.items()
+            if previous_user_id != new_user_id
+        }
+        if changed:
+            with tracking_inventory_stats(list(changed)):
+                Asset.objects.filter(id__in=changed.keys()).update(
+                    assigned_to=new_user, updated_at=timezone.now()
+                )
+            record_custody_changes(
+                AssetHistory.objects.bulk_create(
+                    AssetHistory(
+                        asset_id=asset_id,
+                        previous_user_id=previous_user_id,
+                        new_user_id=new_user_id,
+                        notes=notes,
+                    )
+                    for asset_id, previous_user_id in changed.items()
+                )
+            )
+            # update() and bulk_create skip the post_save receivers
+            invalidate(
+                ASSET_LIST_NAMESPACE,
+                ASSET_HISTORY_NAMESPACE,
+                detail_keys=[asset_detail_key(asset_id) for asset_id in changed],
+            )
+
+    logger.info(
+        f"Bulk reassign to user {new_user_id}: {len(changed)} moved, "
+        f"{len(current_holders) - len(changed)} already assigned"
+    )
+    return list(changed)
@@ -0,0 +1,462 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils.http import quote_etag, urlencode
+from django_redis import get_redis_connection
+from rest_framework.response import Response
+
+logger = logging.getLogger("assets")
+
+# Cache namespaces used by the list views
+ASSET_LIST_NAMESPACE = "asset_list"
+EMPLOYEE_LIST_NAMESPACE = "employee_list"
+ASSET_HISTORY_NAMESPACE = "asset_history"
+# Category and Department rows, embedded in most asset and employee payloads
+REFERENCE_DATA_NAMESPACE = "reference_data"
+
+# Per-object entries of the detail views, deleted by the signals on writes
+DETAIL_CACHE_TIMEOUT = 60 * 60
+
+# Cached list pages are kept this long past their freshness, to be served
+# while one request rebuilds them
+PAGE_STALE_TIMEOUT = 60 * 60
+# Single-flight rebuild lock, expires on its own if the rebuilding worker dies
+PAGE_LOCK_TIMEOUT = 30
+# How long a request with no copy to serve waits for another one's rebuild
+PAGE_WAIT_TIMEOUT = 5
+PAGE_POLL_INTERVAL = 0.05
+# Page hits are counted per window, the warmer ranks pages on the last two
+PAGE_HITS_WINDOW = 60 * 60
+
+# Sent once per outbox flush, with the namespaces it bumped
+cache_invalidated = Signal()
+
+
+def generation_key(namespace):
+    return f"cache_generation:{namespace}"
+
+
+def _initial_generation():
+    # Seeding with the current time in ms instead of 1 means that a generation
+    # key evicted by Redis never comes back with a number an older entry used.
+    return int(time.time() * 1000)
+
+
+def get_generation(namespace):
+    key = generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, _initial_generation(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(namespace):
+    """
+    Invalidate every cached entry of a namespace with a single INCR.
+    Entries from older generations are never read again and expire on their own.
+    """
+    key = generation_key(namespace)
+    try:
+        generation = cache.incr(key)
+    except ValueError:
+        cache.add(key, _initial_generation(), timeout=None)
+        generation = cache.get(key)
+
+    logger.debug(f"Cache namespace '{namespace}' moved to generation {generation}")
+    return generation
+
+
+# ----- INVALIDATION OUTBOX ----- #
+# Writers record what they made stale with invalidate(). Inside a transaction
+# the namespaces and detail keys are gathered and flushed once, on commit:
+# a reader can no longer re-cache rows that are not committed yet, and 500
+# saves in one transaction cost one INCR per namespace. Outside of one they
+# are flushed at the end of the collecting_invalidations() block (every
+# request, see InvalidationOutboxMiddleware), or right away.
+
+_outbox_state = threading.local()
+
+
+class InvalidationOutbox:
+    def __init__(self):
+        self.namespaces = set()
+        self.detail_keys = set()
+        # Detail payloads refreshed by the writer, stored after the deletes
+        self.refreshed = {}
+        # In a transaction, each refresh is stored by its own on_commit hook,
+        # which a rolled back savepoint drops along with the write
+        self.refresh_tokens = {}
+
+    def add(self, namespaces, detail_keys):
+        self.namespaces.update(namespaces)
+        self.detail_keys.update(detail_keys)
+        # A later write makes an earlier refresh stale
+        for key in detail_keys:
+            self.refreshed.pop(key, None)
+            self.refresh_tokens.pop(key, None)
+
+    def refresh(self, key, payload):
+        self.refreshed[key] = payload
+
+    def refresh_on_commit(self, key, payload):
+        token = self.refresh_tokens[key] = object()
+
+        def store():
+            if self.refresh_tokens.get(key) is token:
+                del self.refresh_tokens[key]
+                cache.set(stored_detail_key(key), payload, timeout=DETAIL_CACHE_TIMEOUT)
+
+        # Runs after the flush hook _transaction_outbox() registered first
+        transaction.on_commit(store)
+
+    def flush(self):
+        if not self.namespaces and not self.detail_keys and not self.refreshed:
+            return
+        namespaces, detail_keys, refreshed = (
+            self.namespaces,
+            self.detail_keys,
+            self.refreshed,
+        )
+        self.namespaces, self.detail_keys, self.refreshed = set(), set(), {}
+        for namespace in sorted(namespaces):
+            bump_generation(namespace)
+        delete_details(list(detail_keys))
+        if refreshed:
+            stored_keys = stored_detail_keys(refreshed)
+            cache.set_many(
+                {stored_keys[key]: payload for key, payload in refreshed.items()},
+                timeout=DETAIL_CACHE_TIMEOUT,
+            )
+        if namespaces:
+            cache_invalidated.send(sender=InvalidationOutbox, namespaces=namespaces)
+
+
+def _transaction_outbox():
+    outbox = getattr(_outbox_state, "transaction_outbox", None)
+    if outbox is None:
+        outbox = _outbox_state.transaction_outbox = InvalidationOutbox()
+    # One hook per call: a rolled back savepoint drops its own hooks, not the
+    # ones of the writes around it. The first hook to run flushes everything,
+    # the others find the outbox empty. What a rolled back write left in the
+    # outbox goes out with the next flush, which only over-invalidates
+    transaction.on_commit(outbox.flush)
+    return outbox
+
+
+def _current_outbox():
+    if transaction.get_connection().in_atomic_block:
+        return _transaction_outbox()
+    return getattr(_outbox_state, "block_outbox", None)
+
+
+def invalidate(*namespaces, detail_keys=()):
+    """
+    Mark cache namespaces and detail entries as stale, coalesced per
+    transaction (flushed on commit) or per collecting_invalidations() block.
+    """
+    outbox = _current_outbox()
+    if outbox is None:
+        outbox = InvalidationOutbox()
+        outbox.add(namespaces, detail_keys)
+        outbox.flush()
+        return
+    outbox.add(namespaces, detail_keys)
+
+
+@contextmanager
+def collecting_invalidations():
+    """Defer the invalidations made outside transactions to the block's end."""
+    if getattr(_outbox_state, "block_outbox", None) is not None:
+        yield
+        return
+
+    outbox = _outbox_state.block_outbox = InvalidationOutbox()
+    try:
+        yield
+    finally:
+        _outbox_state.block_outbox = None
+        outbox.flush()
+
+
+def normalized_full_path(request):
+    """
+    The request path with its query parameters sorted and blank ones dropped,
+    so that `?status=IN_USE&category=1` and `?category=1&status=IN_USE&search=`
+    name the same page.
+    """
+    # Keys only: filters read the last value of a repeated key, the sort is
+    # stable and keeps the values in their order
+    params = sorted(
+        (
+            (key, value)
+            for key, values in request.GET.lists()
+            for value in values
+            if value != ""
+        ),
+        key=lambda param: param[0],
+    )
+    if not params:
+        return request.path
+    return f"{request.path}?{urlencode(params)}"
+
+
+def permission_scope(request):
+    """The permission level a cached page is shared at, in place of cookies."""
+    if request.user.is_staff:
+        return "admin"
+    if request.user.is_authenticated:
+        return "authenticated"
+    return "anonymous"
+
+
+def page_cache_key(request, namespaces):
+    # Host and scheme stay in the key: pagination links in the payload use them
+    url = hashlib.md5(
+        request.build_absolute_uri(normalized_full_path(request)).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f"page:{'.'.join(namespaces)}:{permission_scope(request)}:{url}"
+
+
+# ----- PAGE HITS ----- #
+# Every cached page request is counted under its permission scope and
+# absolute normalized URL, which is all the warmer needs to render it again.
+# Counts live in a Redis sorted set per window; with another cache backend
+# (tests, local development) they are kept in this process.
+
+_local_page_hits = defaultdict(Counter)
+_local_page_hits_lock = threading.Lock()
+
+
+def _page_hits_client():
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+def _page_hits_key(window):
+    return cache.make_key(f"page_hits:{window}")
+
+
+def record_page_hit(request):
+    page = json.dumps(
+        [
+            permission_scope(request),
+            request.build_absolute_uri(normalized_full_path(request)),
+        ]
+    )
+    window = int(time.time() // PAGE_HITS_WINDOW)
+    client = _page_hits_client()
+    if client is None:
+        with _local_page_hits_lock:
+            _local_page_hits[window][page] += 1
+            for old_window in [w for w in _local_page_hits if w < window - 1]:
+                del _local_page_hits[old_window]
+        return
+
+    pipeline = client.pipeline()
+    pipeline.zincrby(_page_hits_key(window), 1, page)
+    pipeline.expire(_page_hits_key(window), 2 * PAGE_HITS_WINDOW)
+    pipeline.execute()
+
+
+def get_hot_pages(limit, min_hits=1):
+    """
+    The `limit` most requested pages over the current and previous window,
+    as (scope, url, hits) tuples, most hit first.
+    """
+    window = int(time.time() // PAGE_HITS_WINDOW)
+    client = _page_hits_client()
+    hits = Counter()
+    for counted_window in (window - 1, window):
+        if client is None:
+            with _local_page_hits_lock:
+                hits.update(_local_page_hits.get(counted_window, {}))
+            continue
+        # The head of each window is enough to rank the overall head
+        top = client.zrevrange(
+            _page_hits_key(counted_window), 0, 10 * limit - 1, withscores=True
+        )
+        hits.update({page.decode(): int(count) for page, count in top})
+
+    return [
+        (*json.loads(page), count)
+        for page, count in hits.most_common(limit)
+        if count >= min_hits
+    ]
+
+
+def _cached_page_response(request, entry):
+    # The ETag names the generations the payload was built from, so a stale
+    # copy never goes out under the ETag of the current data
+    etag = make_etag(normalized_full_path(request), *entry["generations"])
+    return Response(entry["data"], headers={"ETag": quote_etag(etag)})
+
+
+def stale_while_revalidate_page(timeout, *namespaces):
+    """
+    Page cache for a DRF list method, with stampede protection.
+
+    Entries are shared by every user of the same permission scope and keyed
+    on the normalized query string; cookies play no part, unlike with
+    cache_page and its Vary: Cookie.
+
+    An entry is fresh for `timeout` seconds while the generations of its
+    namespaces stay put. Once it is stale, the first request to take the
+    rebuild lock runs the view and stores the result; every concurrent
+    request is served the stale copy meanwhile instead of running the view
+    too. With no copy at all they wait up to PAGE_WAIT_TIMEOUT for the
+    rebuild, then run the view themselves.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            if not getattr(request, "cache_warming", False):
+                record_page_hit(request)
+            key = page_cache_key(request, namespaces)
+            lock_key = f"{key}:lock"
+            generations = [get_generation(namespace) for namespace in namespaces]
+
+            def take_lock():
+                # A token of our own, so that a rebuild outliving the lock
+                # does not release the one another request took since
+                token = uuid4().hex
+                if cache.add(lock_key, token, timeout=PAGE_LOCK_TIMEOUT):
+                    return token
+                return None
+
+            def rebuild(token):
+                try:
+                    response = view_func(request, *args, **kwargs)
+                    if response.status_code == 200:
+                        entry = {
+                            "generations": generations,
+                            "fresh_until": time.time() + timeout,
+                            "data": response.data,
+                        }
+                        cache.set(key, entry, timeout=timeout + PAGE_STALE_TIMEOUT)
+                    return response
+                finally:
+                    if cache.get(lock_key) == token:
+                        cache.delete(lock_key)
+
+            entry = cache.get(key)
+            if (
+                entry is not None
+                and entry["generations"] == generations
+                and time.time() < entry["fresh_until"]
+            ):
+                return _cached_page_response(request, entry)
+
+            token = take_lock()
+            if token is not None:
+                return rebuild(token)
+            if entry is not None:
+                logger.debug(f"Serving stale page {key} during its rebuild")
+                return _cached_page_response(request, entry)
+
+            deadline = time.monotonic() + PAGE_WAIT_TIMEOUT
+            while time.monotonic() < deadline:
+                time.sleep(PAGE_POLL_INTERVAL)
+                entry = cache.get(key)
+                if entry is not None:
+                    return _cached_page_response(request, entry)
+                # The rebuilding request failed and let go of the lock
+                token = take_lock()
+                if token is not None:
+                    return rebuild(token)
+
+            logger.warning(f"Gave up waiting for the rebuild of page {key}")
+            return view_func(request, *args, **kwargs)
+
+        return _wrapped_view
+
+    return decorator
+
+
+def asset_detail_key(asset_id):
+    return f"asset_detail:{asset_id}"
+
+
+def employee_detail_key(user_id):
+    return f"employee_detail:{user_id}"
+
+
+def stored_detail_keys(keys):
+    """
+    Map detail keys to the cache keys their entries live under. Details embed
+    categories and departments, so the key carries the reference data
+    generation: one bump drops them all, with no key to list per row.
+    """
+    generation = get_generation(REFERENCE_DATA_NAMESPACE)
+    return {key: f"{key}:r{generation}" for key in keys}
+
+
+def stored_detail_key(key):
+    return stored_detail_keys([key])[key]
+
+
+def get_or_set_detail(key, build):
+    """
+    Read-through lookup of a serialized detail payload: on a miss, build()
+    runs the query and serialization once and the result is stored.
+    """
+    # Read before the rows: a payload built from rows older than a reference
+    # data change goes under the generation that change retired
+    key = stored_detail_key(key)
+    payload = cache.get(key)
+    if payload is None:
+        payload = dict(build())
+        cache.set(key, payload, timeout=DETAIL_CACHE_TIMEOUT)
+    return payload
+
+
+def set_detail(key, payload):
+    """
+    Store the payload a writer just serialized. The write that produced it
+    queued the key in the outbox, so the payload goes in with the flush,
+    after the deletes, instead of being deleted by it.
+    """
+    if transaction.get_connection().in_atomic_block:
+        _transaction_outbox().refresh_on_commit(key, dict(payload))
+        return
+    outbox = getattr(_outbox_state, "block_outbox", None)
+    if outbox is None:
+        cache.set(stored_detail_key(key), dict(payload), timeout=DETAIL_CACHE_TIMEOUT)
+        return
+    outbox.refresh(key, dict(payload))
+
+
+def delete_details(keys):
+    if keys:
+        cache.delete_many(list(stored_detail_keys(keys).values()))
+
+
+def make_etag(*parts):
+    return hashlib.md5(
+        ":".join(str(part) for part in parts).encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+def collection_etag(request, *namespaces):
+    """
+    ETag for a cached collection: the normalized full path plus the generation
+    of every namespace its payload depends on. No database query is needed.
+    """
+    return make_etag(
+        normalized_full_path(request),
+        *(get_generation(namespace) for namespace in namespaces),
+    )
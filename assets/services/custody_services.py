@@ -0,0 +1,212 @@
+import logging
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import FilteredRelation, Q
+from psycopg2.extras import DateTimeTZRange
+
+from assets.models import Asset, AssetCustody, AssetHistory
+
+logger = logging.getLogger("assets")
+
+# Custody periods replayed from the whole history table: each row holds the
+# asset from its change_date until the asset's next history row. Hand-overs
+# at the same instant would give an empty range, they are skipped
+CUSTODY_FROM_HISTORY_SQL = """
+    SELECT asset_id, new_user_id, tstzrange(change_date, next_change_date, '[)')
+    FROM (
+        SELECT
+            asset_id,
+            new_user_id,
+            change_date,
+            LEAD(change_date) OVER (
+                PARTITION BY asset_id ORDER BY change_date, id
+            ) AS next_change_date
+        FROM {history}
+    ) AS changes
+    WHERE new_user_id IS NOT NULL
+      AND (next_change_date IS NULL OR next_change_date > change_date)
+"""
+
+
+def record_custody_changes(history_rows):
+    """
+    Apply newly written history rows to the custody periods: the asset's
+    open period is closed at change_date and the new holder, if any, gets
+    an open one. Rows must be the latest of their asset, one per asset;
+    one UPDATE and one INSERT whatever their number.
+    """
+    if not history_rows:
+        return
+
+    table = AssetCustody._meta.db_table
+    values = ", ".join(["(%s::bigint, %s::timestamptz)"] * len(history_rows))
+    params = [
+        value
+        for history in history_rows
+        for value in (history.asset_id, history.change_date)
+    ]
+    # No savepoint: if this fails, the history write must roll back too
+    with transaction.atomic(savepoint=False), connection.cursor() as cursor:
+        cursor.execute(
+            # A hand-over at the very instant the period began leaves it
+            # empty, empty ranges match no point in time and overlap nothing
+            f"UPDATE {table} AS custody SET period = tstzrange("
+            "lower(custody.period), "
+            "GREATEST(lower(custody.period), changes.change_date), '[)') "
+            f"FROM (VALUES {values}) AS changes (asset_id, change_date) "
+            "WHERE custody.asset_id = changes.asset_id AND upper_inf(custody.period)",
+            params,
+        )
+        AssetCustody.objects.bulk_create(
+            AssetCustody(
+                asset_id=history.asset_id,
+                user_id=history.new_user_id,
+                period=DateTimeTZRange(history.change_date, None, "[)"),
+            )
+            for history in history_rows
+            if history.new_user_id
+        )
+
+
+def rebuild_custody_periods():
+    """Replace every custody period with a replay of the history table."""
+    table = AssetCustody._meta.db_table
+    history = AssetHistory._meta.db_table
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table}")
+        cursor.execute(
+            f"INSERT INTO {table} (asset_id, user_id, period) "
+            + CUSTODY_FROM_HISTORY_SQL.format(history=history)
+        )
+        count = cursor.rowcount
+    logger.info(f"Custody periods rebuilt: {count} periods")
+    return count
+
+
+def find_custody_drift():
+    """Number of stored periods and of replayed periods that have no match."""
+    table = AssetCustody._meta.db_table
+    replayed = CUSTODY_FROM_HISTORY_SQL.format(history=AssetHistory._meta.db_table)
+    stored = f"SELECT asset_id, user_id, period FROM {table} WHERE NOT isempty(period)"
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT (SELECT COUNT(*) FROM ({stored} EXCEPT {replayed}) AS extra), "
+            f"(SELECT COUNT(*) FROM ({replayed} EXCEPT {stored}) AS missing)"
+        )
+        extra, missing = cursor.fetchone()
+    return {"extra": extra, "missing": missing}
+
+
+def _period_bounds(period):
+    if period is None:
+        return None, None
+    return period.lower, period.upper
+
+
+def _custody_at(at):
+    return FilteredRelation(
+        "custody_periods", condition=Q(custody_periods__period__contains=at)
+    )
+
+
+def get_holder_at(asset_id, at):
+    """
+    The asset and whoever held it at `at`, in one query: a LEFT JOIN on the
+    asset's custody period containing `at`. None when the asset does not
+    exist.
+    """
+    row = (
+        Asset.objects.filter(id=asset_id)
+        .annotate(custody=_custody_at(at))
+        .values(
+            "id",
+            "name",
+            "serial_number",
+            "custody__period",
+            "custody__user_id",
+            "custody__user__username",
+            "custody__user__first_name",
+            "custody__user__last_name",
+            "custody__user__email",
+        )
+        .first()
+    )
+    if row is None:
+        return None
+
+    held_since, held_until = _period_bounds(row["custody__period"])
+    holder = None
+    if row["custody__user_id"]:
+        holder = {
+            "id": row["custody__user_id"],
+            "username": row["custody__user__username"],
+            "first_name": row["custody__user__first_name"],
+            "last_name": row["custody__user__last_name"],
+            "email": row["custody__user__email"],
+        }
+    return {
+        "at": at,
+        "asset": {
+            "id": row["id"],
+            "name": row["name"],
+            "serial_number": row["serial_number"],
+        },
+        "holder": holder,
+        "held_since": held_since,
+        "held_until": held_until,
+    }
+
+
+def get_assets_held_at(user_id, at):
+    """
+    The employee and every asset they held at `at`, in one query over the
+    (user, period) GiST index. None when the user does not exist.
+    """
+    rows = list(
+        User.objects.filter(id=user_id)
+        .annotate(custody=_custody_at(at))
+        .values(
+            "id",
+            "username",
+            "first_name",
+            "last_name",
+            "email",
+            "custody__period",
+            "custody__asset_id",
+            "custody__asset__name",
+            "custody__asset__serial_number",
+            "custody__asset__category__name",
+        )
+        .order_by("custody__asset_id")
+    )
+    if not rows:
+        return None
+
+    employee = rows[0]
+    assets = []
+    for row in rows:
+        if row["custody__asset_id"] is None:
+            continue
+        held_since, held_until = _period_bounds(row["custody__period"])
+        assets.append(
+            {
+                "id": row["custody__asset_id"],
+                "name": row["custody__asset__name"],
+                "serial_number": row["custody__asset__serial_number"],
+                "category": row["custody__asset__category__name"],
+                "held_since": held_since,
+                "held_until": held_until,
+            }
+        )
+    return {
+        "at": at,
+        "employee": {
+            "id": employee["id"],
+            "username": employee["username"],
+            "first_name": employee["first_name"],
+            "last_name": employee["last_name"],
+            "email": employee["email"],
+        },
+        "assets": assets,
+    }
@@ -0,0 +1,182 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import get_hasher
+from django.contrib.auth.models import User
+from django.db import transaction
+from kombu.exceptions import OperationalError
+
+from assets.models import EmployeeProfile
+from assets.serializers.employee_serializer import EmployeeOnboardRowSerializer
+from assets.services.cache_services import EMPLOYEE_LIST_NAMESPACE, invalidate
+from assets.services.reference_services import get_references
+from assets.tasks import send_onboarding_emails
+
+logger = logging.getLogger("assets")
+
+ONBOARD_BATCH_SIZE = 500
+# Hashing dominates: each password costs a full PBKDF2 run
+ONBOARD_MAX_ROWS = 1000
+
+HASH_WORKERS = os.cpu_count() or 1
+# Below this, starting the pool costs more than it saves
+HASH_POOL_MIN_ROWS = 4
+
+_hash_pool = None
+_hash_pool_pid = None
+
+
+def _get_hash_pool():
+    global _hash_pool, _hash_pool_pid
+    if _hash_pool_pid != os.getpid():
+        # spawn, not fork: web workers run threads (reference data subscriber)
+        _hash_pool = ProcessPoolExecutor(
+            HASH_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+        _hash_pool_pid = os.getpid()
+    return _hash_pool
+
+
+def hash_passwords(passwords):
+    """
+    Encoded passwords, in order, spread over a process pool: PBKDF2 holds
+    the GIL, threads would not run it in parallel. The hasher and salts are
+    picked here, the workers only run hasher.encode().
+    """
+    hasher = get_hasher()
+    salts = [hasher.salt() for _ in passwords]
+    if HASH_WORKERS < 2 or len(passwords) < HASH_POOL_MIN_ROWS:
+        return list(map(hasher.encode, passwords, salts))
+    chunksize = max(1, len(passwords) // (HASH_WORKERS * 4))
+    return list(
+        _get_hash_pool().map(hasher.encode, passwords, salts, chunksize=chunksize)
+    )
+
+
+def _validate_rows(rows):
+    """
+    Validate every (row_number, row) pair. Returns the valid rows as
+    validated_data, the departments they point at by id, and a list of
+    per-row errors.
+    """
+    errors = []
+    validated = []
+    for row_number, row in rows:
+        serializer = EmployeeOnboardRowSerializer(data=row)
+        if serializer.is_valid():
+            validated.append((row_number, serializer.validated_data))
+        else:
+            errors.append({"row": row_number, "errors": serializer.errors})
+
+    # One query each for the whole file
+    existing_usernames = set(
+        User.objects.filter(
+            username__in=[data["username"] for _, data in validated]
+        ).values_list("username", flat=True)
+    )
+    departments = get_references(
+        "department", {data["department"] for _, data in validated}
+    )
+
+    valid_rows = []
+    seen_usernames = set()
+    for row_number, data in validated:
+        row_errors = {}
+        username = data["username"]
+        if username in existing_usernames:
+            row_errors["username"] = ["A user with that username already exists."]
+        elif username in seen_usernames:
+            row_errors["username"] = ["username is duplicated in the file."]
+        if data["department"] not in departments:
+            row_errors["department"] = [
+                f"Invalid pk \"{data['department']}\" - object does not exist."
+            ]
+
+        if row_errors:
+            errors.append({"row": row_number, "errors": row_errors})
+            continue
+
+        seen_usernames.add(username)
+        valid_rows.append(data)
+
+    return valid_rows, departments, errors
+
+
+def onboard_employees(rows, batch_size=ONBOARD_BATCH_SIZE):
+    """
+    Create a user and an employee profile for every valid row: passwords
+    are hashed in a process pool, then users and profiles go in with one
+    bulk_create each, in a single transaction. Invalid rows are reported
+    and skipped. The welcome and credentials emails of the whole batch are
+    sent by one Celery task once the transaction commits.
+    """
+    valid_rows, departments, errors = _validate_rows(list(enumerate(rows, start=1)))
+
+    created = []
+    if valid_rows:
+        # Outside the transaction, hashing takes a while
+        hashed = hash_passwords([data["password"] for data in valid_rows])
+        with transaction.atomic():
+            created = User.objects.bulk_create(
+                [
+                    User(
+                        username=data["username"],
+                        first_name=data.get("first_name", ""),
+                        last_name=data.get("last_name", ""),
+                        email=data["email"],
+                        password=password,
+                    )
+                    for data, password in zip(valid_rows, hashed)
+                ],
+                batch_size=batch_size,
+            )
+            EmployeeProfile.objects.bulk_create(
+                [
+                    EmployeeProfile(
+                        user=user,
+                        department_id=data["department"],
+                        position=data["position"].title(),
+                        is_verified=data["is_verified"],
+                    )
+                    for user, data in zip(created, valid_rows)
+                ],
+                batch_size=batch_size,
+            )
+            # bulk_create skips the post_save receivers, invalidate once instead
+            invalidate(EMPLOYEE_LIST_NAMESPACE)
+
+            recipients = []
+            for data in valid_rows:
+                first_name = data.get("first_name", "").strip().title()
+                last_name = data.get("last_name", "").strip().title()
+                recipients.append(
+                    {
+                        "email": data["email"],
+                        "full_name": f"{first_name} {last_name}".strip(),
+                        "department": departments[data["department"]].full_name.title(),
+                        "position": data["position"].title(),
+                        "password": data["password"],
+                    }
+                )
+            transaction.on_commit(lambda: queue_onboarding_emails(recipients))
+
+    logger.info(
+        f"Employee onboarding: {len(created)} created, {len(errors)} rows rejected"
+    )
+    errors.sort(key=lambda error: error["row"])
+    return created, errors
+
+
+def queue_onboarding_emails(recipients):
+    try:
+        send_onboarding_emails.delay(recipients)
+    except OperationalError:
+        # The employees are committed: failing the request now would only
+        # make the client retry into duplicate usernames
+        logger.error(
+            "Could not queue the onboarding emails of "
+            f"{', '.join(recipient['email'] for recipient in recipients)}",
+            exc_info=True,
+        )
@@ -0,0 +1,196 @@
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+from assets.models import Category, Department
+from assets.services.cache_services import REFERENCE_DATA_NAMESPACE, get_generation
+
+logger = logging.getLogger("assets")
+
+# Categories and departments change a few times a year but are read on most
+# requests. Each table is kept whole in two tiers: a small LRU in every
+# process, in front of a Redis copy keyed on the reference data generation.
+# Writes bump that generation and are broadcast over pub/sub, so every web
+# and Celery worker drops its local copy right away. Without a Redis cache
+# there is no broadcast, and no local tier.
+REFERENCE_MODELS = {"category": Category, "department": Department}
+REFERENCE_LOCAL_MAXSIZE = 32
+# Upper bound on staleness should a broadcast ever be missed
+REFERENCE_LOCAL_TTL = 5 * 60
+REFERENCE_REDIS_TIMEOUT = 24 * 60 * 60
+REFERENCE_CHANNEL = "reference_data:invalidated"
+SUBSCRIBER_RETRY_DELAY = 1
+
+
+class LocalLRUCache:
+    """
+    Thread-safe LRU with a TTL. Every clear() starts a new epoch, and a value
+    read before it is not stored after it.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.epoch = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, epoch):
+        with self._lock:
+            if epoch != self.epoch:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self.epoch += 1
+            self._entries.clear()
+
+
+class ReferenceTable:
+    def __init__(self, rows):
+        self.rows = tuple(rows)
+        self.by_pk = {row.pk: row for row in self.rows}
+
+
+local_cache = LocalLRUCache(REFERENCE_LOCAL_MAXSIZE, REFERENCE_LOCAL_TTL)
+
+# The local tier is only trusted while this process listens to broadcasts
+_listening = threading.Event()
+_subscriber_pid = None
+_subscriber_lock = threading.Lock()
+
+
+def _redis_client():
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+def _listen(client):
+    while True:
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(REFERENCE_CHANNEL)
+            # Whatever was broadcast while disconnected is lost
+            local_cache.clear()
+            _listening.set()
+            for _message in pubsub.listen():
+                local_cache.clear()
+        except Exception:
+            logger.warning("Reference data subscriber disconnected", exc_info=True)
+        _listening.clear()
+        local_cache.clear()
+        time.sleep(SUBSCRIBER_RETRY_DELAY)
+
+
+def local_tier_enabled():
+    client = _redis_client()
+    if client is None:
+        return False
+
+    global _subscriber_pid
+    # Forked workers do not inherit the parent's thread
+    if _subscriber_pid != os.getpid():
+        with _subscriber_lock:
+            if _subscriber_pid != os.getpid():
+                _subscriber_pid = os.getpid()
+                _listening.clear()
+                local_cache.clear()
+                threading.Thread(
+                    target=_listen,
+                    args=(client,),
+                    name="reference-data-subscriber",
+                    daemon=True,
+                ).start()
+    return _listening.is_set()
+
+
+def _get_table(name, refresh=False):
+    use_local = local_tier_enabled()
+    epoch = local_cache.epoch
+    if use_local and not refresh:
+        table = local_cache.get(name)
+        if table is not None:
+            return table
+
+    key = f"reference:{name}:v{get_generation(REFERENCE_DATA_NAMESPACE)}"
+    rows = None if refresh else cache.get(key)
+    if rows is None:
+        rows = list(REFERENCE_MODELS[name].objects.order_by("pk"))
+        cache.set(key, rows, timeout=REFERENCE_REDIS_TIMEOUT)
+
+    table = ReferenceTable(rows)
+    if use_local:
+        local_cache.set(name, table, epoch)
+    return table
+
+
+def get_reference_rows(name):
+    """Every row of a reference table, by primary key. Treat them as read-only."""
+    return _get_table(name).rows
+
+
+def get_reference(name, pk):
+    """A copy of one reference row, None when there is no such row."""
+    row = _get_table(name).by_pk.get(pk)
+    if row is None:
+        # Created after the copies were taken, before its invalidation went out
+        row = _get_table(name, refresh=True).by_pk.get(pk)
+    return copy.copy(row) if row is not None else None
+
+
+def get_references(name, pks):
+    """
+    Copies of the reference rows with these primary keys, by primary key,
+    fresh from the database if any is missing. Unknown keys are left out.
+    """
+    table = _get_table(name)
+    if not set(pks) <= table.by_pk.keys():
+        table = _get_table(name, refresh=True)
+    return {pk: copy.copy(table.by_pk[pk]) for pk in pks if pk in table.by_pk}
+
+
+def get_reference_ids(name, expected=()):
+    """
+    Primary keys of a reference table, fresh from the database if any of
+    `expected` is missing.
+    """
+    ids = set(_get_table(name).by_pk)
+    if not set(expected) <= ids:
+        ids = set(_get_table(name, refresh=True).by_pk)
+    return ids
+
+
+def broadcast_reference_invalidation():
+    local_cache.clear()
+    client = _redis_client()
+    if client is None:
+        return
+    try:
+        client.publish(REFERENCE_CHANNEL, REFERENCE_DATA_NAMESPACE)
+    except Exception:
+        # Other processes fall back on the local TTL
+        logger.warning("Could not broadcast the reference data invalidation")
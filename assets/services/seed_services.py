@@ -0,0 +1,412 @@
+import hashlib
+import io
+import logging
+import math
+import random
+from bisect import bisect
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate, islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from faker import Faker
+
+from assets.models import (
+    Asset,
+    AssetCustody,
+    AssetHistory,
+    Category,
+    Department,
+    EmployeeProfile,
+)
+from assets.services.cache_services import (
+    ASSET_HISTORY_NAMESPACE,
+    ASSET_LIST_NAMESPACE,
+    EMPLOYEE_LIST_NAMESPACE,
+    REFERENCE_DATA_NAMESPACE,
+    invalidate,
+)
+from assets.services.custody_services import rebuild_custody_periods
+from assets.services.stats_services import rebuild_inventory_stats
+
+logger = logging.getLogger("assets")
+
+# Every generated user shares one hash, hashing per row would dominate the run
+SEED_PASSWORD = "Seeded-Passw0rd!"
+GENERATE_BATCH_SIZE = 50000
+NAME_POOL_SIZE = 500
+HISTORY_SPAN_DAYS = 6 * 365
+ASSIGNED_RATIO = 0.8
+UNASSIGN_RATIO = 0.25
+NEVER_ASSIGNED_RATIO = 0.5
+# Pareto shape and cap of the per-employee asset weights: most employees
+# hold a handful of assets, a few (labs, team leads) hold over a hundred
+HOLDER_SKEW = 1.5
+HOLDER_MAX_WEIGHT = 50
+# Benchmark datasets are sized by their asset count
+ASSETS_PER_USER = 10
+
+# Department name, full name, relative headcount
+DEPARTMENTS = [
+    ("ENG", "Engineering", 30),
+    ("QA", "Quality Assurance", 10),
+    ("OPS", "Operations", 8),
+    ("SALES", "Sales", 12),
+    ("SUPPORT", "Customer Support", 14),
+    ("HR", "Human Resources", 4),
+    ("FIN", "Finance", 4),
+    ("MKT", "Marketing", 6),
+    ("IT", "Information Technology", 5),
+    ("LEGAL", "Legal", 2),
+]
+DEPARTMENT_POSITIONS = {
+    "ENG": ["Software Engineer", "Senior Software Engineer", "Team Lead"],
+    "QA": ["QA Engineer", "Test Automation Engineer"],
+    "OPS": ["DevOps Engineer", "Site Reliability Engineer"],
+    "SALES": ["Account Executive", "Sales Manager"],
+    "SUPPORT": ["Support Specialist", "Support Lead"],
+    "HR": ["HR Specialist", "Recruiter"],
+    "FIN": ["Accountant", "Financial Analyst"],
+    "MKT": ["Marketing Specialist", "Designer"],
+    "IT": ["IT Technician", "System Administrator"],
+    "LEGAL": ["Legal Counsel"],
+}
+# Category name, serial number code, relative share, asset models
+CATEGORIES = [
+    ("Laptop", "LT", 30, ["Dell Latitude 5440", "MacBook Pro 14", "ThinkPad T14"]),
+    ("Monitor", "MN", 25, ["LG 27UL500", "Dell P2422H", "Samsung S24"]),
+    ("Keyboard", "KB", 12, ["Logitech K120", "Keychron K2"]),
+    ("Mouse", "MS", 12, ["Logitech M185", "Logitech MX Master 3"]),
+    ("Headset", "HS", 10, ["Jabra Evolve2 40", "Logitech H390"]),
+    ("Docking Station", "DS", 6, ["Dell WD19", "CalDigit TS3"]),
+    ("Phone", "PH", 3, ["iPhone 13", "Pixel 7"]),
+    ("Tablet", "TB", 2, ["iPad Air", "Galaxy Tab S8"]),
+]
+
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _bump_generations():
+    invalidate(
+        ASSET_LIST_NAMESPACE,
+        ASSET_HISTORY_NAMESPACE,
+        EMPLOYEE_LIST_NAMESPACE,
+        REFERENCE_DATA_NAMESPACE,
+    )
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    if value is True or value is False:
+        return "t" if value else "f"
+    if isinstance(value, str):
+        return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+    return str(value)
+
+
+def _copy_rows(cursor, model, fields, rows):
+    """Stream rows into the model's table with one COPY FROM STDIN."""
+    columns = ", ".join(
+        connection.ops.quote_name(model._meta.get_field(name).column) for name in fields
+    )
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(map(_copy_value, row)))
+        buffer.write("\n")
+    buffer.seek(0)
+    table = connection.ops.quote_name(model._meta.db_table)
+    cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", buffer)
+
+
+def _reserve_ids(cursor, model, count):
+    """
+    Take `count` ids from the table's sequence, so rows written with COPY
+    can be referenced before they exist. Concurrent inserts into the same
+    table may land inside the block: run against a quiet database.
+    """
+    if not count:
+        return range(0)
+    cursor.execute(
+        "SELECT nextval(pg_get_serial_sequence(%s, 'id'))", [model._meta.db_table]
+    )
+    first = cursor.fetchone()[0]
+    cursor.execute(
+        "SELECT setval(pg_get_serial_sequence(%s, 'id'), %s)",
+        [model._meta.db_table, first + count - 1],
+    )
+    return range(first, first + count)
+
+
+def _seed_salt(seed):
+    # A salt derived from the seed keeps the password column reproducible,
+    # 22 hex digits carry the 128 bits Django expects of a salt
+    return hashlib.sha256(f"generate_dataset:{seed}".encode()).hexdigest()[:22]
+
+
+def _name_pools(seed):
+    fake = Faker()
+    fake.seed_instance(seed)
+    first_names = sorted({fake.first_name() for _ in range(NAME_POOL_SIZE)})
+    last_names = sorted({fake.last_name() for _ in range(NAME_POOL_SIZE)})
+    return first_names, last_names
+
+
+def _custody_changes(rng, mean):
+    """Number of times an asset changed hands, geometric with the given mean."""
+    if mean <= 1:
+        return 1
+    return 1 + int(math.log(1.0 - rng.random()) / math.log(1.0 - 1.0 / mean))
+
+
+def generate_dataset(
+    employees,
+    assets,
+    history=3,
+    seed=0,
+    prefix="gen",
+    as_of=None,
+    analyze=False,
+    batch_size=GENERATE_BATCH_SIZE,
+):
+    """
+    Generate a realistic dataset with PostgreSQL COPY: `employees` users
+    with profiles, `assets` assets and their custody history.
+
+    - headcount is weighted per department, asset models per category
+    - most employees hold a handful of assets, a few hold many
+    - each asset changed hands `history` times on average; history rows
+      chain previous_user -> new_user, are dated between the purchase date
+      and today, and end with the asset's current holder
+    - assets without a holder are in storage, under repair or, more often
+      the older they are, retired
+
+    Departments and categories are reused by name, usernames and serial
+    numbers start with `prefix` and end with the row's index. Dates run up
+    to midnight UTC of `as_of`, today by default. Every user's password is
+    SEED_PASSWORD, hashed once. The same arguments, `as_of` included,
+    produce the same rows; only the ids taken from the sequences differ.
+
+    With `analyze`, the tables are analyzed once filled. Statistics are not
+    transactional: inside a test they would outlive its rollback.
+    """
+    rng = random.Random(seed)
+    password = make_password(SEED_PASSWORD, salt=_seed_salt(seed))
+    first_names, last_names = _name_pools(seed)
+    as_of = as_of or datetime.now(UTC).date()
+    now = datetime(as_of.year, as_of.month, as_of.day, tzinfo=UTC)
+    start = now - timedelta(days=HISTORY_SPAN_DAYS)
+    sizes = {"employees": employees, "assets": assets, "history": 0}
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        departments = [
+            (
+                Department.objects.get_or_create(
+                    name=name, defaults={"full_name": full_name}
+                )[0],
+                weight,
+            )
+            for name, full_name, weight in DEPARTMENTS
+        ]
+        department_weights = list(accumulate(weight for _, weight in departments))
+        categories = [
+            (Category.objects.get_or_create(name=name)[0], code, weight, models)
+            for name, code, weight, models in CATEGORIES
+        ]
+        category_weights = list(accumulate(weight for _, _, weight, _ in categories))
+
+        user_ids = _reserve_ids(cursor, User, employees)
+        for batch in _batches(enumerate(user_ids), batch_size):
+            users, profiles = [], []
+            for index, user_id in batch:
+                first_name = rng.choice(first_names)
+                last_name = rng.choice(last_names)
+                username = f"{prefix}.{first_name}.{last_name}.{index}".lower()
+                department, _ = departments[
+                    bisect(department_weights, rng.random() * department_weights[-1])
+                ]
+                joined = start + timedelta(
+                    seconds=rng.randrange(HISTORY_SPAN_DAYS * 86400)
+                )
+                users.append(
+                    (
+                        user_id,
+                        password,
+                        False,
+                        username,
+                        first_name,
+                        last_name,
+                        f"{username}@example.com",
+                        False,
+                        True,
+                        joined.isoformat(),
+                    )
+                )
+                profiles.append(
+                    (
+                        user_id,
+                        department.id,
+                        rng.choice(DEPARTMENT_POSITIONS[department.name]),
+                        True,
+                    )
+                )
+            _copy_rows(
+                cursor,
+                User,
+                [
+                    "id",
+                    "password",
+                    "is_superuser",
+                    "username",
+                    "first_name",
+                    "last_name",
+                    "email",
+                    "is_staff",
+                    "is_active",
+                    "date_joined",
+                ],
+                users,
+            )
+            _copy_rows(
+                cursor,
+                EmployeeProfile,
+                ["user", "department", "position", "is_verified"],
+                profiles,
+            )
+            logger.debug(f"Generated {len(users)} employees")
+
+        holder_weights = list(
+            accumulate(
+                min(rng.paretovariate(HOLDER_SKEW), HOLDER_MAX_WEIGHT) for _ in user_ids
+            )
+        )
+
+        def pick_holder():
+            if not user_ids:
+                return None
+            return user_ids[bisect(holder_weights, rng.random() * holder_weights[-1])]
+
+        asset_ids = _reserve_ids(cursor, Asset, assets)
+        for batch in _batches(enumerate(asset_ids), batch_size):
+            asset_rows, history_rows = [], []
+            for index, asset_id in batch:
+                category, code, _, models = categories[
+                    bisect(category_weights, rng.random() * category_weights[-1])
+                ]
+                # Skewed towards recent purchases
+                age_days = int(rng.triangular(0, HISTORY_SPAN_DAYS, 0))
+                purchased = now - timedelta(days=age_days)
+
+                holder = pick_holder() if rng.random() < ASSIGNED_RATIO else None
+                changes = _custody_changes(rng, history) if history else 0
+                if holder is None and rng.random() < NEVER_ASSIGNED_RATIO:
+                    changes = 0
+                holders = []
+                for _ in range(changes - 1):
+                    previous = holders[-1] if holders else None
+                    if previous is not None and rng.random() < UNASSIGN_RATIO:
+                        holders.append(None)
+                    elif (candidate := pick_holder()) != previous:
+                        holders.append(candidate)
+                if changes and holder != (holders[-1] if holders else None):
+                    holders.append(holder)
+
+                dates = sorted(
+                    purchased + timedelta(seconds=rng.randrange(age_days * 86400 + 1))
+                    for _ in holders
+                )
+                previous = None
+                for new_user, changed_at in zip(holders, dates, strict=True):
+                    history_rows.append(
+                        (
+                            asset_id,
+                            previous,
+                            new_user,
+                            changed_at.isoformat(),
+                            "Assigned" if new_user else "Returned to storage",
+                        )
+                    )
+                    previous = new_user
+
+                if holder is not None:
+                    status = "REPAIR" if rng.random() < 0.02 else "IN_USE"
+                elif rng.random() < age_days / HISTORY_SPAN_DAYS:
+                    status = "RETIRED"
+                else:
+                    status = "REPAIR" if rng.random() < 0.2 else "IN_STORAGE"
+                asset_rows.append(
+                    (
+                        asset_id,
+                        rng.choice(models),
+                        f"{prefix.upper()}-{code}-{index:09d}",
+                        category.id,
+                        holder,
+                        purchased.date().isoformat(),
+                        status,
+                        f"{category.name} purchased {purchased:%B %Y}",
+                        (dates[-1] if dates else purchased).isoformat(),
+                    )
+                )
+            _copy_rows(
+                cursor,
+                Asset,
+                [
+                    "id",
+                    "name",
+                    "serial_number",
+                    "category",
+                    "assigned_to",
+                    "purchase_date",
+                    "status",
+                    "description",
+                    "updated_at",
+                ],
+                asset_rows,
+            )
+            _copy_rows(
+                cursor,
+                AssetHistory,
+                ["asset", "previous_user", "new_user", "change_date", "notes"],
+                history_rows,
+            )
+            sizes["history"] += len(history_rows)
+            logger.debug(f"Generated {len(asset_rows)} assets")
+
+        # COPY skips the signals that keep these in sync
+        rebuild_inventory_stats()
+        rebuild_custody_periods()
+        if analyze:
+            for model in (User, EmployeeProfile, Asset, AssetHistory, AssetCustody):
+                table = connection.ops.quote_name(model._meta.db_table)
+                cursor.execute(f"ANALYZE {table}")
+
+    _bump_generations()
+    logger.info(f"Generated dataset: {sizes}")
+    return sizes
+
+
+def dataset_sizes(scale):
+    """Row counts seeded for a scale, `scale` being the number of assets."""
+    return {
+        "departments": len(DEPARTMENTS),
+        "categories": len(CATEGORIES),
+        "users": max(scale // ASSETS_PER_USER, 1),
+        "assets": scale,
+    }
+
+
+def seed_dataset(scale, seed=0, prefix="seed", analyze=False):
+    """
+    Generate the benchmark dataset of `scale` assets: one employee per
+    ASSETS_PER_USER assets and a single history row per assigned asset.
+    """
+    sizes = dataset_sizes(scale)
+    generate_dataset(
+        sizes["users"], scale, history=1, seed=seed, prefix=prefix, analyze=analyze
+    )
+    return sizes
@@ -0,0 +1,184 @@
+import logging
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from django.db import connection, transaction
+from django.db.models import Count
+
+from assets.models import Asset, InventoryStat
+
+logger = logging.getLogger("assets")
+
+DEPARTMENT_LOOKUP = "assigned_to__employee_profile__department_id"
+
+
+def asset_buckets(asset_ids=None):
+    """
+    Count assets per (status, category_id, department_id) with one aggregate
+    query, either for the given ids or for the whole table.
+    """
+    queryset = Asset.objects.all()
+    if asset_ids is not None:
+        if not asset_ids:
+            return {}
+        queryset = queryset.filter(id__in=asset_ids)
+
+    rows = (
+        queryset.order_by()
+        .values("status", "category_id", DEPARTMENT_LOOKUP)
+        .annotate(total=Count("id"))
+    )
+    return {
+        (row["status"], row["category_id"], row[DEPARTMENT_LOOKUP]): row["total"]
+        for row in rows
+    }
+
+
+def locked_asset_buckets(asset_ids):
+    """
+    asset_buckets() for assets about to be written, read with their rows
+    locked until the transaction ends: a concurrent write of the same assets
+    waits, then counts from what this one committed. Must run in a
+    transaction.
+    """
+    if not asset_ids:
+        return {}
+    rows = (
+        Asset.objects.filter(id__in=asset_ids)
+        .select_for_update(of=("self",))
+        .order_by("id")
+        .values_list("status", "category_id", DEPARTMENT_LOOKUP)
+    )
+    return dict(Counter(rows))
+
+
+def apply_bucket_deltas(deltas):
+    """Add each delta to its bucket with a single INSERT ... ON CONFLICT."""
+    deltas = {bucket: delta for bucket, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    table = InventoryStat._meta.db_table
+    values = ", ".join(["(%s, %s, %s, %s)"] * len(deltas))
+    params = [
+        value
+        for (status, category_id, department_id), delta in deltas.items()
+        for value in (status, category_id, department_id, delta)
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (status, category_id, department_id, count) "
+            f"VALUES {values} "
+            "ON CONFLICT ON CONSTRAINT unique_inventory_stat_bucket "
+            f"DO UPDATE SET count = {table}.count + EXCLUDED.count",
+            params,
+        )
+
+
+def record_bucket_changes(before, after):
+    deltas = defaultdict(int)
+    for bucket, total in before.items():
+        deltas[bucket] -= total
+    for bucket, total in after.items():
+        deltas[bucket] += total
+    apply_bucket_deltas(deltas)
+
+
+@contextmanager
+def tracking_inventory_stats(asset_ids):
+    """
+    Wrap a write touching asset_ids: their buckets are counted before and
+    after, and only the difference is applied to the summary table.
+    """
+    before = asset_buckets(asset_ids)
+    yield
+    record_bucket_changes(before, asset_buckets(asset_ids))
+
+
+def rebuild_inventory_stats():
+    with transaction.atomic():
+        # Writers applying their deltas wait for the rebuild, and the count
+        # below starts once those already applied have committed: no delta
+        # lands between the count and the delete to be lost
+        table = connection.ops.quote_name(InventoryStat._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {table} IN EXCLUSIVE MODE")
+        buckets = asset_buckets()
+        InventoryStat.objects.all().delete()
+        InventoryStat.objects.bulk_create(
+            InventoryStat(
+                status=status,
+                category_id=category_id,
+                department_id=department_id,
+                count=total,
+            )
+            for (status, category_id, department_id), total in buckets.items()
+        )
+    logger.info(f"Inventory stats rebuilt: {len(buckets)} buckets")
+    return buckets
+
+
+def find_inventory_stats_drift():
+    """Return {bucket: (stored, actual)} for every bucket that disagrees."""
+    actual = asset_buckets()
+    stored = {
+        (stat.status, stat.category_id, stat.department_id): stat.count
+        for stat in InventoryStat.objects.all()
+    }
+    return {
+        bucket: (stored.get(bucket, 0), actual.get(bucket, 0))
+        for bucket in stored.keys() | actual.keys()
+        if stored.get(bucket, 0) != actual.get(bucket, 0)
+    }
+
+
+def get_inventory_summary():
+    stats = (
+        InventoryStat.objects.filter(count__gt=0)
+        .values(
+            "status",
+            "category_id",
+            "category__name",
+            "department_id",
+            "department__full_name",
+            "count",
+        )
+        .order_by("status", "category_id", "department_id")
+    )
+
+    by_status = defaultdict(int)
+    by_category = {}
+    by_department = {}
+    buckets = []
+    for stat in stats:
+        by_status[stat["status"]] += stat["count"]
+        category = by_category.setdefault(
+            stat["category_id"],
+            {"id": stat["category_id"], "name": stat["category__name"], "count": 0},
+        )
+        category["count"] += stat["count"]
+        department = by_department.setdefault(
+            stat["department_id"],
+            {
+                "id": stat["department_id"],
+                "name": stat["department__full_name"],
+                "count": 0,
+            },
+        )
+        department["count"] += stat["count"]
+        buckets.append(
+            {
+                "status": stat["status"],
+                "category": stat["category__name"],
+                "department": stat["department__full_name"],
+                "count": stat["count"],
+            }
+        )
+
+    return {
+        "total": sum(by_status.values()),
+        "by_status": dict(by_status),
+        "by_category": list(by_category.values()),
+        "by_department": list(by_department.values()),
+        "buckets": buckets,
+    }
@@ -0,0 +1,78 @@
+import logging
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.urls import resolve
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from assets.services.cache_services import get_hot_pages
+
+logger = logging.getLogger("assets")
+
+# Set while a warm-up is queued, so a burst of invalidations queues only one
+WARMING_PENDING_KEY = "page_warming:pending"
+WARMING_PENDING_TIMEOUT = 60
+
+
+def _warming_user(scope):
+    # Never saved: the cached views only check the permission flags
+    if scope == "admin":
+        return User(username="cache-warmer", is_staff=True, is_superuser=True)
+    if scope == "authenticated":
+        return User(username="cache-warmer")
+    return None
+
+
+def get_pages_to_warm():
+    """
+    The configured pages for each of their scopes, then the most requested
+    pages of the last hours, as (scope, absolute url) pairs.
+    """
+    config = settings.CACHE_WARMING
+    base_url = config["BASE_URL"].rstrip("/")
+    pages = {}
+    for path, scopes in config["PAGES"]:
+        for scope in scopes:
+            pages[(scope, f"{base_url}{path}")] = True
+    for scope, url, _hits in get_hot_pages(config["TOP_PAGES"], config["MIN_HITS"]):
+        pages[(scope, url)] = True
+    return list(pages)
+
+
+def warm_page(scope, url):
+    """
+    Render one page through its view, as a user of `scope` would, so that a
+    stale or missing cache entry is rebuilt. Returns the status code.
+    """
+    parts = urlsplit(url)
+    request = APIRequestFactory().get(
+        f"{parts.path}?{parts.query}" if parts.query else parts.path,
+        HTTP_HOST=parts.netloc,
+        secure=parts.scheme == "https",
+    )
+    # Not counted as a hit
+    request.cache_warming = True
+    user = _warming_user(scope)
+    if user is not None:
+        force_authenticate(request, user=user)
+
+    match = resolve(parts.path)
+    return match.func(request, *match.args, **match.kwargs).status_code
+
+
+def warm_pages():
+    warmed = 0
+    for scope, url in get_pages_to_warm():
+        try:
+            status_code = warm_page(scope, url)
+        except Exception:
+            logger.exception(f"Could not warm {url} for {scope} users")
+            continue
+        if status_code == 200:
+            warmed += 1
+        else:
+            logger.warning(f"Warming {url} for {scope} users got {status_code}")
+
+    logger.info(f"Page cache warmed: {warmed} pages")
+    return warmed
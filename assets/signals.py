@@ -1,21 +1,287 @@
+import logging
+
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save
+from django.db import transaction
+from django.db.models.signals import (
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
+from kombu.exceptions import OperationalError
+
+from .models import Asset, AssetHistory, Category, Department, EmployeeProfile
+from .services.cache_services import (
+    ASSET_HISTORY_NAMESPACE,
+    ASSET_LIST_NAMESPACE,
+    EMPLOYEE_LIST_NAMESPACE,
+    REFERENCE_DATA_NAMESPACE,
+    asset_detail_key,
+    cache_invalidated,
+    employee_detail_key,
+    invalidate,
+)
+from .services.custody_services import record_custody_changes
+from .services.reference_services import broadcast_reference_invalidation
+from .services.stats_services import (
+    asset_buckets,
+    locked_asset_buckets,
+    record_bucket_changes,
+)
+from .services.warming_services import WARMING_PENDING_KEY, WARMING_PENDING_TIMEOUT
+from .tasks import warm_page_cache
 
-from .models import Asset, AssetHistory
+logger = logging.getLogger("assets")
 
 
 @receiver([post_save, post_delete], sender=Asset)
 def invalidate_asset_list_cache(sender, instance, **kwargs):
-    cache.delete_pattern("*asset_list*")
+    invalidate(ASSET_LIST_NAMESPACE)
+
+
+# User fields that the cached employee and asset payloads serialize. Saves
+# touching none of them, like the last_login update of every login, leave
+# the caches alone
+CACHED_USER_FIELDS = (
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "is_superuser",
+    "date_joined",
+)
+
+
+# Snapshot taken when the row is loaded, so comparing costs no query
+@receiver(post_init, sender=User)
+def remember_cached_user_fields(sender, instance, **kwargs):
+    instance._cached_fields_before = {
+        field: instance.__dict__[field]
+        for field in CACHED_USER_FIELDS
+        if field in instance.__dict__
+    }
+
+
+def cached_user_fields_changed(instance, created, update_fields):
+    if created:
+        return True
+    if update_fields is not None and not set(update_fields) & set(CACHED_USER_FIELDS):
+        return False
+    before = instance._cached_fields_before
+    # A field deferred at load time cannot be compared
+    return any(
+        field not in before or getattr(instance, field) != before[field]
+        for field in CACHED_USER_FIELDS
+    )
 
 
-@receiver([post_save, post_delete], sender=User)
+@receiver(post_save, sender=User)
+def invalidate_employee_list_cache_on_user_save(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    if cached_user_fields_changed(instance, created, update_fields):
+        invalidate(EMPLOYEE_LIST_NAMESPACE)
+
+
+@receiver(post_delete, sender=User)
+@receiver([post_save, post_delete], sender=EmployeeProfile)
 def invalidate_employee_list_cache(sender, instance, **kwargs):
-    cache.delete_pattern("*employee_list*")
+    invalidate(EMPLOYEE_LIST_NAMESPACE)
 
 
 @receiver([post_save, post_delete], sender=AssetHistory)
 def invalidate_asset_history_list_cache(sender, instance, **kwargs):
-    cache.delete_pattern("*asset_history*")
+    invalidate(ASSET_HISTORY_NAMESPACE)
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Department)
+def invalidate_reference_data_cache(sender, instance, **kwargs):
+    invalidate(REFERENCE_DATA_NAMESPACE)
+
+
+# Once invalidations are flushed, a worker renders the hottest pages again
+# before a user has to. One warm-up is queued at a time
+@receiver(cache_invalidated)
+def schedule_page_cache_warming(sender, **kwargs):
+    if settings.CACHE_WARMING["ENABLED"] and cache.add(
+        WARMING_PENDING_KEY, True, timeout=WARMING_PENDING_TIMEOUT
+    ):
+        try:
+            warm_page_cache.delay()
+        except OperationalError:
+            # Best effort: the write has committed already, the next
+            # invalidation tries again
+            cache.delete(WARMING_PENDING_KEY)
+            logger.warning("Could not queue the page cache warm-up", exc_info=True)
+
+
+@receiver(cache_invalidated)
+def broadcast_reference_data_invalidation(sender, namespaces, **kwargs):
+    if REFERENCE_DATA_NAMESPACE in namespaces:
+        broadcast_reference_invalidation()
+
+
+# ----- DETAIL CACHE ----- #
+# Asset details embed the category and the assignee's name and email,
+# employee details embed the profile and its department. Category and
+# department writes bump the reference data generation, which is part of
+# every detail key (see stored_detail_keys).
+
+
+def asset_detail_keys(assets):
+    return [
+        asset_detail_key(asset_id) for asset_id in assets.values_list("id", flat=True)
+    ]
+
+
+@receiver([post_save, post_delete], sender=Asset)
+def invalidate_asset_detail_cache(sender, instance, **kwargs):
+    invalidate(detail_keys=[asset_detail_key(instance.pk)])
+
+
+@receiver([post_save, post_delete], sender=EmployeeProfile)
+def invalidate_profile_detail_cache(sender, instance, **kwargs):
+    invalidate(detail_keys=[employee_detail_key(instance.user_id)])
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_detail_cache(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    if not cached_user_fields_changed(instance, created, update_fields):
+        return
+    invalidate(
+        detail_keys=[employee_detail_key(instance.pk)]
+        + asset_detail_keys(Asset.objects.filter(assigned_to=instance))
+    )
+
+
+# Registered after both invalidation receivers, which compare against the
+# snapshot first; the next save of this instance compares against this one
+@receiver(post_save, sender=User)
+def reset_cached_user_fields(sender, instance, **kwargs):
+    remember_cached_user_fields(sender, instance)
+
+
+# SET_NULL runs as a plain UPDATE, so the affected assets are collected
+# before the delete and dropped after it
+@receiver(pre_delete, sender=User)
+def remember_user_detail_keys(sender, instance, **kwargs):
+    instance._detail_cache_keys = [
+        employee_detail_key(instance.pk)
+    ] + asset_detail_keys(Asset.objects.filter(assigned_to=instance))
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_detail_cache(sender, instance, **kwargs):
+    invalidate(detail_keys=getattr(instance, "_detail_cache_keys", []))
+
+
+# ----- INVENTORY STATS ----- #
+# Each write counts the buckets of the assets it touches before and after,
+# and only the difference goes to the InventoryStat table.
+
+
+def remember_asset_buckets(instance, asset_ids, lock=False):
+    instance._inventory_stat_ids = asset_ids
+    instance._inventory_stat_before = (
+        locked_asset_buckets(asset_ids) if lock else asset_buckets(asset_ids)
+    )
+
+
+def record_asset_buckets(instance):
+    asset_ids = getattr(instance, "_inventory_stat_ids", None)
+    if asset_ids is None:
+        return
+    record_bucket_changes(instance._inventory_stat_before, asset_buckets(asset_ids))
+    del instance._inventory_stat_ids, instance._inventory_stat_before
+
+
+@receiver([pre_save, pre_delete], sender=Asset)
+def remember_asset_stats(sender, instance, **kwargs):
+    # Two concurrent saves of one asset must not both apply the same delta.
+    # Outside a transaction there is nothing to hold the lock
+    remember_asset_buckets(
+        instance,
+        [instance.pk] if instance.pk else [],
+        lock=transaction.get_connection().in_atomic_block,
+    )
+
+
+@receiver(post_save, sender=Asset)
+def record_asset_stats(sender, instance, created, **kwargs):
+    if created:
+        instance._inventory_stat_ids = [instance.pk]
+    record_asset_buckets(instance)
+
+
+@receiver(post_delete, sender=Asset)
+def record_deleted_asset_stats(sender, instance, **kwargs):
+    record_bucket_changes(getattr(instance, "_inventory_stat_before", {}), {})
+
+
+# Moving an employee to another department moves their assets with them
+@receiver(pre_save, sender=EmployeeProfile)
+def remember_employee_asset_stats(sender, instance, **kwargs):
+    remember_asset_buckets(
+        instance,
+        list(
+            Asset.objects.filter(assigned_to_id=instance.user_id).values_list(
+                "id", flat=True
+            )
+        ),
+        lock=transaction.get_connection().in_atomic_block,
+    )
+
+
+# Deleting a user, category or department SET_NULLs (or cascades) without
+# saving the assets, so their buckets are tracked around the delete
+@receiver(pre_delete, sender=User)
+def remember_user_asset_stats(sender, instance, **kwargs):
+    remember_asset_buckets(
+        instance,
+        list(instance.assets.values_list("id", flat=True)),
+    )
+
+
+@receiver(pre_delete, sender=Category)
+def remember_category_asset_stats(sender, instance, **kwargs):
+    remember_asset_buckets(
+        instance,
+        list(Asset.objects.filter(category=instance).values_list("id", flat=True)),
+    )
+
+
+@receiver(pre_delete, sender=Department)
+def remember_department_asset_stats(sender, instance, **kwargs):
+    remember_asset_buckets(
+        instance,
+        list(
+            Asset.objects.filter(
+                assigned_to__employee_profile__department=instance
+            ).values_list("id", flat=True)
+        ),
+    )
+
+
+@receiver(post_save, sender=EmployeeProfile)
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Department)
+def record_related_asset_stats(sender, instance, **kwargs):
+    record_asset_buckets(instance)
+
+
+# ----- CUSTODY PERIODS ----- #
+# Bulk writers (import, bulk reassign) call record_custody_changes themselves
+
+
+@receiver(post_save, sender=AssetHistory)
+def record_history_custody(sender, instance, created, **kwargs):
+    if created:
+        record_custody_changes([instance])
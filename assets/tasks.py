@@ -1,12 +1,16 @@
 from celery import shared_task
-from django.core.mail import EmailMultiAlternatives
+from celery.signals import worker_ready
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.html import strip_tags
 
+from assets.services.warming_services import WARMING_PENDING_KEY, warm_pages
 
-@shared_task
-def send_welcome_email(user_email, full_name, department, position):
+
+def welcome_email_message(user_email, full_name, department, position):
     subject = "Welcome to MySite!"
     current_year = timezone.now().year
 
@@ -26,7 +30,12 @@ def send_welcome_email(user_email, full_name, department, position):
         subject, text_content, "noreply@dev_asset_manager.com", [user_email]
     )
     email.attach_alternative(html_content, "text/html")
-    email.send()
+    return email
+
+
+@shared_task
+def send_welcome_email(user_email, full_name, department, position):
+    welcome_email_message(user_email, full_name, department, position).send()
 
 
 @shared_task
@@ -49,8 +58,7 @@ def send_otp_email(email, otp):
     email.send()
 
 
-@shared_task
-def send_change_password(email, current_password):
+def change_password_message(email, current_password):
     current_year = timezone.now().year
     subject = "Secure Your Account: Dev Assets Manager Credentials Inside"
 
@@ -66,4 +74,45 @@ def send_change_password(email, current_password):
     )
 
     email.attach_alternative(html_content, "text/html")
-    email.send()
+    return email
+
+
+@shared_task
+def send_change_password(email, current_password):
+    change_password_message(email, current_password).send()
+
+
+@shared_task
+def send_onboarding_emails(recipients):
+    """
+    Welcome and credentials emails of a whole onboarding batch, sent over a
+    single SMTP connection.
+    """
+    messages = []
+    for recipient in recipients:
+        messages.append(
+            welcome_email_message(
+                recipient["email"],
+                recipient["full_name"],
+                recipient["department"],
+                recipient["position"],
+            )
+        )
+        messages.append(
+            change_password_message(recipient["email"], recipient["password"])
+        )
+    with get_connection() as connection:
+        return connection.send_messages(messages)
+
+
+@shared_task
+def warm_page_cache():
+    # Invalidations from now on need another run
+    cache.delete(WARMING_PENDING_KEY)
+    return warm_pages()
+
+
+@worker_ready.connect
+def warm_page_cache_at_boot(sender, **kwargs):
+    if settings.CACHE_WARMING["ENABLED"]:
+        warm_page_cache.delay()
@@ -1,16 +1,26 @@
 from django.urls import path
 
 from assets.views import (
+    AssetBulkReassignAPIView,
     AssetDetailsView,
+    AssetExportAPIView,
     AssetHistoryListAPIView,
+    AssetHistoryTimelineAPIView,
+    AssetHolderAtAPIView,
+    AssetImportAPIView,
     AssetListCreateAPIView,
     AuthEmployeeDetailsVIEW,
     CategoryDropDown,
+    EmployeeAssetsHeldAtAPIView,
     EmployeeDepartmentDropdown,
     EmployeeDetailsView,
     EmployeeDropDown,
+    EmployeeHistoryTimelineAPIView,
     EmployeeListCreateAPIView,
+    EmployeeOnboardAPIView,
     EmployeeSideDetailsUpdate,
+    FormBootstrapAPIView,
+    InventoryStatsAPIView,
     UserAssetDetailsView,
     UserOwnAssetDetailsAPIView,
 )
@@ -25,6 +35,14 @@ urlpatterns = [
     # Assets Routes
     path("assets/", AssetListCreateAPIView.as_view(), name="asset_list_create"),
     path("assets/<int:id>/", AssetDetailsView.as_view(), name="asset_list_detail"),
+    path("assets/export/", AssetExportAPIView.as_view(), name="asset_export"),
+    path("assets/import/", AssetImportAPIView.as_view(), name="asset_import"),
+    path(
+        "assets/reassign/",
+        AssetBulkReassignAPIView.as_view(),
+        name="asset_bulk_reassign",
+    ),
+    path("assets/stats/", InventoryStatsAPIView.as_view(), name="inventory_stats"),
     path(
         "assets/employee/<int:id>/",
         UserAssetDetailsView.as_view(),
@@ -34,6 +52,11 @@ urlpatterns = [
     path(
         "employees/", EmployeeListCreateAPIView.as_view(), name="employee_list_create"
     ),
+    path(
+        "employees/onboard/",
+        EmployeeOnboardAPIView.as_view(),
+        name="employee_onboard",
+    ),
     path("employees/<int:id>/", EmployeeDetailsView.as_view(), name="employee_details"),
     path(
         "employees-side/<int:id>/",
@@ -60,13 +83,38 @@ urlpatterns = [
         EmployeeDepartmentDropdown.as_view(),
         name="department_dropdown",
     ),
+    path(
+        "forms/bootstrap/",
+        FormBootstrapAPIView.as_view(),
+        name="form_bootstrap",
+    ),
     path(
         "assets/history/", AssetHistoryListAPIView.as_view(), name="asset_history_list"
     ),
+    path(
+        "assets/<int:id>/history/",
+        AssetHistoryTimelineAPIView.as_view(),
+        name="asset_history_timeline",
+    ),
+    path(
+        "employees/<int:id>/history/",
+        EmployeeHistoryTimelineAPIView.as_view(),
+        name="employee_history_timeline",
+    ),
+    path(
+        "assets/<int:id>/holder/",
+        AssetHolderAtAPIView.as_view(),
+        name="asset_holder_at",
+    ),
+    path(
+        "employees/<int:id>/assets-held/",
+        EmployeeAssetsHeldAtAPIView.as_view(),
+        name="employee_assets_held_at",
+    ),
     # OTP Routes and Auth
     path("auth/me/", AuthEmployeeDetailsVIEW.as_view(), name="auth_employee_details"),
     path("forget-password/", RequestOTPView.as_view(), name="change_password"),
-    path("verify-otp/", VerifyOTPView.as_view(), name="asset_history_list"),
+    path("verify-otp/", VerifyOTPView.as_view(), name="verify_otp"),
     path("reset-password/", ResetPasswordView.as_view(), name="reset_password"),
     path("change-password/", ChangePassword.as_view(), name="change-password"),
 ]
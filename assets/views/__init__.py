@@ -1,17 +1,29 @@
 from assets.views.assets_views import (
     AssetListCreateAPIView,
+    AssetExportAPIView,
+    AssetImportAPIView,
+    AssetBulkReassignAPIView,
+    InventoryStatsAPIView,
     AssetDetailsView,
     UserAssetDetailsView,
     UserOwnAssetDetailsAPIView,
 )
-from assets.views.assets_history_views import AssetHistoryListAPIView
+from assets.views.assets_history_views import (
+    AssetHistoryListAPIView,
+    AssetHistoryTimelineAPIView,
+    AssetHolderAtAPIView,
+    EmployeeAssetsHeldAtAPIView,
+    EmployeeHistoryTimelineAPIView,
+)
 from assets.views.employee_views import (
     EmployeeListCreateAPIView,
     EmployeeDetailsView,
+    EmployeeOnboardAPIView,
     EmployeeSideDetailsUpdate,
     AuthEmployeeDetailsVIEW,
     EmployeeDropDown,
     CategoryDropDown,
     EmployeeDepartmentDropdown,
+    FormBootstrapAPIView,
 )
 from assets.views.oidc_views import profile_view, logout_view
@@ -1,38 +1,128 @@
 import logging
 import time
 
+from django.contrib.auth.models import User
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from rest_framework import filters, generics
-from rest_framework.pagination import PageNumberPagination
-from rest_framework.permissions import IsAuthenticated
+from rest_framework import filters, generics, status
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from assets.models import AssetHistory
-from assets.serializers.asset_serializer import AssetHistorySerializer
+from assets.models import Asset, AssetHistory
+from assets.pagination import OptionalCursorPagination
+from assets.projections import ProjectedListMixin
+from assets.serializers.asset_serializer import (
+    AssetHistorySerializer,
+    CustodyAtSerializer,
+)
+from assets.services.cache_services import (
+    ASSET_HISTORY_NAMESPACE,
+    stale_while_revalidate_page,
+)
+from assets.services.custody_services import get_assets_held_at, get_holder_at
 
 logger = logging.getLogger("assets")
 
 
-class AssetHistoryPagination(PageNumberPagination):
+class AssetHistoryPagination(OptionalCursorPagination):
     page_size = 10
     max_page_size = 100
 
 
-class AssetHistoryListAPIView(generics.ListAPIView):
-    queryset = AssetHistory.objects.prefetch_related(
-        "previous_user", "new_user"
+class AssetHistoryListAPIView(ProjectedListMixin, generics.ListAPIView):
+    queryset = AssetHistory.objects.select_related(
+        "asset", "previous_user", "new_user"
     ).order_by("-id")
     serializer_class = AssetHistorySerializer
     permission_classes = [IsAuthenticated]
+    query_budget = 2
     pagination_class = AssetHistoryPagination
 
     filter_backends = [filters.SearchFilter]
-    search_fields = ["assets__name", "asset_serial_number"]
+    search_fields = ["asset__name", "asset__serial_number"]
 
-    @method_decorator(cache_page(60 * 15, key_prefix="asset_history"))
+    @method_decorator(stale_while_revalidate_page(60 * 15, ASSET_HISTORY_NAMESPACE))
     def list(self, request, *args, **kwargs):
         return super().list(request, request, *args, **kwargs)
 
     def get_queryset(self):
         time.sleep(2)
         return super().get_queryset()
+
+
+class HistoryTimelinePagination(CursorPagination):
+    # Matches the (asset|new_user, change_date DESC, id DESC) indexes: a page
+    # is one index seek from the cursor, whatever the size of the table
+    ordering = ("-change_date", "-id")
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class HistoryTimelineMixin(ProjectedListMixin):
+    """
+    Newest-first history of one object, keyset paginated. Subclasses name
+    the filtered column and the model the URL id points at.
+    """
+
+    queryset = AssetHistory.objects.select_related("asset", "previous_user", "new_user")
+    serializer_class = AssetHistorySerializer
+    pagination_class = HistoryTimelinePagination
+    filter_backends = []
+    query_budget = 2
+
+    timeline_field = None
+    timeline_model = None
+
+    def get_queryset(self):
+        object_id = self.kwargs["id"]
+        if not self.timeline_model.objects.filter(id=object_id).exists():
+            raise NotFound()
+        return super().get_queryset().filter(**{self.timeline_field: object_id})
+
+
+# Custody timeline of one asset
+class AssetHistoryTimelineAPIView(HistoryTimelineMixin, generics.ListAPIView):
+    permission_classes = [IsAuthenticated]
+    timeline_field = "asset_id"
+    timeline_model = Asset
+
+
+# Assets handed to one employee, newest first
+class EmployeeHistoryTimelineAPIView(HistoryTimelineMixin, generics.ListAPIView):
+    permission_classes = [IsAdminUser, IsAuthenticated]
+    timeline_field = "new_user_id"
+    timeline_model = User
+
+
+class CustodyAtAPIView(APIView):
+    """
+    Point-in-time custody lookup: GET ?at=<ISO 8601 datetime or date>,
+    defaulting to now. Answered from AssetCustody with a single query.
+    """
+
+    permission_classes = [IsAdminUser, IsAuthenticated]
+    query_budget = 1
+
+    lookup = None
+
+    def get(self, request, id):
+        serializer = CustodyAtSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        result = self.lookup(id, serializer.validated_data["at"])
+        if result is None:
+            raise NotFound()
+        return Response(result, status=status.HTTP_200_OK)
+
+
+# Who held the asset at a given time
+class AssetHolderAtAPIView(CustodyAtAPIView):
+    lookup = staticmethod(get_holder_at)
+
+
+# Every asset an employee held at a given time
+class EmployeeAssetsHeldAtAPIView(CustodyAtAPIView):
+    lookup = staticmethod(get_assets_held_at)
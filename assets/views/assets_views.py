@@ -1,37 +1,88 @@
+import csv
+import json
 import logging
 import time
 
 from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, generics
+from rest_framework import filters, generics, status
+from rest_framework.parsers import JSONParser, MultiPartParser
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from assets.filters import AssetFilter
+from assets.filters import AssetFilter, AssetFullTextSearchFilter
 from assets.models import Asset
+from assets.pagination import OptionalCursorPagination
 from assets.permissions import IsOwnerAssetsOrReadOnly
+from assets.projections import ProjectedListMixin
 from assets.serializers.asset_serializer import (
     AssetCreateSerializer,
     AssetDetailSerializer,
     AssetListSerializer,
+    AssetReassignSerializer,
     UserAssetListSerializer,
     UserAssetSerializer,
 )
+from assets.services.asset_services import (
+    IMPORT_MAX_ROWS,
+    import_assets,
+    read_csv_rows,
+    reassign_assets,
+)
+from assets.services.cache_services import (
+    ASSET_LIST_NAMESPACE,
+    EMPLOYEE_LIST_NAMESPACE,
+    REFERENCE_DATA_NAMESPACE,
+    asset_detail_key,
+    collection_etag,
+    get_generation,
+    get_or_set_detail,
+    make_etag,
+    stale_while_revalidate_page,
+)
+from assets.services.stats_services import get_inventory_summary
 
 logger = logging.getLogger("assets")
 
 
+def asset_list_etag(request, *args, **kwargs):
+    return collection_etag(request, ASSET_LIST_NAMESPACE, REFERENCE_DATA_NAMESPACE)
+
+
+def asset_detail_etag(request, *args, **kwargs):
+    updated_at = (
+        Asset.objects.filter(id=kwargs["id"])
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+    if updated_at is None:
+        return None
+    # The payload also embeds the assignee and the category
+    return make_etag(
+        kwargs["id"],
+        updated_at.isoformat(),
+        get_generation(EMPLOYEE_LIST_NAMESPACE),
+        get_generation(REFERENCE_DATA_NAMESPACE),
+    )
+
+
 # CREATE/GET view for Asset
-class AssetListCreateAPIView(generics.ListCreateAPIView):
+class AssetListCreateAPIView(ProjectedListMixin, generics.ListCreateAPIView):
     queryset = Asset.objects.select_related("category", "assigned_to").order_by("-id")
     serializer_class = AssetListSerializer
     permission_classes = [IsAuthenticated]
+    query_budget = {"GET": 2, "POST": 9}
+    pagination_class = OptionalCursorPagination
 
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        AssetFullTextSearchFilter,
         filters.OrderingFilter,
     ]
     filterset_class = AssetFilter
@@ -40,7 +91,12 @@ class AssetListCreateAPIView(generics.ListCreateAPIView):
     search_fields = ["name", "serial_number", "description"]
 
     # 15 MINUTES OF CACHING
-    @method_decorator(cache_page(60 * 15, key_prefix="asset_list"))
+    @method_decorator(condition(etag_func=asset_list_etag))
+    @method_decorator(
+        stale_while_revalidate_page(
+            60 * 15, ASSET_LIST_NAMESPACE, REFERENCE_DATA_NAMESPACE
+        )
+    )
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
@@ -65,6 +121,15 @@ class AssetDetailsView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = AssetCreateSerializer
     lookup_field = "id"
     permission_classes = [IsAdminUser]
+    query_budget = {"GET": 2, "PUT": 7, "PATCH": 7, "DELETE": 7}
+
+    @method_decorator(condition(etag_func=asset_detail_etag))
+    def retrieve(self, request, *args, **kwargs):
+        payload = get_or_set_detail(
+            asset_detail_key(kwargs["id"]),
+            lambda: self.get_serializer(self.get_object()).data,
+        )
+        return Response(payload)
 
     def get_serializer_class(self):
         if self.request.method == "GET":
@@ -87,11 +152,13 @@ class UserAssetDetailsView(generics.RetrieveAPIView):
     lookup_field = "id"
     serializer_class = UserAssetListSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
+    query_budget = 3
 
 
 # Getting Own Assets of User
 class UserOwnAssetDetailsAPIView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated, IsOwnerAssetsOrReadOnly]
+    query_budget = 2
     queryset = User.objects.prefetch_related(
         Prefetch(
             "assets",
@@ -100,3 +167,133 @@ class UserOwnAssetDetailsAPIView(generics.RetrieveAPIView):
     )
     serializer_class = UserAssetSerializer
     lookup_field = "id"
+
+
+class Echo:
+    """Pseudo-buffer for csv.writer: write() hands the encoded row back."""
+
+    def write(self, value):
+        return value
+
+
+# Streaming export of the whole (filtered) inventory
+class AssetExportAPIView(generics.GenericAPIView):
+    queryset = Asset.objects.order_by("id")
+    permission_classes = [IsAuthenticated]
+    query_budget = 1
+    pagination_class = None
+
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = AssetFilter
+
+    # Output column -> values() lookup, related columns are joined in SQL
+    export_fields = {
+        "id": "id",
+        "name": "name",
+        "serial_number": "serial_number",
+        "category": "category__name",
+        "status": "status",
+        "purchase_date": "purchase_date",
+        "assigned_to": "assigned_to__email",
+        "description": "description",
+    }
+    chunk_size = 2000
+
+    def get(self, request, *args, **kwargs):
+        output = request.query_params.get("output", "csv").lower()
+        if output not in ("csv", "ndjson"):
+            return Response(
+                {"error": "output must be 'csv' or 'ndjson'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Server-side cursor: memory stays flat whatever the table size
+        rows = (
+            self.filter_queryset(self.get_queryset())
+            .values_list(*self.export_fields.values())
+            .iterator(chunk_size=self.chunk_size)
+        )
+
+        if output == "csv":
+            content, content_type = self.stream_csv(rows), "text/csv"
+        else:
+            content, content_type = self.stream_ndjson(rows), "application/x-ndjson"
+
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="assets.{output}"'
+        return response
+
+    def stream_csv(self, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.export_fields.keys())
+        for row in rows:
+            yield writer.writerow(row)
+
+    def stream_ndjson(self, rows):
+        columns = list(self.export_fields.keys())
+        for row in rows:
+            yield json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+# Bulk import from a JSON list or an uploaded CSV file
+class AssetImportAPIView(APIView):
+    permission_classes = [IsAdminUser]
+    query_budget = 7
+    parser_classes = [JSONParser, MultiPartParser]
+
+    def post(self, request):
+        uploaded_file = request.FILES.get("file")
+        if uploaded_file:
+            rows = read_csv_rows(uploaded_file)
+        else:
+            rows = request.data
+
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {"error": "Send a non-empty JSON list or a CSV file"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(rows) > IMPORT_MAX_ROWS:
+            return Response(
+                {"error": f"Import is limited to {IMPORT_MAX_ROWS} rows"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        created, errors = import_assets(rows)
+        return Response(
+            {"created": len(created), "failed": len(errors), "errors": errors},
+            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST,
+        )
+
+
+# Moving many assets to one employee (or back to storage) at once
+class AssetBulkReassignAPIView(APIView):
+    permission_classes = [IsAdminUser]
+    query_budget = 9
+
+    def post(self, request):
+        serializer = AssetReassignSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        reassigned_ids = reassign_assets(
+            serializer.validated_data["asset_ids"],
+            serializer.validated_data["assigned_to"],
+            serializer.validated_data["notes"],
+        )
+        return Response(
+            {
+                "reassigned": reassigned_ids,
+                "unchanged": len(serializer.validated_data["asset_ids"])
+                - len(reassigned_ids),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+# Dashboard counts, read from the InventoryStat summary table
+class InventoryStatsAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+    query_budget = 1
+
+    def get(self, request):
+        return Response(get_inventory_summary(), status=status.HTTP_200_OK)
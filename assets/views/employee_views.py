@@ -3,16 +3,22 @@ import time
 
 from django.contrib.auth.models import User
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, generics
+from rest_framework import filters, generics, status
 from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.parsers import JSONParser, MultiPartParser
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from assets.filters import EmployeeFilter
+from assets.filters import EmployeeFilter, LowerFullName
 from assets.models import Category, Department
+from assets.pagination import OptionalCursorPagination
 from assets.permissions import IsOwnerOrReadOnly
+from assets.projections import ProjectedListMixin
 from assets.serializers.employee_serializer import (
+    EMPLOYEE_TYPEAHEAD_LIMIT,
     CategoryDropdownSerializer,
     DepartmentDropdownSerializer,
     EmployeeCreateSerializer,
@@ -20,18 +26,52 @@ from assets.serializers.employee_serializer import (
     EmployeeDropdownSerializer,
     EmployeeListSerializer,
     EmployeeSideUpdateSerializer,
+    EmployeeTypeaheadSerializer,
     EmployeeUpdateSerializer,
 )
+from assets.services.asset_services import read_csv_rows
+from assets.services.cache_services import (
+    EMPLOYEE_LIST_NAMESPACE,
+    REFERENCE_DATA_NAMESPACE,
+    collection_etag,
+    employee_detail_key,
+    get_generation,
+    get_or_set_detail,
+    make_etag,
+    stale_while_revalidate_page,
+)
+from assets.services.employee_services import ONBOARD_MAX_ROWS, onboard_employees
+from assets.services.reference_services import get_reference_rows
 
 logger = logging.getLogger("assets")
 
 
-class EmployeeListCreateAPIView(generics.ListCreateAPIView):
+def employee_list_etag(request, *args, **kwargs):
+    return collection_etag(request, EMPLOYEE_LIST_NAMESPACE, REFERENCE_DATA_NAMESPACE)
+
+
+def employee_detail_etag(request, *args, **kwargs):
+    # No ETag for a missing user, or `If-None-Match: *` would get a 304
+    if not User.objects.filter(id=kwargs["id"]).exists():
+        return None
+    # auth.User has no row version; any user or profile write bumps the
+    # employee generation, which is cheap to read and never misses a change
+    return make_etag(
+        "employee",
+        kwargs["id"],
+        get_generation(EMPLOYEE_LIST_NAMESPACE),
+        get_generation(REFERENCE_DATA_NAMESPACE),
+    )
+
+
+class EmployeeListCreateAPIView(ProjectedListMixin, generics.ListCreateAPIView):
     queryset = User.objects.select_related(
         "employee_profile", "employee_profile__department"
     ).order_by("-id")
     serializer_class = EmployeeListSerializer
     permission_classes = [IsAdminUser, IsAuthenticated]
+    query_budget = {"GET": 2, "POST": 7}
+    pagination_class = OptionalCursorPagination
 
     filter_backends = [
         DjangoFilterBackend,
@@ -41,7 +81,12 @@ class EmployeeListCreateAPIView(generics.ListCreateAPIView):
     filterset_class = EmployeeFilter
     search_fields = ["username", "=email", "first_name", "last_name"]
 
-    @method_decorator(cache_page(60 * 15, key_prefix="employee_list"))
+    @method_decorator(condition(etag_func=employee_list_etag))
+    @method_decorator(
+        stale_while_revalidate_page(
+            60 * 15, EMPLOYEE_LIST_NAMESPACE, REFERENCE_DATA_NAMESPACE
+        )
+    )
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
@@ -60,14 +105,58 @@ class EmployeeListCreateAPIView(generics.ListCreateAPIView):
         return [IsAdminUser()]
 
 
+# Bulk onboarding from a JSON list or an uploaded CSV file
+class EmployeeOnboardAPIView(APIView):
+    permission_classes = [IsAdminUser]
+    query_budget = 7
+    parser_classes = [JSONParser, MultiPartParser]
+
+    def post(self, request):
+        uploaded_file = request.FILES.get("file")
+        if uploaded_file:
+            rows = read_csv_rows(uploaded_file)
+        else:
+            rows = request.data
+
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {"error": "Send a non-empty JSON list or a CSV file"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(rows) > ONBOARD_MAX_ROWS:
+            return Response(
+                {"error": f"Onboarding is limited to {ONBOARD_MAX_ROWS} rows"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        created, errors = onboard_employees(rows)
+        return Response(
+            {
+                "created": [user.id for user in created],
+                "failed": len(errors),
+                "errors": errors,
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST,
+        )
+
+
 class EmployeeDetailsView(generics.RetrieveUpdateDestroyAPIView):
     queryset = User.objects.select_related(
         "employee_profile", "employee_profile__department"
     ).order_by("-id")
     serializer_class = EmployeeUpdateSerializer
     permission_classes = [IsAdminUser, IsAuthenticated]
+    query_budget = {"GET": 2, "PUT": 10, "PATCH": 10, "DELETE": 18}
     lookup_field = "id"
 
+    @method_decorator(condition(etag_func=employee_detail_etag))
+    def retrieve(self, request, *args, **kwargs):
+        payload = get_or_set_detail(
+            employee_detail_key(kwargs["id"]),
+            lambda: self.get_serializer(self.get_object()).data,
+        )
+        return Response(payload)
+
     def get_serializer_class(self):
         if self.request.method == "GET":
             return EmployeeDetailsSerializer
@@ -85,20 +174,46 @@ class EmployeeSideDetailsUpdate(generics.RetrieveUpdateAPIView):
         "employee_profile", "employee_profile__department"
     )
     permission_classes = [IsOwnerOrReadOnly, IsAuthenticated]
+    query_budget = {"GET": 1, "PUT": 3, "PATCH": 3}
     serializer_class = EmployeeSideUpdateSerializer
     lookup_field = "id"
 
 
+def typeahead_employees(prefix="", limit=EMPLOYEE_TYPEAHEAD_LIMIT):
+    queryset = User.objects.filter(
+        is_superuser=False, employee_profile__is_verified=True
+    ).alias(full_name=LowerFullName())
+    prefix = prefix.strip().lower()
+    if prefix:
+        queryset = queryset.filter(full_name__startswith=prefix)
+    # A walk of the auth_user_full_name_prefix index from the prefix on,
+    # which stops at the limit: no sort of every match
+    return queryset.order_by("full_name", "id").only("id", "first_name", "last_name")[
+        :limit
+    ]
+
+
 class EmployeeDropDown(generics.ListAPIView):
+    """
+    Typeahead for the employee picker: GET ?q=<name prefix>&limit=<n>.
+    Verified employees whose "first last" name starts with q, at most limit
+    of them; without q, the first ones by name.
+    """
+
     serializer_class = EmployeeDropdownSerializer
     permission_classes = [IsAdminUser, IsAuthenticated]
+    query_budget = 1
     pagination_class = None
 
+    @method_decorator(stale_while_revalidate_page(60 * 15, EMPLOYEE_LIST_NAMESPACE))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     def get_queryset(self):
-        return (
-            User.objects.filter(is_superuser=False, employee_profile__is_verified=True)
-            .order_by("first_name", "last_name")
-            .select_related("employee_profile")
+        params = EmployeeTypeaheadSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        return typeahead_employees(
+            params.validated_data["q"], params.validated_data["limit"]
         )
 
 
@@ -106,19 +221,74 @@ class CategoryDropDown(generics.ListAPIView):
     queryset = Category.objects.all()
     serializer_class = CategoryDropdownSerializer
     permission_classes = [IsAdminUser, IsAuthenticated]
+    query_budget = 1
     pagination_class = None
 
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_serializer(get_reference_rows("category"), many=True)
+        return Response(serializer.data)
+
 
 class EmployeeDepartmentDropdown(generics.ListAPIView):
     queryset = Department.objects.all()
     serializer_class = DepartmentDropdownSerializer
     permission_classes = [IsAdminUser, IsAuthenticated]
+    query_budget = 1
     pagination_class = None
 
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_serializer(get_reference_rows("department"), many=True)
+        return Response(serializer.data)
+
+
+def form_bootstrap_version():
+    return make_etag(
+        "form_bootstrap",
+        get_generation(REFERENCE_DATA_NAMESPACE),
+        get_generation(EMPLOYEE_LIST_NAMESPACE),
+    )
+
+
+def form_bootstrap_etag(request, *args, **kwargs):
+    return form_bootstrap_version()
+
+
+class FormBootstrapAPIView(APIView):
+    """
+    Everything the admin asset and employee forms load when they open, in
+    one round trip: categories, departments and the employee typeahead's
+    first page. The payload is cached under its version, which is also its
+    ETag, so a client holding the current version gets a 304.
+    """
+
+    permission_classes = [IsAdminUser, IsAuthenticated]
+    query_budget = 3
+
+    @method_decorator(condition(etag_func=form_bootstrap_etag))
+    def get(self, request):
+        version = form_bootstrap_version()
+        payload = get_or_set_detail(
+            f"form_bootstrap:{version}",
+            lambda: {
+                "version": version,
+                "categories": CategoryDropdownSerializer(
+                    get_reference_rows("category"), many=True
+                ).data,
+                "departments": DepartmentDropdownSerializer(
+                    get_reference_rows("department"), many=True
+                ).data,
+                "employees": EmployeeDropdownSerializer(
+                    typeahead_employees(), many=True
+                ).data,
+            },
+        )
+        return Response(payload)
+
 
 class AuthEmployeeDetailsVIEW(generics.RetrieveAPIView):
     serializer_class = EmployeeListSerializer
     permission_classes = [IsAuthenticated]
+    query_budget = 1
 
     def get_queryset(self):
 
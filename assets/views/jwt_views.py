@@ -4,6 +4,7 @@ from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 
 class CookieTokenObtainPairView(TokenObtainPairView):
+    query_budget = 1
 
     def post(self, request, *args, **kwargs):
 
@@ -39,6 +40,8 @@ class CookieTokenObtainPairView(TokenObtainPairView):
 
 
 class CookieTokenRefreshView(TokenRefreshView):
+    query_budget = 0
+
     def post(self, request, *args, **kwargs):
         response = super().post(request, *args, **kwargs)
         if response.status_code == 200:
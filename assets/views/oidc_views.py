@@ -2,7 +2,10 @@ from django.contrib.auth import logout
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import redirect, render
 
+from assets.query_budget import query_budget
 
+
+@query_budget(3)
 @login_required
 def profile_view(request):
     if not request.user.is_authenticated:
@@ -19,6 +22,7 @@ def profile_view(request):
     return render(request, "profile.html", context)
 
 
+@query_budget(4)
 def logout_view(request):
     logout(request)
     return redirect("home")
@@ -19,6 +19,8 @@ from assets.tasks import send_otp_email
 @authentication_classes([])
 @permission_classes([AllowAny])
 class RequestOTPView(APIView):
+    query_budget = 1
+
     def post(self, request):
         email = request.data.get("email")
 
@@ -44,6 +46,8 @@ class RequestOTPView(APIView):
 @authentication_classes([])
 @permission_classes([AllowAny])
 class VerifyOTPView(APIView):
+    query_budget = 1
+
     def post(self, request):
         email = request.data.get("email")
         otp = request.data.get("otp")
@@ -75,6 +79,7 @@ class VerifyOTPView(APIView):
 
 class ResetPasswordView(APIView):
     permission_classes = [IsAuthenticated]
+    query_budget = 2
     # Overriding the default class authentication
     authentication_classes = [JWTAuthentication]
 
@@ -100,6 +105,7 @@ class ResetPasswordView(APIView):
 
 class ChangePassword(APIView):
     permission_classes = [IsAuthenticated]
+    query_budget = 5
 
     def post(self, request):
         current_password = request.data.get("current_password")
@@ -0,0 +1,15 @@
+from assets.services.cache_services import collecting_invalidations
+
+
+class InvalidationOutboxMiddleware:
+    """
+    Cache invalidations a request makes outside of a transaction are
+    coalesced and flushed once, before the response goes out.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collecting_invalidations():
+            return self.get_response(request)
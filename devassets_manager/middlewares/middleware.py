@@ -14,12 +14,19 @@ class DetailedLoggingMiddleware:
             response = self.get_response(request)
             duration = round(time.time() - start_time, 2)
 
+            # Streamed bodies are consumed after this returns, reading them
+            # here would buffer the whole export in memory
+            if response.streaming:
+                response_size = "streamed"
+            else:
+                response_size = f"{len(response.content)} bytes"
+
             # Response log
             logger.info(
                 f"[METHOD:{request.method}] - {request.get_full_path()} | "
                 f"Query params: {request.GET.dict()}  | "
                 f"Status: {response.status_code} | Duration: {duration}s | "
-                f"Response size: {len(response.content)} bytes"
+                f"Response size: {response_size}"
             )
             return response
 
@@ -4,6 +4,11 @@ from django.utils.deprecation import MiddlewareMixin
 class NoBrowserCacheMiddleware(MiddlewareMixin):
     def process_response(self, request, response):
         if request.path.startswith("/api/"):
+            if response.has_header("ETag"):
+                # Let the browser keep the body, but revalidate on every use
+                response["Cache-Control"] = "private, no-cache"
+                return response
+
             response["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
             response["Pragma"] = "no-cache"
             response["Expires"] = "0"
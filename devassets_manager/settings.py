@@ -36,6 +36,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third-party
     "debug_toolbar",
     "rest_framework",
@@ -61,6 +62,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "debug_toolbar.middleware.DebugToolbarMiddleware",
     "devassets_manager.middlewares.no_browser_cache.NoBrowserCacheMiddleware",
+    "devassets_manager.middlewares.invalidation_outbox.InvalidationOutboxMiddleware",
     "devassets_manager.middlewares.middleware.DetailedLoggingMiddleware",
     # "mozilla_django_oidc.middleware.SessionRefresh",
     "corsheaders.middleware.CorsMiddleware",
@@ -194,6 +196,28 @@ CACHES = {
     }
 }
 
+# CACHE WARMING
+# After writes invalidate the cache, a Celery task renders these pages again
+# for each listed permission scope, plus the TOP_PAGES most requested pages
+# of the last hours that had at least MIN_HITS requests. BASE_URL must be a
+# host in ALLOWED_HOSTS, pagination links in the cached pages point at it
+CACHE_WARMING = {
+    "ENABLED": os.getenv("CACHE_WARMING_ENABLED", "True").strip().lower()
+    in {"1", "true", "yes", "on"},
+    "BASE_URL": os.getenv("CACHE_WARMING_BASE_URL", "http://localhost:8000"),
+    "PAGES": [
+        ("/api/assets/", ["admin", "authenticated"]),
+        ("/api/employees/", ["admin", "authenticated"]),
+        ("/api/assets/history/", ["admin", "authenticated"]),
+        ("/api/category/drop-downs/", ["admin"]),
+        ("/api/department/drop-downs/", ["admin"]),
+        ("/api/employees/drop-downs/", ["admin"]),
+        ("/api/forms/bootstrap/", ["admin"]),
+    ],
+    "TOP_PAGES": int(os.getenv("CACHE_WARMING_TOP_PAGES", 20)),
+    "MIN_HITS": int(os.getenv("CACHE_WARMING_MIN_HITS", 10)),
+}
+
 # LOGGING SETTINGS
 
 LOGGING = {
@@ -1,2 +1,27 @@
 from tests.test_employee import EmployeeAPITest
 from tests.test_asset import AssetAPITest
+from tests.test_cache_services import CacheGenerationTest, InvalidationOutboxTest
+from tests.test_pagination import CursorPaginationTest
+from tests.test_search import AssetFullTextSearchTest, FuzzyLookupTest
+from tests.test_export import AssetExportTest
+from tests.test_import import AssetImportTest
+from tests.test_reassign import AssetBulkReassignTest
+from tests.test_inventory_stats import InventoryStatsTest
+from tests.test_conditional_get import ConditionalGetTest
+from tests.test_detail_cache import DetailCacheTest
+from tests.test_projections import ValuesProjectionTest
+from tests.test_benchmark import EndpointBenchmarkTest
+from tests.test_query_budget import QueryBudgetTest
+from tests.test_dataset_generator import DatasetGeneratorTest
+from tests.test_history_timeline import HistoryTimelineTest
+from tests.test_custody import CustodyTest
+from tests.test_page_cache import SharedPageCacheTest, StaleWhileRevalidatePageTest
+from tests.test_page_warming import PageWarmingTest
+from tests.test_reference_cache import (
+    LocalLRUCacheTest,
+    ReferenceCacheTest,
+    ReferenceLocalTierTest,
+)
+from tests.test_typeahead import EmployeeTypeaheadTest
+from tests.test_form_bootstrap import FormBootstrapTest
+from tests.test_onboarding import EmployeeOnboardingTest, HashPasswordsTest
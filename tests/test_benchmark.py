@@ -0,0 +1,54 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import URLPattern
+
+from assets import urls
+from assets.management.commands.benchmark_endpoints import ENDPOINTS, run_benchmark
+from assets.models import Asset, AssetHistory, EmployeeProfile, InventoryStat
+from assets.services.seed_services import dataset_sizes, seed_dataset
+from assets.services.stats_services import find_inventory_stats_drift
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    CELERY_TASK_ALWAYS_EAGER=True,
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+class EndpointBenchmarkTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.sizes = seed_dataset(200)
+
+    def test_seed_dataset(self):
+        self.assertEqual(Asset.objects.count(), self.sizes["assets"])
+        self.assertEqual(User.objects.count(), dataset_sizes(200)["users"])
+        self.assertEqual(EmployeeProfile.objects.count(), self.sizes["users"])
+        self.assertEqual(
+            AssetHistory.objects.count(),
+            Asset.objects.filter(assigned_to__isnull=False).count(),
+        )
+        self.assertTrue(InventoryStat.objects.exists())
+        self.assertEqual(find_inventory_stats_drift(), {})
+
+    def test_every_route_is_benchmarked(self):
+        routes = {
+            pattern.name
+            for pattern in urls.urlpatterns
+            if isinstance(pattern, URLPattern)
+        }
+        self.assertEqual(routes, {endpoint.route for endpoint in ENDPOINTS})
+
+    def test_run_benchmark(self):
+        results = run_benchmark(iterations=2)
+
+        self.assertEqual(len(results), len(ENDPOINTS))
+        for result in results:
+            with self.subTest(route=result["route"], method=result["method"]):
+                self.assertLess(result["status"], 400)
+                self.assertGreater(result["queries"], 0)
+                self.assertGreaterEqual(result["p95_ms"], result["p50_ms"])
+                self.assertGreater(result["peak_memory_kb"], 0)
+        # Writes were rolled back
+        self.assertEqual(Asset.objects.count(), self.sizes["assets"])
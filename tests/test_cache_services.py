@@ -0,0 +1,195 @@
+from datetime import date
+
+from django.contrib.auth.models import User, update_last_login
+from django.core.cache import cache
+from django.db import transaction
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, Category
+from assets.services.cache_services import (
+    ASSET_LIST_NAMESPACE,
+    EMPLOYEE_LIST_NAMESPACE,
+    bump_generation,
+    collecting_invalidations,
+    employee_detail_key,
+    get_generation,
+    invalidate,
+    set_detail,
+    stored_detail_key,
+)
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CacheGenerationTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        # Flushed now, not with the first commit a test captures
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user = User.objects.create_user(
+                username="user", password="userpass", email="user@example.com"
+            )
+            self.category = Category.objects.create(name="Laptop")
+        self.asset_list_url = reverse("asset_list_create")
+
+    def create_asset(self, serial_number):
+        return Asset.objects.create(
+            name="Dell Laptop",
+            serial_number=serial_number,
+            category=self.category,
+            purchase_date=date.today(),
+            status="IN_USE",
+        )
+
+    def test_generation_is_stable_until_bumped(self):
+        generation = get_generation(ASSET_LIST_NAMESPACE)
+        self.assertEqual(get_generation(ASSET_LIST_NAMESPACE), generation)
+
+        self.assertEqual(bump_generation(ASSET_LIST_NAMESPACE), generation + 1)
+        self.assertEqual(get_generation(ASSET_LIST_NAMESPACE), generation + 1)
+
+    def test_bump_without_generation_starts_a_new_one(self):
+        self.assertIsNotNone(bump_generation(ASSET_LIST_NAMESPACE))
+        self.assertIsNotNone(get_generation(ASSET_LIST_NAMESPACE))
+
+    def test_asset_save_invalidates_cached_list(self):
+        self.client.force_authenticate(user=self.user)
+        self.create_asset("SN0001")
+
+        response = self.client.get(self.asset_list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+
+        generation = get_generation(ASSET_LIST_NAMESPACE)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_asset("SN0002")
+            # Readers must not re-cache rows that are not committed yet
+            self.assertEqual(get_generation(ASSET_LIST_NAMESPACE), generation)
+        self.assertGreater(get_generation(ASSET_LIST_NAMESPACE), generation)
+
+        response = self.client.get(self.asset_list_url)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_user_saves_invalidate_only_on_serialized_fields(self):
+        key = stored_detail_key(employee_detail_key(self.user.pk))
+        cache.set(key, {"id": self.user.pk})
+        generation = get_generation(EMPLOYEE_LIST_NAMESPACE)
+
+        # What every login writes
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(1):
+                update_last_login(None, self.user)
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(get_generation(EMPLOYEE_LIST_NAMESPACE), generation)
+        self.assertIsNotNone(cache.get(key))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = "Renamed"
+            self.user.save(update_fields=["first_name", "last_login"])
+        self.assertGreater(get_generation(EMPLOYEE_LIST_NAMESPACE), generation)
+        self.assertIsNone(cache.get(key))
+
+    def test_transaction_invalidates_once_on_commit(self):
+        generation = get_generation(ASSET_LIST_NAMESPACE)
+        key = stored_detail_key(employee_detail_key(self.user.pk))
+        cache.set(key, {"id": self.user.pk})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(20):
+                self.create_asset(f"SN{index:04}")
+            invalidate(detail_keys=[employee_detail_key(self.user.pk)])
+            self.assertIsNotNone(cache.get(key))
+
+        self.assertEqual(get_generation(ASSET_LIST_NAMESPACE), generation + 1)
+        self.assertIsNone(cache.get(key))
+
+    def test_rolled_back_writes_do_not_invalidate(self):
+        generation = get_generation(ASSET_LIST_NAMESPACE)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.create_asset("SN0001")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self.assertEqual(get_generation(ASSET_LIST_NAMESPACE), generation)
+            # The next write is collected again
+            self.create_asset("SN0002")
+
+        self.assertEqual(get_generation(ASSET_LIST_NAMESPACE), generation + 1)
+
+    def test_refreshed_details_survive_the_flush(self):
+        key = employee_detail_key(self.user.pk)
+        cache.set(stored_detail_key(key), {"first_name": ""})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = "Renamed"
+            self.user.save()
+            set_detail(key, {"first_name": "Renamed"})
+            # Not before the commit
+            self.assertEqual(cache.get(stored_detail_key(key)), {"first_name": ""})
+        self.assertEqual(cache.get(stored_detail_key(key)), {"first_name": "Renamed"})
+
+        # A write after the refresh makes it stale
+        with self.captureOnCommitCallbacks(execute=True):
+            set_detail(key, {"first_name": "Renamed"})
+            invalidate(detail_keys=[key])
+        self.assertIsNone(cache.get(stored_detail_key(key)))
+
+        # A rolled back refresh is never stored
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    set_detail(key, {"first_name": "Rolled back"})
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertIsNone(cache.get(stored_detail_key(key)))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class InvalidationOutboxTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_invalidates_right_away_outside_transactions(self):
+        generation = get_generation(ASSET_LIST_NAMESPACE)
+        invalidate(ASSET_LIST_NAMESPACE)
+        self.assertEqual(get_generation(ASSET_LIST_NAMESPACE), generation + 1)
+
+    def test_block_coalesces_until_its_end(self):
+        generation = get_generation(ASSET_LIST_NAMESPACE)
+        cache.set(stored_detail_key(employee_detail_key(1)), {"id": 1})
+
+        with collecting_invalidations():
+            for _ in range(5):
+                invalidate(ASSET_LIST_NAMESPACE, detail_keys=[employee_detail_key(1)])
+            with collecting_invalidations():
+                invalidate(ASSET_LIST_NAMESPACE)
+            self.assertEqual(get_generation(ASSET_LIST_NAMESPACE), generation)
+            self.assertIsNotNone(cache.get(stored_detail_key(employee_detail_key(1))))
+
+        self.assertEqual(get_generation(ASSET_LIST_NAMESPACE), generation + 1)
+        self.assertIsNone(cache.get(stored_detail_key(employee_detail_key(1))))
+
+    def test_block_stores_refreshed_details_after_the_deletes(self):
+        key = employee_detail_key(1)
+        cache.set(stored_detail_key(key), {"id": 1, "name": "old"})
+
+        with collecting_invalidations():
+            invalidate(detail_keys=[key])
+            set_detail(key, {"id": 1, "name": "new"})
+            self.assertEqual(
+                cache.get(stored_detail_key(key)), {"id": 1, "name": "old"}
+            )
+        self.assertEqual(cache.get(stored_detail_key(key)), {"id": 1, "name": "new"})
+
+        with collecting_invalidations():
+            set_detail(key, {"id": 1, "name": "newer"})
+            invalidate(detail_keys=[key])
+        self.assertIsNone(cache.get(stored_detail_key(key)))
@@ -0,0 +1,128 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, Category
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ConditionalGetTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.employee = User.objects.create_user(
+            username="employee", password="employeepass", email="emp@example.com"
+        )
+        self.category = Category.objects.create(name="Laptop")
+        self.asset = Asset.objects.create(
+            name="Dell Laptop",
+            serial_number="SN0001",
+            category=self.category,
+            assigned_to=self.employee,
+            purchase_date=date(2024, 1, 15),
+            status="IN_USE",
+        )
+
+        self.asset_list_url = reverse("asset_list_create")
+        self.asset_detail_url = reverse("asset_list_detail", args=[self.asset.id])
+        self.employee_list_url = reverse("employee_list_create")
+        self.employee_detail_url = reverse("employee_details", args=[self.employee.id])
+        self.client.force_authenticate(user=self.admin)
+
+    def assert_revalidates(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+        etag = response["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        return etag
+
+    def test_asset_list_not_modified(self):
+        etag = self.assert_revalidates(self.asset_list_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Asset.objects.create(
+                name="LG Monitor", serial_number="SN0002", purchase_date=date.today()
+            )
+        response = self.client.get(self.asset_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_asset_list_etag_depends_on_query(self):
+        etag = self.assert_revalidates(self.asset_list_url)
+        response = self.client.get(
+            self.asset_list_url, {"status": "IN_USE"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_category_rename_changes_asset_etags(self):
+        list_etag = self.assert_revalidates(self.asset_list_url)
+        detail_etag = self.assert_revalidates(self.asset_detail_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.name = "Notebook"
+            self.category.save()
+
+        response = self.client.get(self.asset_list_url, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["category"], "Notebook")
+        response = self.client.get(
+            self.asset_detail_url, HTTP_IF_NONE_MATCH=detail_etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_asset_detail_not_modified(self):
+        etag = self.assert_revalidates(self.asset_detail_url)
+
+        response = self.client.patch(
+            self.asset_detail_url, {"status": "REPAIR"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(self.asset_detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_missing_asset_has_no_etag(self):
+        response = self.client.get(reverse("asset_list_detail", args=[999999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_missing_employee_is_not_found(self):
+        url = reverse("employee_details", args=[999999])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_employee_endpoints_not_modified(self):
+        list_etag = self.assert_revalidates(self.employee_list_url)
+        detail_etag = self.assert_revalidates(self.employee_detail_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employee.first_name = "Juan"
+            self.employee.save()
+
+        response = self.client.get(self.employee_list_url, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(
+            self.employee_detail_url, HTTP_IF_NONE_MATCH=detail_etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_permissions_checked_before_etag(self):
+        etag = self.assert_revalidates(self.asset_detail_url)
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.asset_detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,211 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection, transaction
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, AssetCustody, Category
+from assets.services.asset_services import import_assets, reassign_assets
+from assets.services.custody_services import (
+    find_custody_drift,
+    rebuild_custody_periods,
+)
+from assets.services.seed_services import generate_dataset
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CustodyTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.alice = User.objects.create_user(
+            username="alice", password="alicepass", email="alice@example.com"
+        )
+        self.bob = User.objects.create_user(
+            username="bob", password="bobpass", email="bob@example.com"
+        )
+        self.category = Category.objects.create(name="Laptop")
+        self.client.force_authenticate(user=self.admin)
+
+        # Unassigned, then alice, then bob, then back to storage
+        self.before = timezone.now()
+        response = self.client.post(
+            reverse("asset_list_create"),
+            {
+                "name": "Dell Laptop",
+                "serial_number": "SN0001",
+                "category": self.category.id,
+                "purchase_date": "2024-01-15",
+                "status": "IN_STORAGE",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.asset = Asset.objects.get(serial_number="SN0001")
+        self.in_storage = timezone.now()
+        self.assign(self.alice)
+        self.with_alice = timezone.now()
+        self.assign(self.bob)
+        self.with_bob = timezone.now()
+        self.assign(None)
+        self.returned = timezone.now()
+
+    def assign(self, user):
+        response = self.client.patch(
+            reverse("asset_list_detail", args=[self.asset.id]),
+            {"assigned_to": user.id if user else None, "notes": "Hand-over"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def holder_at(self, at, asset=None):
+        response = self.client.get(
+            reverse("asset_holder_at", args=[(asset or self.asset).id]),
+            {"at": at.isoformat()},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["holder"]
+
+    def held_by(self, user, at):
+        response = self.client.get(
+            reverse("employee_assets_held_at", args=[user.id]), {"at": at.isoformat()}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [asset["serial_number"] for asset in response.data["assets"]]
+
+    def test_holder_at(self):
+        self.assertIsNone(self.holder_at(self.before))
+        self.assertIsNone(self.holder_at(self.in_storage))
+        self.assertEqual(self.holder_at(self.with_alice)["username"], "alice")
+        self.assertEqual(self.holder_at(self.with_bob)["username"], "bob")
+        self.assertIsNone(self.holder_at(self.returned))
+
+        response = self.client.get(
+            reverse("asset_holder_at", args=[self.asset.id]),
+            {"at": self.with_alice.isoformat()},
+        )
+        self.assertEqual(response.data["asset"]["serial_number"], "SN0001")
+        self.assertLess(response.data["held_since"], self.with_alice)
+        self.assertGreater(response.data["held_until"], self.with_alice)
+
+    def test_assets_held_at(self):
+        self.assertEqual(self.held_by(self.alice, self.with_alice), ["SN0001"])
+        self.assertEqual(self.held_by(self.alice, self.with_bob), [])
+        self.assertEqual(self.held_by(self.bob, self.with_bob), ["SN0001"])
+        self.assertEqual(self.held_by(self.bob, self.returned), [])
+
+    def test_defaults_and_errors(self):
+        self.assign(self.alice)
+        response = self.client.get(reverse("asset_holder_at", args=[self.asset.id]))
+        self.assertEqual(response.data["holder"]["username"], "alice")
+        self.assertIsNone(response.data["held_until"])
+
+        # A bare date is its midnight
+        response = self.client.get(
+            reverse("asset_holder_at", args=[self.asset.id]), {"at": "2020-03-01"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["holder"])
+
+        response = self.client.get(
+            reverse("asset_holder_at", args=[self.asset.id]), {"at": "last march"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        for name in ("asset_holder_at", "employee_assets_held_at"):
+            response = self.client.get(reverse(name, args=[999999]))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, name)
+
+        self.client.force_authenticate(user=self.alice)
+        response = self.client.get(reverse("asset_holder_at", args=[self.asset.id]))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bulk_writes_keep_periods(self):
+        other = Asset.objects.create(
+            name="LG Monitor", serial_number="SN0002", purchase_date=date.today()
+        )
+        reassign_assets([self.asset.id, other.id], self.alice)
+        moved = timezone.now()
+        created, errors = import_assets(
+            [
+                {
+                    "name": "Imported",
+                    "serial_number": "SN0003",
+                    "purchase_date": "2024-02-01",
+                    "assigned_to": str(self.alice.id),
+                }
+            ]
+        )
+        self.assertEqual(errors, [])
+        reassign_assets([other.id], self.bob)
+
+        self.assertEqual(self.held_by(self.alice, moved), ["SN0001", "SN0002"])
+        self.assertEqual(self.held_by(self.alice, timezone.now()), ["SN0001", "SN0003"])
+        self.assertEqual(self.holder_at(timezone.now(), other)["username"], "bob")
+        self.assertEqual(find_custody_drift(), {"extra": 0, "missing": 0})
+
+    def test_rebuild_matches_incremental_periods(self):
+        incremental = sorted(
+            AssetCustody.objects.values_list("asset_id", "user_id", "period")
+        )
+        self.assertEqual(len(incremental), 2)
+
+        rebuild_custody_periods()
+        self.assertEqual(
+            sorted(AssetCustody.objects.values_list("asset_id", "user_id", "period")),
+            incremental,
+        )
+
+        AssetCustody.objects.filter(user=self.bob).delete()
+        self.assertEqual(find_custody_drift(), {"extra": 0, "missing": 1})
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("custody_periods", "--check", stdout=out)
+        call_command("custody_periods", stdout=out)
+        call_command("custody_periods", "--check", stdout=out)
+        self.assertIn("in sync", out.getvalue())
+
+    def test_lookups_use_the_gist_indexes(self):
+        generate_dataset(100, 3000)
+        asset = Asset.objects.filter(assigned_to__isnull=False).first()
+        at = timezone.now()
+        for queryset, index in [
+            (
+                AssetCustody.objects.filter(asset=asset, period__contains=at),
+                "assets_assetcustody_asset_id",
+            ),
+            (
+                AssetCustody.objects.filter(
+                    user=asset.assigned_to, period__contains=at
+                ),
+                "asset_custody_user_gist",
+            ),
+        ]:
+            with connection.cursor() as cursor:
+                # A few thousand rows still fit a seq scan, show the index path
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                plan = queryset.explain()
+            self.assertIn(index, plan)
+
+    def test_overlapping_periods_are_rejected(self):
+        start = timezone.now() - timedelta(days=1)
+        AssetCustody.objects.filter(asset=self.asset).delete()
+        AssetCustody.objects.create(
+            asset=self.asset, user=self.alice, period=(start, None)
+        )
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            AssetCustody.objects.create(
+                asset=self.asset,
+                user=self.bob,
+                period=(start + timedelta(hours=1), None),
+            )
@@ -0,0 +1,104 @@
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db.models import F, OuterRef, Subquery
+from django.test import TestCase, override_settings
+
+from assets.models import Asset, AssetHistory, EmployeeProfile
+from assets.services.seed_services import SEED_PASSWORD, generate_dataset
+from assets.services.stats_services import find_inventory_stats_drift
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class DatasetGeneratorTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_generate_dataset(self):
+        sizes = generate_dataset(50, 500, batch_size=120)
+
+        self.assertEqual(User.objects.count(), 50)
+        self.assertEqual(EmployeeProfile.objects.count(), 50)
+        self.assertEqual(Asset.objects.count(), 500)
+        self.assertEqual(AssetHistory.objects.count(), sizes["history"])
+        self.assertGreater(sizes["history"], 500)
+        self.assertEqual(find_inventory_stats_drift(), {})
+        self.assertTrue(User.objects.first().check_password(SEED_PASSWORD))
+        self.assertFalse(
+            Asset.objects.filter(assigned_to__isnull=False)
+            .exclude(status__in=["IN_USE", "REPAIR"])
+            .exists()
+        )
+
+    def test_history_ends_with_current_holder(self):
+        generate_dataset(30, 300, history=4)
+
+        latest = AssetHistory.objects.filter(asset=OuterRef("pk")).order_by(
+            "-change_date", "-id"
+        )
+        assets = Asset.objects.annotate(
+            last_holder=Subquery(latest.values("new_user")[:1])
+        )
+        for asset in assets.filter(assigned_to__isnull=False):
+            self.assertEqual(asset.last_holder, asset.assigned_to_id)
+        # History only records actual changes of hands
+        self.assertFalse(
+            AssetHistory.objects.filter(previous_user=F("new_user")).exists()
+        )
+        self.assertFalse(
+            AssetHistory.objects.filter(
+                previous_user__isnull=True, new_user__isnull=True
+            ).exists()
+        )
+        self.assertFalse(
+            AssetHistory.objects.filter(
+                change_date__date__lt=F("asset__purchase_date")
+            ).exists()
+        )
+
+    def test_same_seed_same_rows(self):
+        def snapshot(prefix):
+            generate_dataset(20, 100, seed=7, prefix=prefix, as_of=date(2025, 6, 1))
+            users = User.objects.filter(username__startswith=f"{prefix}.")
+            assets = Asset.objects.filter(serial_number__startswith=prefix.upper())
+            return (
+                [
+                    (username.removeprefix(prefix), *rest)
+                    for username, *rest in users.order_by("id").values_list(
+                        "username", "first_name", "last_name", "password", "date_joined"
+                    )
+                ],
+                [
+                    (serial_number.removeprefix(prefix.upper()), *rest)
+                    for serial_number, *rest in assets.order_by("id").values_list(
+                        "serial_number", "name", "category", "status", "purchase_date"
+                    )
+                ],
+                list(
+                    AssetHistory.objects.filter(asset__in=assets)
+                    .order_by("asset_id", "change_date", "id")
+                    .values_list("change_date", "notes")
+                ),
+            )
+
+        self.assertEqual(snapshot("first"), snapshot("second"))
+
+    def test_command(self):
+        out = StringIO()
+        # Statistics would outlive the test's rollback
+        call_command(
+            "generate_dataset",
+            "--employees",
+            "10",
+            "--assets",
+            "40",
+            "--no-analyze",
+            stdout=out,
+        )
+
+        self.assertIn("Generated 10 employees, 40 assets", out.getvalue())
+        self.assertEqual(Asset.objects.count(), 40)
@@ -0,0 +1,151 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, Category, Department, EmployeeProfile
+from assets.services.cache_services import (
+    asset_detail_key,
+    employee_detail_key,
+    stored_detail_key,
+)
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class DetailCacheTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.department = Department.objects.create(name="IT", full_name="IT Dept")
+        self.employee = User.objects.create_user(
+            username="employee",
+            password="employeepass",
+            email="emp@example.com",
+            first_name="Ana",
+            last_name="Cruz",
+        )
+        EmployeeProfile.objects.create(
+            user=self.employee, department=self.department, position="Dev"
+        )
+        self.category = Category.objects.create(name="Laptop")
+        self.asset = Asset.objects.create(
+            name="Dell Laptop",
+            serial_number="SN0001",
+            category=self.category,
+            assigned_to=self.employee,
+            purchase_date=date(2024, 1, 15),
+            status="IN_USE",
+        )
+
+        self.asset_url = reverse("asset_list_detail", args=[self.asset.id])
+        self.employee_url = reverse("employee_details", args=[self.employee.id])
+        self.client.force_authenticate(user=self.admin)
+
+    def test_asset_detail_read_through(self):
+        response = self.client.get(self.asset_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            cache.get(stored_detail_key(asset_detail_key(self.asset.id))), response.data
+        )
+
+        # Only the ETag lookup is left, no join and no serialization
+        with self.assertNumQueries(1):
+            cached = self.client.get(self.asset_url)
+        self.assertEqual(cached.content, response.content)
+
+    def test_employee_detail_read_through(self):
+        response = self.client.get(self.employee_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Only the existence check of the ETag is left
+        with self.assertNumQueries(1):
+            cached = self.client.get(self.employee_url)
+        self.assertEqual(cached.content, response.content)
+
+    def test_missing_object_is_not_cached(self):
+        response = self.client.get(reverse("employee_details", args=[999999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIsNone(cache.get(stored_detail_key(employee_detail_key(999999))))
+
+    def test_asset_update_refreshes_entry(self):
+        self.client.get(self.asset_url)
+        # The outbox flushes the save's invalidation on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                self.asset_url,
+                {"status": "REPAIR", "assigned_to": None, "notes": "Returned"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        entry = cache.get(stored_detail_key(asset_detail_key(self.asset.id)))
+        self.assertEqual(entry["status"], "REPAIR")
+        self.assertIsNone(entry["assigned_to"])
+
+    def test_employee_update_refreshes_entry(self):
+        self.client.get(self.employee_url)
+        sales = Department.objects.create(name="Sales", full_name="Sales Dept")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(
+                self.employee_url,
+                {
+                    "username": "employee",
+                    "first_name": "Ana",
+                    "last_name": "Reyes",
+                    "email": "emp@example.com",
+                    "department": sales.id,
+                    "position": "Lead",
+                    "is_verified": True,
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        entry = cache.get(stored_detail_key(employee_detail_key(self.employee.id)))
+        self.assertEqual(entry["last_name"], "Reyes")
+        self.assertEqual(entry["employee_profile"]["department"]["id"], sales.id)
+
+    def test_related_changes_invalidate(self):
+        self.client.get(self.asset_url)
+        self.client.get(self.employee_url)
+
+        # One generation bump for every detail, no lookup of the assets
+        with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(1):
+            self.category.name = "Notebook"
+            self.category.save()
+        self.assertIsNone(cache.get(stored_detail_key(asset_detail_key(self.asset.id))))
+        response = self.client.get(self.asset_url)
+        self.assertEqual(response.data["category"]["name"], "Notebook")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department.full_name = "Information Technology"
+            self.department.save()
+        self.assertIsNone(
+            cache.get(stored_detail_key(employee_detail_key(self.employee.id)))
+        )
+        response = self.client.get(self.employee_url)
+        self.assertEqual(
+            response.data["employee_profile"]["department"]["name"],
+            "Information Technology",
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employee.email = "ana@example.com"
+            self.employee.save()
+        response = self.client.get(self.asset_url)
+        self.assertEqual(response.data["assigned_to"]["email"], "ana@example.com")
+
+    def test_deleting_assignee_invalidates_asset(self):
+        self.client.get(self.asset_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employee.delete()
+
+        response = self.client.get(self.asset_url)
+        self.assertIsNone(response.data["assigned_to"])
@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, Category
+
+
+class AssetExportTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="user", password="userpass", email="user@example.com"
+        )
+        laptop = Category.objects.create(name="Laptop")
+        monitor = Category.objects.create(name="Monitor")
+        self.laptop = Asset.objects.create(
+            name="Dell Latitude",
+            serial_number="SN0001",
+            category=laptop,
+            assigned_to=self.user,
+            purchase_date=date(2024, 1, 15),
+            status="IN_USE",
+            description="Has a cracked, taped hinge",
+        )
+        Asset.objects.create(
+            name="LG Monitor",
+            serial_number="SN0002",
+            category=monitor,
+            purchase_date=date(2024, 2, 1),
+        )
+
+        self.export_url = reverse("asset_export")
+        self.client.force_authenticate(user=self.user)
+
+    def read_stream(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_csv(self):
+        response = self.client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+        rows = list(csv.DictReader(io.StringIO(self.read_stream(response))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["category"], "Laptop")
+        self.assertEqual(rows[0]["assigned_to"], "user@example.com")
+        self.assertEqual(rows[0]["description"], "Has a cracked, taped hinge")
+
+    def test_export_ndjson_with_filters(self):
+        response = self.client.get(
+            self.export_url, {"output": "ndjson", "category": "monitor"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        rows = [json.loads(line) for line in self.read_stream(response).splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["serial_number"], "SN0002")
+        self.assertEqual(rows[0]["purchase_date"], "2024-02-01")
+        self.assertIsNone(rows[0]["assigned_to"])
+
+    def test_unknown_output_format(self):
+        response = self.client.get(self.export_url, {"output": "xlsx"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_requires_auth(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,76 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Category, Department, EmployeeProfile
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class FormBootstrapTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.category = Category.objects.create(name="Laptop")
+        self.department = Department.objects.create(
+            name="IT", full_name="Information Technology"
+        )
+        self.ana = User.objects.create_user(
+            username="ana", first_name="Ana", last_name="Cruz"
+        )
+        EmployeeProfile.objects.create(
+            user=self.ana, department=self.department, is_verified=True
+        )
+        self.url = reverse("form_bootstrap")
+        self.client.force_authenticate(user=self.admin)
+
+    def test_bundles_every_reference_list(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], f'"{response.data["version"]}"')
+        self.assertEqual(
+            response.data["categories"], [{"id": self.category.id, "name": "Laptop"}]
+        )
+        self.assertEqual(
+            response.data["departments"],
+            [{"id": self.department.id, "full_name": "Information Technology"}],
+        )
+        self.assertEqual(
+            response.data["employees"], [{"id": self.ana.id, "full_name": "Ana Cruz"}]
+        )
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.url)
+        self.assertEqual(cached.data, response.data)
+
+    def test_current_version_gets_a_304(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.name = "Notebook"
+            self.category.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["categories"][0]["name"], "Notebook")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ana.first_name = "Anna"
+            self.ana.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["employees"][0]["full_name"], "Anna Cruz")
+
+    def test_admin_only(self):
+        self.client.force_authenticate(user=self.ana)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
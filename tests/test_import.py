@@ -0,0 +1,94 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, AssetHistory, Category
+
+
+class AssetImportTest(APITestCase):
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.normal_user = User.objects.create_user(
+            username="user", password="userpass", email="user@example.com"
+        )
+        self.category = Category.objects.create(name="Laptop")
+        Asset.objects.create(
+            name="Existing",
+            serial_number="SN0000",
+            category=self.category,
+            purchase_date=date.today(),
+        )
+        self.import_url = reverse("asset_import")
+
+    def row(self, serial_number, **extra):
+        return {
+            "name": "Dell Latitude",
+            "serial_number": serial_number,
+            "category": self.category.id,
+            "purchase_date": "2025-01-01",
+            **extra,
+        }
+
+    def test_normal_user_cannot_import(self):
+        self.client.force_authenticate(user=self.normal_user)
+        response = self.client.post(self.import_url, [self.row("SN1")], format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_json_import_reports_bad_rows_and_keeps_good_ones(self):
+        self.client.force_authenticate(user=self.admin_user)
+        payload = [
+            self.row("SN0001", assigned_to=self.normal_user.id, notes="Day one"),
+            self.row("SN0002", status="IN_USE"),
+            self.row("SN0000"),
+            self.row("SN0002"),
+            self.row("SN0003", category=9999),
+            {"serial_number": "SN0004"},
+        ]
+        # 9 for the import itself, 2 to open the custody period of SN0001
+        with self.assertNumQueries(11):
+            response = self.client.post(self.import_url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(
+            [error["row"] for error in response.data["errors"]], [3, 4, 5, 6]
+        )
+        self.assertIn("serial_number", response.data["errors"][0]["errors"])
+        self.assertIn("category", response.data["errors"][2]["errors"])
+        self.assertIn("purchase_date", response.data["errors"][3]["errors"])
+
+        history = AssetHistory.objects.get(asset__serial_number="SN0001")
+        self.assertEqual(history.new_user, self.normal_user)
+        self.assertEqual(history.notes, "Day one")
+        self.assertEqual(Asset.objects.get(serial_number="SN0002").status, "IN_USE")
+
+    def test_csv_import(self):
+        self.client.force_authenticate(user=self.admin_user)
+        content = (
+            "name,serial_number,category,assigned_to,purchase_date,status\n"
+            f"Dell Latitude,SN0010,{self.category.id},,2025-01-01,\n"
+            f"Dell Latitude,SN0011,{self.category.id},,2025-01-01,REPAIR\n"
+        )
+        upload = SimpleUploadedFile("assets.csv", content.encode(), "text/csv")
+        response = self.client.post(
+            self.import_url, {"file": upload}, format="multipart"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(Asset.objects.get(serial_number="SN0010").status, "IN_STORAGE")
+        self.assertFalse(AssetHistory.objects.filter(asset__serial_number="SN0010"))
+
+    def test_nothing_valid(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(
+            self.import_url, [self.row("SN0000")], format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["created"], 0)
@@ -0,0 +1,142 @@
+from datetime import date
+from importlib import import_module
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, Category, Department, EmployeeProfile, InventoryStat
+from assets.services.asset_services import import_assets, reassign_assets
+from assets.services.stats_services import (
+    find_inventory_stats_drift,
+    rebuild_inventory_stats,
+)
+
+
+class InventoryStatsTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="userpass")
+        self.other_user = User.objects.create_user(username="other", password="pass")
+        self.it = Department.objects.create(name="IT", full_name="Information Tech")
+        self.hr = Department.objects.create(name="HR", full_name="Human Resource")
+        self.profile = EmployeeProfile.objects.create(
+            user=self.user, department=self.it
+        )
+        EmployeeProfile.objects.create(user=self.other_user, department=self.hr)
+        self.laptop = Category.objects.create(name="Laptop")
+        self.monitor = Category.objects.create(name="Monitor")
+
+        self.asset = self.create_asset("SN0001", self.laptop, self.user, "IN_USE")
+        self.create_asset("SN0002", self.monitor, None, "IN_STORAGE")
+        self.stats_url = reverse("inventory_stats")
+
+    def create_asset(self, serial_number, category, assigned_to, status):
+        return Asset.objects.create(
+            name="Asset",
+            serial_number=serial_number,
+            category=category,
+            assigned_to=assigned_to,
+            purchase_date=date.today(),
+            status=status,
+        )
+
+    def assert_in_sync(self):
+        self.assertEqual(find_inventory_stats_drift(), {})
+
+    def test_asset_saves_and_deletes(self):
+        self.assert_in_sync()
+        self.asset.status = "REPAIR"
+        self.asset.assigned_to = self.other_user
+        self.asset.save()
+        self.assert_in_sync()
+        self.asset.delete()
+        self.assert_in_sync()
+
+    def test_asset_save_locks_the_row_it_counts(self):
+        self.asset.status = "REPAIR"
+        with CaptureQueriesContext(connection) as queries:
+            self.asset.save()
+        self.assertIn("FOR UPDATE", queries[0]["sql"])
+        self.assert_in_sync()
+
+    def test_rebuild_counts_under_the_table_lock(self):
+        with CaptureQueriesContext(connection) as queries:
+            rebuild_inventory_stats()
+        statements = [query["sql"] for query in queries]
+        lock = next(i for i, sql in enumerate(statements) if "LOCK TABLE" in sql)
+        count = next(i for i, sql in enumerate(statements) if "COUNT(" in sql)
+        self.assertLess(lock, count)
+        self.assert_in_sync()
+
+    def test_department_change_locks_the_assets_it_counts(self):
+        self.profile.department = self.hr
+        with CaptureQueriesContext(connection) as queries:
+            with transaction.atomic():
+                self.profile.save()
+        self.assertTrue(any("FOR UPDATE" in query["sql"] for query in queries))
+        self.assert_in_sync()
+
+    def test_migration_backfills_existing_assets(self):
+        migration = import_module("assets.migrations.0022_backfill_inventorystat")
+        InventoryStat.objects.all().delete()
+        with connection.cursor() as cursor:
+            cursor.execute(migration.BACKFILL_SQL)
+        self.assert_in_sync()
+
+    def test_department_change_and_user_delete(self):
+        self.profile.department = self.hr
+        self.profile.save()
+        self.assert_in_sync()
+        self.user.delete()
+        self.assert_in_sync()
+
+    def test_category_and_department_delete(self):
+        self.laptop.delete()
+        self.assert_in_sync()
+        self.hr.delete()
+        self.assert_in_sync()
+
+    def test_bulk_paths(self):
+        import_assets(
+            [
+                {
+                    "name": "Imported",
+                    "serial_number": f"SN1{index:03}",
+                    "category": self.laptop.id,
+                    "assigned_to": self.other_user.id,
+                    "purchase_date": "2025-01-01",
+                    "status": "IN_USE",
+                }
+                for index in range(5)
+            ]
+        )
+        self.assert_in_sync()
+        reassign_assets(list(Asset.objects.values_list("id", flat=True)), self.user)
+        self.assert_in_sync()
+
+    def test_dashboard_endpoint(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.stats_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total"], 2)
+        self.assertEqual(response.data["by_status"], {"IN_USE": 1, "IN_STORAGE": 1})
+        self.assertIn(
+            {"id": self.it.id, "name": "Information Tech", "count": 1},
+            response.data["by_department"],
+        )
+
+    def test_command_checks_and_rebuilds(self):
+        call_command("inventory_stats", "--check", stdout=StringIO())
+        InventoryStat.objects.update(count=42)
+
+        with self.assertRaises(CommandError):
+            call_command("inventory_stats", "--check", stdout=StringIO())
+
+        call_command("inventory_stats", stdout=StringIO())
+        self.assert_in_sync()
@@ -0,0 +1,185 @@
+from unittest import mock
+
+from django.contrib.auth.hashers import check_password
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from kombu.exceptions import OperationalError
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Department
+from assets.services import employee_services
+from assets.services.cache_services import EMPLOYEE_LIST_NAMESPACE, get_generation
+from assets.services.employee_services import hash_passwords
+from tests.utils import LOCMEM_CACHE
+
+PASSWORD = "Onboard-Passw0rd!2"
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    CELERY_TASK_ALWAYS_EAGER=True,
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+class EmployeeOnboardingTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin_user = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.normal_user = User.objects.create_user(
+            username="user", password="userpass", email="user@example.com"
+        )
+        self.department = Department.objects.create(
+            name="IT", full_name="information technology"
+        )
+        self.onboard_url = reverse("employee_onboard")
+
+    def row(self, username, **extra):
+        return {
+            "username": username,
+            "first_name": "ana",
+            "last_name": "cruz",
+            "email": f"{username}@example.com",
+            "password": PASSWORD,
+            "department": self.department.id,
+            "position": "developer",
+            "is_verified": True,
+            **extra,
+        }
+
+    def test_normal_user_cannot_onboard(self):
+        self.client.force_authenticate(user=self.normal_user)
+        response = self.client.post(self.onboard_url, [self.row("ana")], format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @mock.patch("assets.services.employee_services.send_onboarding_emails.delay")
+    def test_json_onboarding_reports_bad_rows_and_keeps_good_ones(self, delay):
+        self.client.force_authenticate(user=self.admin_user)
+        generation = get_generation(EMPLOYEE_LIST_NAMESPACE)
+        payload = [
+            self.row("ana"),
+            self.row("ben", is_verified=False),
+            self.row("user"),
+            self.row("ben"),
+            self.row("cara", department=9999),
+            self.row("dan", password="123"),
+            {"username": "eve"},
+        ]
+        # Existing usernames, departments twice (reloaded for the unknown
+        # id), savepoint pair and the two bulk inserts, whatever the number
+        # of rows
+        with (
+            self.captureOnCommitCallbacks(execute=True),
+            self.assertNumQueries(7),
+        ):
+            response = self.client.post(self.onboard_url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["created"]), 2)
+        self.assertEqual(
+            [error["row"] for error in response.data["errors"]], [3, 4, 5, 6, 7]
+        )
+        self.assertIn("username", response.data["errors"][0]["errors"])
+        self.assertIn("username", response.data["errors"][1]["errors"])
+        self.assertIn("department", response.data["errors"][2]["errors"])
+        self.assertIn("password", response.data["errors"][3]["errors"])
+
+        ana = User.objects.select_related("employee_profile").get(username="ana")
+        self.assertTrue(ana.check_password(PASSWORD))
+        self.assertEqual(ana.employee_profile.department, self.department)
+        self.assertEqual(ana.employee_profile.position, "Developer")
+        self.assertFalse(User.objects.get(username="ben").employee_profile.is_verified)
+        self.assertNotEqual(get_generation(EMPLOYEE_LIST_NAMESPACE), generation)
+
+        # One task for the whole batch
+        delay.assert_called_once()
+        (recipients,) = delay.call_args.args
+        self.assertEqual(
+            recipients[0],
+            {
+                "email": "ana@example.com",
+                "full_name": "Ana Cruz",
+                "department": "Information Technology",
+                "position": "Developer",
+                "password": PASSWORD,
+            },
+        )
+        self.assertEqual(len(recipients), 2)
+
+    def test_csv_onboarding_sends_the_emails(self):
+        self.client.force_authenticate(user=self.admin_user)
+        content = (
+            "username,first_name,last_name,email,password,department,"
+            "position,is_verified\n"
+            f"ana,Ana,Cruz,ana@example.com,{PASSWORD},{self.department.id},"
+            "Developer,true\n"
+            f"ben,Ben,Santos,ben@example.com,{PASSWORD},{self.department.id},"
+            "Designer,false\n"
+        )
+        upload = SimpleUploadedFile("employees.csv", content.encode(), "text/csv")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.onboard_url, {"file": upload}, format="multipart"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["created"]), 2)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            ["ana@example.com"] * 2 + ["ben@example.com"] * 2,
+        )
+
+    @mock.patch(
+        "assets.services.employee_services.send_onboarding_emails.delay",
+        side_effect=OperationalError("broker unreachable"),
+    )
+    def test_unreachable_broker_keeps_the_employees(self, delay):
+        self.client.force_authenticate(user=self.admin_user)
+        with (
+            self.assertLogs("assets", "ERROR") as logs,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(
+                self.onboard_url, [self.row("ana")], format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(User.objects.filter(username="ana").exists())
+        self.assertIn("ana@example.com", logs.output[0])
+        self.assertNotIn(PASSWORD, logs.output[0])
+
+    def test_empty_and_oversized_payloads_are_rejected(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(self.onboard_url, [], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        with mock.patch("assets.views.employee_views.ONBOARD_MAX_ROWS", 1):
+            response = self.client.post(
+                self.onboard_url, [self.row("ana"), self.row("ben")], format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(username="ana").exists())
+
+
+class HashPasswordsTest(SimpleTestCase):
+    @mock.patch.object(employee_services, "HASH_POOL_MIN_ROWS", 1)
+    @mock.patch.object(employee_services, "HASH_WORKERS", 2)
+    def test_process_pool_hashes_in_order(self):
+        self.addCleanup(self.shutdown_pool)
+        passwords = ["first-Passw0rd!", "second-Passw0rd!", "third-Passw0rd!"]
+
+        encoded = hash_passwords(passwords)
+
+        self.assertEqual(len(set(encoded)), 3)
+        for password, hashed in zip(passwords, encoded):
+            self.assertTrue(check_password(password, hashed))
+
+    def shutdown_pool(self):
+        employee_services._hash_pool.shutdown()
+        employee_services._hash_pool = None
+        employee_services._hash_pool_pid = None
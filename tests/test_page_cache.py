@@ -0,0 +1,230 @@
+import threading
+import time
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from assets.models import Asset, Category
+from assets.services import cache_services
+from assets.services.cache_services import (
+    bump_generation,
+    normalized_full_path,
+    page_cache_key,
+    stale_while_revalidate_page,
+)
+from tests.utils import LOCMEM_CACHE
+
+NAMESPACE = "test_pages"
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class StaleWhileRevalidatePageTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.builds = 0
+        self.build_delay = 0
+        self.build_status = 200
+        self.on_build = None
+
+        @stale_while_revalidate_page(60, NAMESPACE)
+        def view(request):
+            time.sleep(self.build_delay)
+            if self.on_build:
+                self.on_build()
+            self.builds += 1
+            return Response({"build": self.builds}, status=self.build_status)
+
+        self.view = view
+        self.request = APIRequestFactory().get("/api/things/?page=1")
+        self.request.user = AnonymousUser()
+        self.key = page_cache_key(self.request, [NAMESPACE])
+
+    def get(self):
+        return self.view(self.request)
+
+    def test_fresh_entry_is_served_without_running_the_view(self):
+        self.assertEqual(self.get().data, {"build": 1})
+        response = self.get()
+
+        self.assertEqual(response.data, {"build": 1})
+        self.assertEqual(self.builds, 1)
+        self.assertTrue(response.has_header("ETag"))
+
+    def test_stale_entry_is_served_while_another_request_rebuilds(self):
+        self.get()
+        etag = self.get()["ETag"]
+        bump_generation(NAMESPACE)
+        # Another worker holds the rebuild lock
+        cache.add(f"{self.key}:lock", True)
+
+        response = self.get()
+        self.assertEqual(response.data, {"build": 1})
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(self.builds, 1)
+
+        cache.delete(f"{self.key}:lock")
+        response = self.get()
+        self.assertEqual(response.data, {"build": 2})
+        self.assertNotEqual(self.get()["ETag"], etag)
+
+    def test_expired_entry_is_rebuilt_once(self):
+        self.get()
+        with mock.patch.object(
+            cache_services.time, "time", return_value=time.time() + 61
+        ):
+            self.assertEqual(self.get().data, {"build": 2})
+        self.assertEqual(self.get().data, {"build": 2})
+
+    def test_concurrent_misses_run_the_view_once(self):
+        self.build_delay = 0.3
+        results = []
+
+        def worker():
+            results.append(self.get().data)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(results, [{"build": 1}] * 8)
+
+    def test_concurrent_requests_get_the_stale_copy_during_a_rebuild(self):
+        self.get()
+        bump_generation(NAMESPACE)
+        self.build_delay = 0.3
+        results = []
+
+        def worker():
+            results.append(self.get().data)
+
+        rebuilding = threading.Thread(target=worker)
+        rebuilding.start()
+        time.sleep(0.1)
+        started = time.monotonic()
+        stale = [self.get().data for _ in range(5)]
+        self.assertLess(time.monotonic() - started, 0.2)
+        rebuilding.join()
+
+        self.assertEqual(stale, [{"build": 1}] * 5)
+        self.assertEqual(results, [{"build": 2}])
+        self.assertEqual(self.get().data, {"build": 2})
+
+    @mock.patch.object(cache_services, "PAGE_WAIT_TIMEOUT", 0.2)
+    def test_waiting_request_takes_over_an_abandoned_rebuild(self):
+        cache.add(f"{self.key}:lock", True)
+        threading.Timer(0.1, cache.delete, [f"{self.key}:lock"]).start()
+
+        self.assertEqual(self.get().data, {"build": 1})
+        self.assertIsNotNone(cache.get(self.key))
+
+    def test_rebuild_outliving_its_lock_leaves_the_new_one(self):
+        def lock_expires_and_is_taken():
+            cache.delete(f"{self.key}:lock")
+            cache.add(f"{self.key}:lock", "other")
+
+        self.on_build = lock_expires_and_is_taken
+        self.assertEqual(self.get().data, {"build": 1})
+        self.assertEqual(cache.get(f"{self.key}:lock"), "other")
+
+    def test_errors_are_not_cached(self):
+        self.build_status = 400
+        self.get()
+        self.get()
+
+        self.assertEqual(self.builds, 2)
+        self.assertIsNone(cache.get(self.key))
+        self.assertIsNone(cache.get(f"{self.key}:lock"))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class SharedPageCacheTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.alice = User.objects.create_user(
+            username="alice", password="alicepass", email="alice@example.com"
+        )
+        self.bob = User.objects.create_user(
+            username="bob", password="bobpass", email="bob@example.com"
+        )
+        self.category = Category.objects.create(name="Laptop")
+        Asset.objects.create(
+            name="Dell Laptop",
+            serial_number="SN0001",
+            category=self.category,
+            purchase_date=date.today(),
+            status="IN_USE",
+        )
+        self.url = reverse("asset_list_create")
+
+    def key(self, query, user):
+        request = APIRequestFactory().get(f"{self.url}{query}")
+        request.user = user
+        return page_cache_key(request, ["ns"])
+
+    def test_normalized_full_path(self):
+        factory = APIRequestFactory()
+        for query in (
+            "?status=IN_USE&category=1",
+            "?category=1&status=IN_USE",
+            "?category=1&search=&status=IN_USE",
+        ):
+            self.assertEqual(
+                normalized_full_path(factory.get(f"{self.url}{query}")),
+                f"{self.url}?category=1&status=IN_USE",
+            )
+        self.assertEqual(
+            normalized_full_path(factory.get(f"{self.url}?page=")), self.url
+        )
+        # The last value of a repeated key wins, their order is kept
+        self.assertEqual(
+            normalized_full_path(
+                factory.get(f"{self.url}?ordering=name&category=1&ordering=-id")
+            ),
+            f"{self.url}?category=1&ordering=name&ordering=-id",
+        )
+        self.assertNotEqual(
+            normalized_full_path(factory.get(f"{self.url}?ordering=name&ordering=-id")),
+            normalized_full_path(factory.get(f"{self.url}?ordering=-id&ordering=name")),
+        )
+
+    def test_key_depends_on_permission_scope_not_user(self):
+        query = "?status=IN_USE&category=1"
+        self.assertEqual(
+            self.key(query, self.alice), self.key("?category=1&status=IN_USE", self.bob)
+        )
+        self.assertNotEqual(self.key(query, self.alice), self.key(query, self.admin))
+        self.assertNotEqual(
+            self.key(query, self.alice), self.key("?status=REPAIR", self.alice)
+        )
+
+    def test_users_share_list_entries_across_cookies(self):
+        self.client.cookies["sessionid"] = "alice-session"
+        self.client.cookies["access_token"] = "alice-token"
+        self.client.force_authenticate(user=self.alice)
+        response = self.client.get(
+            self.url, {"status": "IN_USE", "category": self.category.id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.cookies["sessionid"] = "bob-session"
+        self.client.cookies["access_token"] = "bob-token"
+        self.client.force_authenticate(user=self.bob)
+        with self.assertNumQueries(0):
+            shared = self.client.get(
+                self.url, {"category": self.category.id, "status": "IN_USE"}
+            )
+        self.assertEqual(shared.data, response.data)
+        self.assertEqual(shared["ETag"], response["ETag"])
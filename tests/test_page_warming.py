@@ -0,0 +1,138 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from kombu.exceptions import OperationalError
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Category, Department, EmployeeProfile
+from assets.services import cache_services
+from assets.services.cache_services import (
+    EMPLOYEE_LIST_NAMESPACE,
+    bump_generation,
+    get_hot_pages,
+)
+from assets.services.warming_services import (
+    WARMING_PENDING_KEY,
+    get_pages_to_warm,
+    warm_pages,
+)
+from assets.tasks import warm_page_cache_at_boot
+from tests.utils import LOCMEM_CACHE
+
+CACHE_WARMING = {
+    "ENABLED": True,
+    "BASE_URL": "http://testserver",
+    "PAGES": [
+        ("/api/employees/drop-downs/", ["admin"]),
+        ("/api/category/drop-downs/", ["admin"]),
+    ],
+    "TOP_PAGES": 5,
+    "MIN_HITS": 2,
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE, CACHE_WARMING=CACHE_WARMING)
+class PageWarmingTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        cache_services._local_page_hits.clear()
+        self.admin = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.category = Category.objects.create(name="Laptop")
+        self.department = Department.objects.create(
+            name="IT", full_name="Information Technology"
+        )
+        self.add_employee("ana")
+        self.client.force_authenticate(user=self.admin)
+
+    def add_employee(self, username):
+        user = User.objects.create_user(
+            username=username, first_name=username.title(), last_name="Cruz"
+        )
+        EmployeeProfile.objects.create(
+            user=user, department=self.department, is_verified=True
+        )
+
+    def test_hot_pages_are_ranked_by_hits(self):
+        url = reverse("employee_dropdown")
+        for _ in range(3):
+            self.client.get(url)
+        for _ in range(2):
+            self.client.get(url, {"b": 2, "a": 1})
+        self.client.get(url, {"a": 2})
+
+        self.assertEqual(
+            get_hot_pages(5, min_hits=2),
+            [
+                ("admin", "http://testserver/api/employees/drop-downs/", 3),
+                ("admin", "http://testserver/api/employees/drop-downs/?a=1&b=2", 2),
+            ],
+        )
+        self.assertEqual(
+            get_pages_to_warm(),
+            [
+                ("admin", "http://testserver/api/employees/drop-downs/"),
+                ("admin", "http://testserver/api/category/drop-downs/"),
+                ("admin", "http://testserver/api/employees/drop-downs/?a=1&b=2"),
+            ],
+        )
+
+    def test_warm_pages_rebuilds_invalidated_pages(self):
+        url = reverse("employee_dropdown")
+        self.client.get(url)
+        bump_generation(EMPLOYEE_LIST_NAMESPACE)
+        self.add_employee("ben")
+
+        self.assertEqual(warm_pages(), 2)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+        # The warmer's own requests are not hits
+        self.assertEqual(get_hot_pages(5), [("admin", f"http://testserver{url}", 2)])
+
+    @mock.patch("assets.tasks.warm_page_cache.delay")
+    def test_committed_invalidations_queue_one_warm_up(self, delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.name = "Notebook"
+            self.category.save()
+            Department.objects.create(name="HR", full_name="Human Resources")
+        delay.assert_called_once_with()
+
+        # Still queued, nothing more to send
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.create(name="Monitor")
+        delay.assert_called_once_with()
+
+        with self.settings(CACHE_WARMING={**CACHE_WARMING, "ENABLED": False}):
+            cache.clear()
+            with self.captureOnCommitCallbacks(execute=True):
+                Category.objects.create(name="Keyboard")
+        delay.assert_called_once_with()
+
+    @mock.patch("assets.tasks.warm_page_cache.delay")
+    def test_worker_boot_queues_a_warm_up(self, delay):
+        with self.settings(CACHE_WARMING={**CACHE_WARMING, "ENABLED": False}):
+            warm_page_cache_at_boot(sender=None)
+        delay.assert_not_called()
+
+        warm_page_cache_at_boot(sender=None)
+        delay.assert_called_once_with()
+
+    @mock.patch(
+        "assets.tasks.warm_page_cache.delay",
+        side_effect=OperationalError("broker down"),
+    )
+    def test_unreachable_broker_does_not_fail_writes(self, delay):
+        with self.assertLogs("assets", "WARNING"):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.category.name = "Notebook"
+                self.category.save()
+        delay.assert_called_once_with()
+        self.assertIsNone(cache.get(WARMING_PENDING_KEY))
@@ -0,0 +1,74 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, AssetHistory, Category
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CursorPaginationTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="user", password="userpass", email="user@example.com"
+        )
+        self.laptop = Category.objects.create(name="Laptop")
+        self.monitor = Category.objects.create(name="Monitor")
+
+        self.assets = [
+            Asset.objects.create(
+                name=f"Asset {index}",
+                serial_number=f"SN{index:04}",
+                category=self.laptop if index % 2 else self.monitor,
+                purchase_date=date.today(),
+                status="IN_USE",
+            )
+            for index in range(12)
+        ]
+        for asset in self.assets:
+            AssetHistory.objects.create(asset=asset, new_user=self.user)
+
+        self.asset_list_url = reverse("asset_list_create")
+        self.asset_history_url = reverse("asset_history_list")
+        self.client.force_authenticate(user=self.user)
+
+    def test_page_number_mode_is_the_default(self):
+        response = self.client.get(self.asset_list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 12)
+
+    def test_cursor_mode_walks_history_by_descending_id(self):
+        response = self.client.get(self.asset_history_url, {"pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+        self.assertEqual(len(response.data["results"]), 10)
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(
+            [row["asset"]["id"] for row in response.data["results"]],
+            [self.assets[1].id, self.assets[0].id],
+        )
+
+    def test_cursor_mode_keeps_filters(self):
+        response = self.client.get(
+            self.asset_list_url, {"pagination": "cursor", "category": "laptop"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]],
+            [
+                asset.id
+                for asset in reversed(self.assets)
+                if asset.category_id == self.laptop.id
+            ][:5],
+        )
+        self.assertIn("category=laptop", response.data["next"])
@@ -0,0 +1,112 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, AssetHistory, Category, Department, EmployeeProfile
+from assets.serializers.asset_serializer import (
+    AssetHistorySerializer,
+    AssetListSerializer,
+)
+from assets.serializers.employee_serializer import EmployeeListSerializer
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ValuesProjectionTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        it = Department.objects.create(name="IT", full_name="IT Dept")
+        self.employee = User.objects.create_user(
+            username="employee", password="employeepass", first_name="Ana"
+        )
+        EmployeeProfile.objects.create(
+            user=self.employee, department=it, position="Dev", is_verified=True
+        )
+        no_department = User.objects.create_user(username="nodept", password="x")
+        EmployeeProfile.objects.create(user=no_department, position=None)
+
+        laptop = Category.objects.create(name="Laptop")
+        assigned = Asset.objects.create(
+            name="Dell Laptop",
+            serial_number="SN0001",
+            category=laptop,
+            assigned_to=self.employee,
+            purchase_date=date(2024, 1, 15),
+            status="IN_USE",
+            description="Ünïcode & <html>",
+        )
+        Asset.objects.create(
+            name="Spare cable", serial_number="SN0002", purchase_date=date.today()
+        )
+        AssetHistory.objects.create(asset=assigned, new_user=self.employee, notes="")
+        AssetHistory.objects.create(
+            asset=assigned,
+            previous_user=self.employee,
+            new_user=no_department,
+            notes="Swap",
+        )
+
+        self.client.force_authenticate(user=self.admin)
+
+    def assert_same_output(self, serializer_class, queryset):
+        expected = JSONRenderer().render(serializer_class(queryset, many=True).data)
+        projected = JSONRenderer().render(
+            [
+                serializer_class.project_row(row)
+                for row in serializer_class.project_queryset(queryset)
+            ]
+        )
+        self.assertEqual(projected, expected)
+
+    def test_asset_list_projection(self):
+        self.assert_same_output(
+            AssetListSerializer, Asset.objects.select_related("category")
+        )
+
+    def test_employee_list_projection(self):
+        # The admin has no profile at all
+        self.assert_same_output(
+            EmployeeListSerializer,
+            User.objects.select_related(
+                "employee_profile", "employee_profile__department"
+            ).order_by("-id"),
+        )
+
+    def test_history_projection(self):
+        self.assert_same_output(
+            AssetHistorySerializer,
+            AssetHistory.objects.prefetch_related("previous_user", "new_user").order_by(
+                "id"
+            ),
+        )
+
+    def test_list_endpoints_render_serializer_output(self):
+        endpoints = [
+            (reverse("asset_list_create"), AssetListSerializer, Asset.objects),
+            (reverse("employee_list_create"), EmployeeListSerializer, User.objects),
+            (
+                reverse("asset_history_list"),
+                AssetHistorySerializer,
+                AssetHistory.objects,
+            ),
+        ]
+        for url, serializer_class, manager in endpoints:
+            for params in ({}, {"pagination": "cursor"}):
+                with self.subTest(url=url, **params):
+                    response = self.client.get(url, params)
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                    self.assertEqual(
+                        JSONRenderer().render(response.data["results"]),
+                        JSONRenderer().render(
+                            serializer_class(manager.order_by("-id"), many=True).data
+                        ),
+                    )
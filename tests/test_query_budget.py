@@ -0,0 +1,152 @@
+import inspect
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.views import View
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from assets import views
+from assets.management.commands.benchmark_endpoints import (
+    ENDPOINTS,
+    build_context,
+    call_endpoint,
+    endpoint_url,
+)
+from assets.query_budget import QueryRecorder, get_path_query_budget, get_query_budget
+from assets.services.seed_services import SEED_PASSWORD, seed_dataset
+from assets.views.jwt_views import CookieTokenRefreshView
+from tests.utils import LOCMEM_CACHE
+
+
+def iter_url_callbacks(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_url_callbacks(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            yield pattern.callback
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    CELERY_TASK_ALWAYS_EAGER=True,
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+class QueryBudgetTest(TestCase):
+    """
+    Every view in assets/views/ declares a query budget. Each route is
+    called on a small dataset and again after growing it tenfold: the query
+    count must fit the budget and must not grow with the data.
+    """
+
+    def assert_within_budget(self, label, budget, recorder):
+        self.assertIsNotNone(budget, f"{label} declares no query budget")
+        self.assertLessEqual(
+            recorder.count,
+            budget,
+            f"{label} ran {recorder.count} queries, budget is {budget}:\n"
+            f"{recorder.format_queries()}",
+        )
+
+    def measure_endpoints(self):
+        ctx = build_context()
+        client = APIClient()
+        recorders = {}
+        for endpoint in ENDPOINTS:
+            cache.clear()
+            url = endpoint_url(endpoint, ctx)
+            response, _, recorder = call_endpoint(client, endpoint, ctx, url)
+            label = f"{endpoint.method.upper()} {endpoint.route}"
+            self.assertLess(response.status_code, 400, label)
+            self.assert_within_budget(
+                label, get_path_query_budget(url, endpoint.method), recorder
+            )
+            recorders[label] = recorder
+        return recorders
+
+    def test_every_view_declares_a_budget(self):
+        view_classes = [
+            cls
+            for module in (
+                views.assets_views,
+                views.assets_history_views,
+                views.employee_views,
+                views.otp_views,
+                views.jwt_views,
+                views.oidc_views,
+            )
+            for _, cls in inspect.getmembers(module, inspect.isclass)
+            if issubclass(cls, View) and cls.__module__ == module.__name__
+        ]
+        routed_functions = [
+            callback
+            for callback in iter_url_callbacks(get_resolver().url_patterns)
+            if callback.__module__.startswith("assets.views")
+            and not hasattr(callback, "view_class")
+        ]
+        self.assertTrue(routed_functions)
+
+        for view in view_classes + routed_functions:
+            with self.subTest(view=view.__qualname__):
+                budget = getattr(view, "query_budget", None)
+                self.assertIsNotNone(budget, f"{view.__qualname__} has no budget")
+
+    def test_budgets_hold_as_the_dataset_grows(self):
+        seed_dataset(30)
+        small = self.measure_endpoints()
+
+        seed_dataset(300, seed=1, prefix="grow")
+        large = self.measure_endpoints()
+
+        for label, recorder in large.items():
+            with self.subTest(endpoint=label):
+                self.assertEqual(
+                    recorder.count,
+                    small[label].count,
+                    f"{label} went from {small[label].count} to {recorder.count} "
+                    f"queries as the dataset grew:\n{recorder.format_queries()}",
+                )
+
+    def test_auth_views_within_budget(self):
+        seed_dataset(30)
+        ctx = build_context()
+        employee = ctx["employee"]
+
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            response = self.client.post(
+                reverse("token_obtain_pair"),
+                {"username": employee.username, "password": SEED_PASSWORD},
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assert_within_budget(
+            "POST token_obtain_pair",
+            get_path_query_budget(reverse("token_obtain_pair"), "POST"),
+            recorder,
+        )
+
+        self.client.force_login(employee)
+        for name in ("profile", "logout"):
+            recorder = QueryRecorder()
+            with connection.execute_wrapper(recorder):
+                response = self.client.get(reverse(name))
+            self.assertLess(response.status_code, 400, name)
+            self.assert_within_budget(
+                f"GET {name}", get_path_query_budget(reverse(name), "GET"), recorder
+            )
+
+        # Not routed, the project uses assets.auth.custom_token_refresh
+        request = APIRequestFactory().post(
+            "/", {"refresh": str(RefreshToken.for_user(employee))}, format="json"
+        )
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            response = CookieTokenRefreshView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        self.assert_within_budget(
+            "POST CookieTokenRefreshView",
+            get_query_budget(CookieTokenRefreshView, "POST"),
+            recorder,
+        )
@@ -0,0 +1,90 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, AssetHistory, Category
+
+
+class AssetBulkReassignTest(APITestCase):
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.leaver = User.objects.create_user(username="leaver", password="pass")
+        self.successor = User.objects.create_user(username="successor", password="pass")
+        category = Category.objects.create(name="Laptop")
+        self.assets = [
+            Asset.objects.create(
+                name=f"Asset {index}",
+                serial_number=f"SN{index:04}",
+                category=category,
+                assigned_to=self.leaver if index < 3 else self.successor,
+                purchase_date=date.today(),
+            )
+            for index in range(4)
+        ]
+        self.reassign_url = reverse("asset_bulk_reassign")
+
+    def test_normal_user_cannot_reassign(self):
+        self.client.force_authenticate(user=self.leaver)
+        response = self.client.post(
+            self.reassign_url,
+            {"asset_ids": [self.assets[0].id], "assigned_to": self.leaver.id},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_reassign_moves_assets_and_writes_history(self):
+        self.client.force_authenticate(user=self.admin_user)
+        asset_ids = [asset.id for asset in self.assets]
+        # user lookup, savepoint, lock, stats before, update, stats after,
+        # history insert, custody update and insert, release (no department,
+        # so no bucket moves)
+        with self.assertNumQueries(10):
+            response = self.client.post(
+                self.reassign_url,
+                {
+                    "asset_ids": asset_ids,
+                    "assigned_to": self.successor.id,
+                    "notes": "Offboarding",
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["reassigned"], asset_ids[:3])
+        self.assertEqual(response.data["unchanged"], 1)
+        self.assertEqual(self.successor.assets.count(), 4)
+
+        history = AssetHistory.objects.filter(notes="Offboarding")
+        self.assertEqual(history.count(), 3)
+        self.assertTrue(all(row.previous_user == self.leaver for row in history))
+
+    def test_unassign(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(
+            self.reassign_url,
+            {"asset_ids": [self.assets[0].id], "assigned_to": None},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assets[0].refresh_from_db()
+        self.assertIsNone(self.assets[0].assigned_to)
+
+    def test_unknown_asset_rolls_back(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(
+            self.reassign_url,
+            {
+                "asset_ids": [self.assets[0].id, 999999],
+                "assigned_to": self.successor.id,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assets[0].refresh_from_db()
+        self.assertEqual(self.assets[0].assigned_to, self.leaver)
+        self.assertFalse(AssetHistory.objects.exists())
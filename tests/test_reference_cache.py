@@ -0,0 +1,144 @@
+import time
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django_redis import get_redis_connection
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, Category, Department
+from assets.services import reference_services
+from assets.services.cache_services import REFERENCE_DATA_NAMESPACE, bump_generation
+from assets.services.reference_services import (
+    REFERENCE_CHANNEL,
+    LocalLRUCache,
+    get_reference,
+    get_reference_rows,
+    local_cache,
+    local_tier_enabled,
+)
+from tests.utils import LOCMEM_CACHE
+
+
+class LocalLRUCacheTest(SimpleTestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        lru = LocalLRUCache(maxsize=2, ttl=60)
+        lru.set("a", 1, lru.epoch)
+        lru.set("b", 2, lru.epoch)
+        lru.get("a")
+        lru.set("c", 3, lru.epoch)
+
+        self.assertEqual((lru.get("a"), lru.get("b"), lru.get("c")), (1, None, 3))
+
+    def test_entries_expire(self):
+        lru = LocalLRUCache(maxsize=2, ttl=60)
+        lru.set("a", 1, lru.epoch)
+        with mock.patch.object(
+            reference_services.time, "monotonic", return_value=time.monotonic() + 61
+        ):
+            self.assertIsNone(lru.get("a"))
+
+    def test_value_read_before_a_clear_is_not_stored(self):
+        lru = LocalLRUCache(maxsize=2, ttl=60)
+        epoch = lru.epoch
+        lru.clear()
+        lru.set("a", 1, epoch)
+        self.assertIsNone(lru.get("a"))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ReferenceCacheTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.laptop = Category.objects.create(name="Laptop")
+        Department.objects.create(name="IT", full_name="Information Technology")
+        self.client.force_authenticate(user=self.admin)
+
+    def test_dropdowns_read_the_cached_tables(self):
+        self.client.get(reverse("category_dropdown"))
+        self.client.get(reverse("department_dropdown"))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("category_dropdown"))
+            self.client.get(reverse("department_dropdown"))
+        self.assertEqual(response.data, [{"id": self.laptop.id, "name": "Laptop"}])
+
+        # Committed writes move the reference generation
+        with self.captureOnCommitCallbacks(execute=True):
+            self.laptop.name = "Notebook"
+            self.laptop.save()
+        response = self.client.get(reverse("category_dropdown"))
+        self.assertEqual(response.data, [{"id": self.laptop.id, "name": "Notebook"}])
+
+    def test_rows_created_since_the_copy_are_found(self):
+        get_reference_rows("category")
+        monitor = Category.objects.create(name="Monitor")
+
+        response = self.client.post(
+            reverse("asset_list_create"),
+            {
+                "name": "LG Monitor",
+                "serial_number": "SN0001",
+                "category": monitor.id,
+                "purchase_date": date.today().isoformat(),
+                "status": "IN_STORAGE",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Asset.objects.get(serial_number="SN0001").category, monitor)
+
+        response = self.client.post(
+            reverse("asset_list_create"),
+            {
+                "name": "Ghost",
+                "serial_number": "SN0002",
+                "category": 999999,
+                "purchase_date": date.today().isoformat(),
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("category", response.data)
+
+    def test_rows_are_copies(self):
+        row = get_reference("category", self.laptop.id)
+        row.name = "Changed"
+        self.assertEqual(get_reference("category", self.laptop.id).name, "Laptop")
+
+
+# The default cache is Redis: local tier and broadcasts are in play
+class ReferenceLocalTierTest(TestCase):
+    def setUp(self):
+        local_tier_enabled()
+        self.assertTrue(reference_services._listening.wait(5))
+        self.assertTrue(local_tier_enabled())
+        # Redis outlives the test database
+        bump_generation(REFERENCE_DATA_NAMESPACE)
+        local_cache.clear()
+        self.addCleanup(local_cache.clear)
+        Category.objects.create(name="Laptop")
+
+    def test_local_hits_skip_redis_and_the_database(self):
+        get_reference_rows("category")
+        with (
+            self.assertNumQueries(0),
+            mock.patch.object(reference_services, "cache") as redis_tier,
+        ):
+            rows = get_reference_rows("category")
+        redis_tier.get.assert_not_called()
+        self.assertEqual([row.name for row in rows], ["Laptop"])
+
+    def test_broadcast_clears_the_local_tier(self):
+        get_reference_rows("category")
+        self.assertIsNotNone(local_cache.get("category"))
+
+        get_redis_connection("default").publish(REFERENCE_CHANNEL, "test")
+        deadline = time.monotonic() + 2
+        while local_cache.get("category") is not None:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
@@ -0,0 +1,98 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Asset, Category
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class AssetFullTextSearchTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="user", password="userpass", email="user@example.com"
+        )
+        self.category = Category.objects.create(name="Laptop")
+        self.dell = self.create_asset("Dell Latitude", "SN9929", "Spare unit")
+        self.mac = self.create_asset("Macbook Pro", "MB1234", "Dell dock included")
+        self.create_asset("LG Monitor", "LG5555", "27 inch")
+
+        self.asset_list_url = reverse("asset_list_create")
+        self.client.force_authenticate(user=self.user)
+
+    def create_asset(self, name, serial_number, description):
+        return Asset.objects.create(
+            name=name,
+            serial_number=serial_number,
+            category=self.category,
+            purchase_date=date.today(),
+            status="IN_USE",
+            description=description,
+        )
+
+    def search(self, term):
+        response = self.client.get(self.asset_list_url, {"search": term})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["id"] for row in response.data["results"]]
+
+    def test_name_match_ranks_above_description_match(self):
+        self.assertEqual(self.search("dell"), [self.dell.id, self.mac.id])
+
+    def test_partial_serial_number_matches(self):
+        self.assertEqual(self.search("sn99"), [self.dell.id])
+
+    def test_search_vector_follows_updates(self):
+        Asset.objects.filter(id=self.mac.id).update(name="ThinkPad X1")
+        self.assertEqual(self.search("thinkpad"), [self.mac.id])
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class FuzzyLookupTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin_user = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.alexander = User.objects.create_user(
+            username="alex", first_name="Alexander", last_name="Macdonald"
+        )
+        self.alexis = User.objects.create_user(
+            username="lexi", first_name="Alexis", last_name="Stone"
+        )
+        category = Category.objects.create(name="Laptop")
+        for serial_number in ["SN-2024-0001", "SN-2024-0002", "LG-1999-0001"]:
+            Asset.objects.create(
+                name="Dell Latitude",
+                serial_number=serial_number,
+                category=category,
+                purchase_date=date.today(),
+            )
+
+        self.asset_list_url = reverse("asset_list_create")
+        self.employee_list_url = reverse("employee_list_create")
+        self.client.force_authenticate(user=self.admin_user)
+
+    def test_partial_serial_number(self):
+        response = self.client.get(self.asset_list_url, {"serial_number": "2024"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {row["serial_number"] for row in response.data["results"]},
+            {"SN-2024-0001", "SN-2024-0002"},
+        )
+
+    def test_misspelled_name_ranks_closest_first(self):
+        response = self.client.get(self.employee_list_url, {"name": "alexandr"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["id"], self.alexander.id)
+
+    def test_every_word_must_match(self):
+        response = self.client.get(self.employee_list_url, {"name": "alex stone"})
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]], [self.alexis.id]
+        )
@@ -0,0 +1,71 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from assets.models import Department, EmployeeProfile
+from assets.views.employee_views import typeahead_employees
+from tests.utils import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class EmployeeTypeaheadTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="admin", password="adminpass", email="admin@example.com"
+        )
+        self.department = Department.objects.create(
+            name="IT", full_name="Information Technology"
+        )
+        self.ana = self.add_employee("Ana", "Cruz")
+        self.andres = self.add_employee("Andres", "Bautista")
+        self.add_employee("Anabel", "Reyes", is_verified=False)
+        self.add_employee("Ben", "Santos")
+        self.url = reverse("employee_dropdown")
+        self.client.force_authenticate(user=self.admin)
+
+    def add_employee(self, first_name, last_name, is_verified=True):
+        user = User.objects.create_user(
+            username=f"{first_name}.{last_name}".lower(),
+            first_name=first_name,
+            last_name=last_name,
+        )
+        EmployeeProfile.objects.create(
+            user=user, department=self.department, is_verified=is_verified
+        )
+        return user
+
+    def names(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [employee["full_name"] for employee in response.data]
+
+    def test_prefix_of_the_full_name_matches(self):
+        self.assertEqual(self.names(q="an"), ["Ana Cruz", "Andres Bautista"])
+        self.assertEqual(self.names(q="  ANA C"), ["Ana Cruz"])
+        self.assertEqual(self.names(q="cruz"), [])
+        self.assertEqual(self.names(q="%"), [])
+
+    def test_results_are_limited(self):
+        self.assertEqual(self.names(), ["Ana Cruz", "Andres Bautista", "Ben Santos"])
+        self.assertEqual(self.names(q="a", limit=1), ["Ana Cruz"])
+
+        response = self.client.get(self.url, {"limit": 500})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("limit", response.data)
+
+    def test_typeahead_walks_the_functional_index(self):
+        for prefix in ("", "ana"):
+            with connection.cursor() as cursor:
+                # A handful of rows, and statistics left by other tests, still
+                # favour a scan and a sort: show the path the index offers
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute("SET LOCAL enable_sort = off")
+                plan = typeahead_employees(prefix).explain()
+            self.assertIn("auth_user_full_name_prefix", plan)
+            # The index gives the order, LIMIT stops the scan early
+            self.assertNotIn("Sort", plan)
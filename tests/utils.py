@@ -0,0 +1,2 @@
+# Process-local cache for the tests that clear it, instead of the shared Redis
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}